@@ -19,6 +19,7 @@ import time
 import datetime
 import fcntl
 import re
+import stat
 from pathlib import Path
 
 try:
@@ -139,6 +140,9 @@ def read_stable_pipeline_file(path, run_manifest=None):
 
 
 class LLDPqAlerts:
+    # Compiled id="..." summary-card patterns, keyed by element-ID tuple.
+    _ELEMENT_VALUE_RES = {}
+
     def __init__(self, script_dir):
         self.script_dir = Path(script_dir)
         self.config_file = self.script_dir / "notifications.yaml"
@@ -152,6 +156,12 @@ class LLDPqAlerts:
         # checks do not re-read and re-parse the whole file for every host.
         self._log_summary_loaded = False
         self._log_summary_data = None
+        # Parsed history/summary JSON keyed by path; see _load_history.
+        self._history_cache = {}
+        # ber_history.json grades indexed by device once per run, so each
+        # device lookup is a dict hit instead of a history re-parse.
+        self._ber_grades_loaded = False
+        self._ber_grades = None
         
         # Create state directory if it doesn't exist (like `mkdir -p`)
         self.state_dir.mkdir(parents=True, exist_ok=True)
@@ -982,7 +992,7 @@ class LLDPqAlerts:
             return None
 
         try:
-            payload = json.loads(history_file.read_text(encoding="utf-8"))
+            payload = self._load_history(history_file)
             if not isinstance(payload, dict):
                 raise ValueError("link-flap history root must be an object")
             histories = payload.get("flapping_hist")
@@ -1869,8 +1879,7 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
             if not hardware_history_file.exists():
                 return "unknown"
                 
-            with open(hardware_history_file, 'r') as f:
-                hardware_data = json.load(f)
+            hardware_data = self._load_history(hardware_history_file)
             
             # Get latest hardware entry for this device
             device_history = hardware_data.get("hardware_history", {}).get(device, [])
@@ -1885,6 +1894,22 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
             self.had_error = True
             return "unknown"
 
+    def _load_history(self, path):
+        """Return parsed JSON for a history/summary file, cached for the run.
+
+        Per-device getters read the same few files once per device.  The
+        cache is keyed on the file identity, so a file replaced mid-run is
+        parsed again; read and decode errors propagate to the caller.
+        """
+        info = path.stat()
+        identity = (info.st_ino, info.st_size, info.st_mtime_ns)
+        cached = self._history_cache.get(path)
+        if cached is not None and cached[0] == identity:
+            return cached[1]
+        data = json.loads(path.read_bytes())
+        self._history_cache[path] = (identity, data)
+        return data
+
     def _load_log_summary(self):
         """Read and validate log_summary.json once per run; cache the result.
 
@@ -1901,8 +1926,7 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
         if not summary_file.exists():
             return None
         try:
-            with open(summary_file, 'r') as f:
-                summary_data = json.load(f)
+            summary_data = self._load_history(summary_file)
         except (OSError, ValueError, json.JSONDecodeError) as exc:
             print(f"    ❌ Error reading log summary: {exc}")
             self.had_error = True
@@ -1952,8 +1976,7 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
             if not bgp_history_file.exists():
                 return "unknown"
                 
-            with open(bgp_history_file, 'r') as f:
-                bgp_data = json.load(f)
+            bgp_data = self._load_history(bgp_history_file)
             if not isinstance(bgp_data, dict):
                 raise ValueError("BGP history root must be an object")
             
@@ -2008,41 +2031,61 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
         except:
             return "failed"
 
-    def get_device_ber_status(self, device):
-        """Get BER status for a device"""
+    def _load_ber_grades(self):
+        """Index ber_history.json grades by device once per run; cache it.
+
+        Returns ``{device: [grade, ...]}``, or None when the history is
+        missing or unreadable.  A corrupt file is reported once (had_error)
+        instead of being re-parsed and re-reported for every device.
+        """
+        if self._ber_grades_loaded:
+            return self._ber_grades
+        self._ber_grades_loaded = True
+        self._ber_grades = None
+
+        history_file = self.monitor_results / "ber_history.json"
+        if not history_file.exists():
+            return None
         try:
-            history_file = self.monitor_results / "ber_history.json"
-            if not history_file.exists():
-                return "unknown"
-            payload = json.loads(history_file.read_text(encoding="utf-8"))
+            payload = self._load_history(history_file)
+            if not isinstance(payload, dict):
+                raise ValueError("BER history root must be an object")
             current = payload.get("current_ber_stats", {})
             if not isinstance(current, dict):
                 raise ValueError("current_ber_stats must be an object")
-            grades = []
-            for port_name, port_stats in current.items():
-                if (not isinstance(port_name, str) or
-                        port_name.split(":", 1)[0] != device or
-                        not isinstance(port_stats, dict)):
-                    continue
-                grade = str(
-                    port_stats.get("status")
-                    or port_stats.get("effective_grade")
-                    or port_stats.get("grade")
-                    or "unknown"
-                ).lower()
-                grades.append(grade)
-            if not grades:
-                return "not_applicable"
-            priority = {
-                "critical": 4, "warning": 3, "warnings": 3,
-                "unknown": 2, "good": 1, "excellent": 0,
-            }
-            result = max(grades, key=lambda value: priority.get(value, 2))
-            return "warnings" if result == "warning" else result
         except (OSError, ValueError, TypeError, json.JSONDecodeError) as exc:
-            print(f"    ❌ Error reading BER status for {device}: {exc}")
+            print(f"    ❌ Error reading BER status: {exc}")
             self.had_error = True
+            return None
+
+        grades = {}
+        for port_name, port_stats in current.items():
+            if not isinstance(port_name, str) or not isinstance(port_stats, dict):
+                continue
+            grade = str(
+                port_stats.get("status")
+                or port_stats.get("effective_grade")
+                or port_stats.get("grade")
+                or "unknown"
+            ).lower()
+            grades.setdefault(port_name.split(":", 1)[0], []).append(grade)
+        self._ber_grades = grades
+        return grades
+
+    def get_device_ber_status(self, device):
+        """Get BER status for a device"""
+        grades_by_device = self._load_ber_grades()
+        if grades_by_device is None:
             return "unknown"
+        grades = grades_by_device.get(device)
+        if not grades:
+            return "not_applicable"
+        priority = {
+            "critical": 4, "warning": 3, "warnings": 3,
+            "unknown": 2, "good": 1, "excellent": 0,
+        }
+        result = max(grades, key=lambda value: priority.get(value, 2))
+        return "warnings" if result == "warning" else result
 
     def get_device_flap_status(self, device):
         """Get link flap status for a device from processed summary"""
@@ -2069,8 +2112,7 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
             if not optical_history_file.exists():
                 return "unknown"
                 
-            with open(optical_history_file, 'r') as f:
-                optical_data = json.load(f)
+            optical_data = self._load_history(optical_history_file)
 
             current_stats = optical_data.get("current_optical_stats", {})
             if not isinstance(current_stats, dict):
@@ -2251,10 +2293,14 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
             required_metrics = []
             
             if "hardware" in html_filename:
-                excellent = self.extract_element_value(content, 'excellent-devices')
-                good = self.extract_element_value(content, 'good-devices')
-                warnings = self.extract_element_value(content, 'warning-devices')
-                critical = self.extract_element_value(content, 'critical-devices')
+                values = self.extract_element_values(content, (
+                    'excellent-devices', 'good-devices',
+                    'warning-devices', 'critical-devices',
+                ))
+                excellent = values.get('excellent-devices')
+                good = values.get('good-devices')
+                warnings = values.get('warning-devices')
+                critical = values.get('critical-devices')
                 unknown = self.extract_attribute_int(
                     content, 'data-unknown-devices'
                 )
@@ -2271,16 +2317,18 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
                 required_metrics = ["excellent", "good", "warnings", "critical"]
                 
             elif "optical" in html_filename:
-                excellent = self.extract_element_value(content, 'excellent-ports')
-                good = self.extract_element_value(content, 'good-ports')
-                warnings = self.extract_element_value(content, 'warning-ports')
-                critical = self.extract_element_value(content, 'critical-ports')
-                down = self.extract_element_value(content, 'down-ports')
-                if down is None:
-                    # Backward compatibility with reports generated before
-                    # DOWN received its own summary card.
-                    down = 0
-                total = self.extract_element_value(content, 'total-ports')
+                values = self.extract_element_values(content, (
+                    'excellent-ports', 'good-ports', 'warning-ports',
+                    'critical-ports', 'down-ports', 'total-ports',
+                ))
+                excellent = values.get('excellent-ports')
+                good = values.get('good-ports')
+                warnings = values.get('warning-ports')
+                critical = values.get('critical-ports')
+                # Backward compatibility with reports generated before DOWN
+                # received its own summary card.
+                down = values.get('down-ports', 0)
+                total = values.get('total-ports')
                 unplugged = self.extract_attribute_int(
                     content, 'data-optical-unplugged'
                 )
@@ -2323,11 +2371,15 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
                 ]
                 
             elif "ber" in html_filename:
-                excellent = self.extract_element_value(content, 'excellent-ports')
-                good = self.extract_element_value(content, 'good-ports')
-                warnings = self.extract_element_value(content, 'warning-ports')
-                critical = self.extract_element_value(content, 'critical-ports')
-                unknown = self.extract_element_value(content, 'unknown-ports')
+                values = self.extract_element_values(content, (
+                    'excellent-ports', 'good-ports', 'warning-ports',
+                    'critical-ports', 'unknown-ports',
+                ))
+                excellent = values.get('excellent-ports')
+                good = values.get('good-ports')
+                warnings = values.get('warning-ports')
+                critical = values.get('critical-ports')
+                unknown = values.get('unknown-ports')
                 
                 stats = {
                     "excellent": excellent,
@@ -2341,8 +2393,11 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
                 ]
                 
             elif "link-flap" in html_filename:
-                stable = self.extract_element_value(content, 'stable-ports')
-                problematic = self.extract_element_value(content, 'problematic-ports')
+                values = self.extract_element_values(
+                    content, ('stable-ports', 'problematic-ports')
+                )
+                stable = values.get('stable-ports')
+                problematic = values.get('problematic-ports')
                 warnings = self.extract_attribute_int(
                     content, 'data-warning-ports'
                 )
@@ -2361,10 +2416,14 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
                 required_metrics = ["stable", "warnings", "critical"]
                 
             elif "bgp" in html_filename:
-                established = self.extract_element_value(content, 'established-neighbors')
-                down = self.extract_element_value(content, 'down-neighbors')
-                stale = self.extract_element_value(content, 'stale-devices')
-                unknown = self.extract_element_value(content, 'unknown-devices')
+                values = self.extract_element_values(content, (
+                    'established-neighbors', 'down-neighbors',
+                    'stale-devices', 'unknown-devices',
+                ))
+                established = values.get('established-neighbors')
+                down = values.get('down-neighbors')
+                stale = values.get('stale-devices')
+                unknown = values.get('unknown-devices')
                 warnings = self.extract_attribute_int(
                     content, 'data-warning-neighbors'
                 )
@@ -2498,17 +2557,26 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
             return None
         return int(value)
 
-    def extract_element_value(self, html_content, element_id):
-        """Extract numeric value from HTML element by ID"""
+    def extract_element_values(self, html_content, element_ids):
+        """Extract numeric values for several element IDs in one scan.
+
+        Returns ``{element_id: int}`` holding the first ``id="...">number``
+        match of each ID; absent IDs are omitted.
+        """
+        key = tuple(element_ids)
+        pattern = self._ELEMENT_VALUE_RES.get(key)
+        if pattern is None:
+            alternation = "|".join(re.escape(element_id) for element_id in key)
+            pattern = self._ELEMENT_VALUE_RES.setdefault(
+                key, re.compile(rf'id="({alternation})"[^>]*>\s*(\d+)'),
+            )
+        values = {}
         try:
-            # Look for id="element_id">number
-            pattern = rf'id="{re.escape(element_id)}"[^>]*>\s*(\d+)'
-            match = re.search(pattern, html_content)
-            if match:
-                return int(match.group(1))
-            return None
-        except (TypeError, ValueError, re.error):
-            return None
+            for match in pattern.finditer(html_content):
+                values.setdefault(match.group(1), int(match.group(2)))
+        except (TypeError, ValueError):
+            return {}
+        return values
 
     def get_log_stats_from_json(self):
         """Get log statistics from log_summary.json (JavaScript logic)"""
@@ -2517,8 +2585,7 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
             if not log_summary_file.exists():
                 return {}
                 
-            with open(log_summary_file, 'r') as f:
-                log_data = json.load(f)
+            log_data = self._load_history(log_summary_file)
 
             if log_data.get("collection_status") != "current":
                 print("    ❌ log_summary.json has no current device telemetry")
@@ -2584,11 +2651,19 @@ Excellent: {ber_stats['excellent']}     Good: {ber_stats['good']}     Warnings:
                     self.monitor_results / "lldp_results.ini",
                 ]
             
-            existing_paths = [path for path in possible_paths if path.is_file()]
+            # One stat() per candidate both filters regular files and yields
+            # the mtime used to pick the newest copy.
+            candidates = []
+            for path in possible_paths:
+                try:
+                    path_stat = path.stat()
+                except OSError:
+                    continue
+                if stat.S_ISREG(path_stat.st_mode):
+                    candidates.append((path_stat.st_mtime, path))
             lldp_file = max(
-                existing_paths, key=lambda path: path.stat().st_mtime,
-                default=None,
-            )
+                candidates, key=lambda item: item[0], default=(None, None),
+            )[1]
                     
             if not lldp_file:
                 print(f"    ❌ No lldp_results.ini found in any expected location")
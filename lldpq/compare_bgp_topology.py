@@ -19,10 +19,25 @@ import os
 from datetime import datetime
 from collections import defaultdict
 
+# '"d1":"p1" -- "d2":"p2"' edge at the start of a topology.dot line.
+_LINK_RE = re.compile(
+    r'^[ \t]*"([^"]+)"[ \t]*:[ \t]*"([^"]+)"[ \t]*--[ \t]*"([^"]+)"[ \t]*:[ \t]*"([^"]+)"',
+    re.MULTILINE,
+)
+
+# Endpoints of non-switch links (DGX, servers, etc.) in topology.dot.
+_SKIP_RE = re.compile(r'(?i)(?:dgx-|enp|prod-)')
+
+def _canon(a, b):
+    """Return an undirected link as an ordered (low, high) tuple."""
+    return (a, b) if a <= b else (b, a)
+
 def parse_bgp_report(csv_path):
     """Parse BGP report and return devices, links, and down states."""
-    devices = set()
-    established_links = set()
+    # Rows are collected column-wise and folded into sets in bulk afterwards.
+    dev_col = []   # every reporting device
+    est_col = []   # reporting side of each ESTABLISHED switch session
+    nbr_col = []   # matching neighbour for each est_col entry
     down_idle = []
     down_active = []
     device_neighbors = defaultdict(set)
@@ -34,7 +49,7 @@ def parse_bgp_report(csv_path):
     # Fall back to the legacy positional layout when no header row is present.
     col = {'device': 0, 'neighbor': 1, 'state': 3}
 
-    with open(csv_path, 'r') as f:
+    with open(csv_path, 'r', newline='') as f:
         reader = csv.reader(f)
         header_seen = False
         for row in reader:
@@ -60,10 +75,12 @@ def parse_bgp_report(csv_path):
             if len(row) <= max(col.values()):
                 continue
 
-            device = row[col['device']]
+            # Intern names: the same few hundred devices repeat on every row
+            # and back both the device sets and the neighbour graph.
+            device = sys.intern(row[col['device']])
             neighbor_raw = row[col['neighbor']]
             state = row[col['state']].strip().upper()
-            devices.add(device)
+            dev_col.append(device)
             
             # Skip firewall links
             if 'cfw' in neighbor_raw.lower():
@@ -72,16 +89,19 @@ def parse_bgp_report(csv_path):
             if state == 'ESTABLISHED':
                 match = re.match(r'([a-z]{3}-\d[a-z]{2}-\d+-\d+)', neighbor_raw)
                 if match:
-                    neighbor = match.group(1)
-                    devices.add(neighbor)
-                    link = tuple(sorted([device, neighbor]))
-                    established_links.add(link)
-                    device_neighbors[device].add(neighbor)
-                    device_neighbors[neighbor].add(device)
+                    est_col.append(device)
+                    nbr_col.append(sys.intern(match.group(1)))
             elif state == 'IDLE':
                 down_idle.append((device, neighbor_raw))
             elif state == 'ACTIVE':
                 down_active.append((device, neighbor_raw))
+
+    devices = set(dev_col)
+    devices.update(nbr_col)
+    established_links = set(map(_canon, est_col, nbr_col))
+    for device, neighbor in zip(est_col, nbr_col):
+        device_neighbors[device].add(neighbor)
+        device_neighbors[neighbor].add(device)
     
     return devices, established_links, down_idle, down_active, device_neighbors
 
@@ -92,37 +112,37 @@ def parse_topology_dot(dot_path):
     device_ports = set()  # Set of "device:port" strings
     
     with open(dot_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if '--' not in line or line.startswith('#'):
-                continue
-            
-            match = re.findall(r'"([^"]+)"', line)
-            if len(match) >= 4:
-                d1, p1, d2, p2 = match[0], match[1], match[2], match[3]
-                # Skip non-switch links (DGX, servers, etc.)
-                if any(x in d1.lower() or x in d2.lower() for x in ['dgx-', 'enp', 'prod-']):
-                    continue
-                devices.add(d1)
-                devices.add(d2)
-                link = tuple(sorted([d1, d2]))
-                links.add(link)
-                # Add device:port pairs
-                device_ports.add(f"{d1}:{p1}")
-                device_ports.add(f"{d2}:{p2}")
+        data = f.read()
+
+    # One scan over the whole file.  Edges must open their line, so '#'
+    # comments and the ' * "A":"x" -- "B":"y"' examples in the header
+    # block comment are never counted as links.
+    for match in _LINK_RE.finditer(data):
+        d1, p1, d2, p2 = match.groups()
+        # Skip non-switch links (DGX, servers, etc.)
+        if _SKIP_RE.search(d1) or _SKIP_RE.search(d2):
+            continue
+        devices.add(d1)
+        devices.add(d2)
+        links.add(_canon(d1, d2))
+        # Add device:port pairs
+        device_ports.add(f"{d1}:{p1}")
+        device_ports.add(f"{d2}:{p2}")
     
     return devices, links, device_ports
 
+# Switch role by three-letter hostname prefix.
+_CATEGORIES = {
+    'csw': 'Core Switch',
+    'ssw': 'Spine Switch',
+    'lsw': 'Leaf Switch',
+    'osw': 'OOB Switch',
+}
+
 def categorize_device(name):
     """Categorize device by prefix."""
-    prefix = name[:3] if len(name) >= 3 else name
-    categories = {
-        'csw': 'Core Switch',
-        'ssw': 'Spine Switch', 
-        'lsw': 'Leaf Switch',
-        'osw': 'OOB Switch',
-    }
-    return categories.get(prefix, 'Unknown')
+    # Slicing never raises, and a shorter name cannot match a 3-char key.
+    return _CATEGORIES.get(name[:3], 'Unknown')
 
 def main():
     if len(sys.argv) < 2:
@@ -162,25 +182,30 @@ def main():
     # Group missing devices by category
     missing_by_category = defaultdict(list)
     for dev in missing_devices:
-        cat = categorize_device(dev)
-        missing_by_category[cat].append(dev)
+        missing_by_category[categorize_device(dev)].append(dev)
     
-    # Print Report
-    print("=" * 70)
-    print("        BGP vs TOPOLOGY.DOT COMPARISON REPORT")
-    print("=" * 70)
-    print(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"  BGP Report: {os.path.basename(bgp_path)}")
-    print("=" * 70)
+    # Print Report.  Lines are buffered and written once at the end so large
+    # fabrics do not pay one stdout write per device or link.
+    out = []
+
+    def emit(line=""):
+        out.append(line + "\n")
+
+    emit("=" * 70)
+    emit("        BGP vs TOPOLOGY.DOT COMPARISON REPORT")
+    emit("=" * 70)
+    emit(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    emit(f"  BGP Report: {os.path.basename(bgp_path)}")
+    emit("=" * 70)
     
     # Summary
-    print("\n  SUMMARY")
-    print("  " + "-" * 66)
-    print(f"  BGP Devices:          {len(bgp_devices):>5}")
-    print(f"  Topology Devices:     {len(topo_devices):>5}")
-    print(f"  BGP Links:            {len(bgp_links):>5}")
-    print(f"  Topology Links:       {len(topo_links):>5}")
-    print("  " + "-" * 66)
+    emit("\n  SUMMARY")
+    emit("  " + "-" * 66)
+    emit(f"  BGP Devices:          {len(bgp_devices):>5}")
+    emit(f"  Topology Devices:     {len(topo_devices):>5}")
+    emit(f"  BGP Links:            {len(bgp_links):>5}")
+    emit(f"  Topology Links:       {len(topo_links):>5}")
+    emit("  " + "-" * 66)
     status_dev = "ACTION REQUIRED" if missing_devices else "OK"
     status_link = "ACTION REQUIRED" if missing_links else "OK"
     # Pre-calculate IDLE in/not in topology
@@ -190,51 +215,51 @@ def main():
     status_idle_topo = "ACTION REQUIRED" if idle_in_topo_count else "OK"
     status_idle_other = "INFO" if idle_not_in_topo_count else "OK"
     status_active = "FIREWALL/L3" if bgp_active else "OK"
-    print(f"  Missing Devices:      {len(missing_devices):>5}  [{status_dev}]")
-    print(f"  Missing Links:        {len(missing_links):>5}  [{status_link}]")
-    print(f"  IDLE (in topology):   {idle_in_topo_count:>5}  [{status_idle_topo}]")
-    print(f"  IDLE (not in topo):   {idle_not_in_topo_count:>5}  [{status_idle_other}]")
-    print(f"  BGP Down (ACTIVE):    {len(bgp_active):>5}  [{status_active}]")
+    emit(f"  Missing Devices:      {len(missing_devices):>5}  [{status_dev}]")
+    emit(f"  Missing Links:        {len(missing_links):>5}  [{status_link}]")
+    emit(f"  IDLE (in topology):   {idle_in_topo_count:>5}  [{status_idle_topo}]")
+    emit(f"  IDLE (not in topo):   {idle_not_in_topo_count:>5}  [{status_idle_other}]")
+    emit(f"  BGP Down (ACTIVE):    {len(bgp_active):>5}  [{status_active}]")
     
     # Missing Devices
-    print("\n" + "=" * 70)
-    print("  MISSING DEVICES (in BGP but NOT in topology.dot)")
-    print("=" * 70)
+    emit("\n" + "=" * 70)
+    emit("  MISSING DEVICES (in BGP but NOT in topology.dot)")
+    emit("=" * 70)
     if missing_devices:
         for category in ['Core Switch', 'Spine Switch', 'Leaf Switch', 'OOB Switch', 'Unknown']:
             if category in missing_by_category:
-                print(f"\n  {category}:")
+                emit(f"\n  {category}:")
                 for dev in sorted(missing_by_category[category]):
                     neighbors = device_neighbors.get(dev, set())
                     neighbor_str = ', '.join(sorted(neighbors)[:3])
                     if len(neighbors) > 3:
                         neighbor_str += f" (+{len(neighbors)-3} more)"
-                    print(f"    - {dev}")
+                    emit(f"    - {dev}")
                     if neighbors:
-                        print(f"      Neighbors: {neighbor_str}")
+                        emit(f"      Neighbors: {neighbor_str}")
     else:
-        print("\n  [OK] All BGP devices are documented in topology.dot")
+        emit("\n  [OK] All BGP devices are documented in topology.dot")
     
     # Missing Links
-    print("\n" + "=" * 70)
-    print("  MISSING LINKS (in BGP but NOT in topology.dot)")
-    print("=" * 70)
+    emit("\n" + "=" * 70)
+    emit("  MISSING LINKS (in BGP but NOT in topology.dot)")
+    emit("=" * 70)
     if missing_links:
-        print("\n  Add these to topology.dot:\n")
+        emit("\n  Add these to topology.dot:\n")
         for link in sorted(missing_links):
-            print(f'    "{link[0]}" -- "{link[1]}"')
-        print(f"\n  Total: {len(missing_links)} links")
+            emit(f'    "{link[0]}" -- "{link[1]}"')
+        emit(f"\n  Total: {len(missing_links)} links")
     else:
-        print("\n  [OK] All BGP links are documented in topology.dot")
+        emit("\n  [OK] All BGP links are documented in topology.dot")
     
     # Extra devices in topology
-    extra_switches = {d for d in extra_topo_devices if d[:3] in ['csw', 'ssw', 'lsw', 'osw']}
+    extra_switches = {d for d in extra_topo_devices if d[:3] in _CATEGORIES}
     if extra_switches:
-        print("\n" + "=" * 70)
-        print("  TOPOLOGY DEVICES NOT IN BGP (down or not installed)")
-        print("=" * 70)
+        emit("\n" + "=" * 70)
+        emit("  TOPOLOGY DEVICES NOT IN BGP (down or not installed)")
+        emit("=" * 70)
         for dev in sorted(extra_switches):
-            print(f"    - {dev}")
+            emit(f"    - {dev}")
     
     # BGP Down Links - separate by topology.dot presence
     idle_in_topo = []
@@ -246,36 +271,37 @@ def main():
         else:
             idle_not_in_topo.append((device, port))
     
-    print("\n" + "=" * 70)
-    print("  BGP DOWN LINKS")
-    print("=" * 70)
+    emit("\n" + "=" * 70)
+    emit("  BGP DOWN LINKS")
+    emit("=" * 70)
     
     if idle_in_topo:
-        print(f"\n  IDLE - IN TOPOLOGY.DOT ({len(idle_in_topo)} ports) [ACTION REQUIRED]:")
+        emit(f"\n  IDLE - IN TOPOLOGY.DOT ({len(idle_in_topo)} ports) [ACTION REQUIRED]:")
         for device, port in idle_in_topo:
-            print(f"    [!] {device}:{port}")
+            emit(f"    [!] {device}:{port}")
     
     if idle_not_in_topo:
-        print(f"\n  IDLE - NOT IN TOPOLOGY.DOT ({len(idle_not_in_topo)} ports) [INFO]:")
+        emit(f"\n  IDLE - NOT IN TOPOLOGY.DOT ({len(idle_not_in_topo)} ports) [INFO]:")
         for device, port in idle_not_in_topo:
-            print(f"    [ ] {device}:{port}")
+            emit(f"    [ ] {device}:{port}")
     
     if bgp_active:
-        print("\n  ACTIVE (Waiting for Peer - Firewall/L3):")
+        emit("\n  ACTIVE (Waiting for Peer - Firewall/L3):")
         for device, neighbor in bgp_active:
-            print(f"    [i] {device} -> {neighbor}")
+            emit(f"    [i] {device} -> {neighbor}")
     
     if not bgp_idle and not bgp_active:
-        print("\n  [OK] All BGP sessions are ESTABLISHED")
+        emit("\n  [OK] All BGP sessions are ESTABLISHED")
     
     # Final Status
-    print("\n" + "=" * 70)
+    emit("\n" + "=" * 70)
     issues = len(missing_devices) + len(missing_links) + len(idle_in_topo)
     if issues == 0:
-        print("  STATUS: [OK] ALL GOOD - No action required")
+        emit("  STATUS: [OK] ALL GOOD - No action required")
     else:
-        print(f"  STATUS: [!] {issues} issue(s) found - Review above sections")
-    print("=" * 70 + "\n")
+        emit(f"  STATUS: [!] {issues} issue(s) found - Review above sections")
+    emit("=" * 70 + "\n")
+    sys.stdout.write(''.join(out))
     
     sys.exit(1 if (missing_devices or missing_links or idle_in_topo) else 0)
 
@@ -18,7 +18,11 @@ import html
 import statistics
 import tempfile
 import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 import export_artifacts
 from collection_freshness import (
     is_current_collection,
@@ -161,6 +165,8 @@ def load_hardware_thresholds():
 HARDWARE_THRESHOLDS = load_hardware_thresholds()
 
 GRADE_PRIORITY = {"CRITICAL": 4, "WARNING": 3, "GOOD": 2, "EXCELLENT": 1}
+# Indexed by the number of (excellent_max, good_max, warning_max) bounds met.
+HIGH_IS_BAD_GRADES = ("EXCELLENT", "GOOD", "WARNING", "CRITICAL")
 HISTORY_MAX_SKEW_SECONDS = 300.0
 
 
@@ -168,14 +174,9 @@ def grade_high_is_bad(value, threshold_key):
     """Grade a metric where higher values are worse."""
     if not isinstance(value, (int, float)):
         return None
-    excellent_max, good_max, warning_max = HARDWARE_THRESHOLDS[threshold_key]
-    if value < excellent_max:
-        return "EXCELLENT"
-    if value < good_max:
-        return "GOOD"
-    if value < warning_max:
-        return "WARNING"
-    return "CRITICAL"
+    return HIGH_IS_BAD_GRADES[
+        bisect_right(HARDWARE_THRESHOLDS[threshold_key], value)
+    ]
 
 
 def grade_low_is_bad(value, threshold_key):
@@ -192,6 +193,25 @@ def grade_low_is_bad(value, threshold_key):
     return "CRITICAL"
 
 
+def grade_cpu(temp):
+    return grade_high_is_bad(temp, "cpu_temp_c")
+
+
+def grade_asic(temp):
+    return grade_high_is_bad(temp, "asic_temp_c")
+
+
+def grade_memory(percent):
+    return grade_high_is_bad(percent, "memory_percent")
+
+
+def grade_psu(efficiency, raw):
+    # Only grade when we have parsed value
+    if raw is None:
+        return None
+    return grade_low_is_bad(efficiency, "psu_efficiency_percent")
+
+
 def _power_to_watts(value, unit):
     watts = float(value)
     if unit == "kW":
@@ -328,141 +348,163 @@ def parse_assets_file(assets_file_path="assets.ini"):
         
     return device_info
 
-def parse_temperature_from_hardware_file(device_name):
-    """Parse the hottest CPU and ASIC sensor from the raw hardware file.
+def _hardware_file_path(device_name):
+    return f"monitor-results/hardware-data/{device_name}_hardware.txt"
 
-    Alerts use the maximum observed temperature because one hot core/package
-    is operationally significant. The report uses the same max metric rather
-    than averaging cores and disagreeing with the alert state.
+
+def _read_hardware_file(path):
+    """Return the raw hardware sample at ``path``, or None if unreadable.
+
+    Undecodable bytes become U+FFFD rather than vanishing, so a corrupt
+    sample shows up in the parsed fields instead of silently shortening them.
     """
-    
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as source:
+            return source.read()
+    except OSError:
+        return None
+
+
+# Each alternation holds exactly one capture group per branch, so the matched
+# value is always ``match.group(match.lastindex)``.  Trailing whitespace is a
+# lookahead so a match never consumes the start of the following line.
+_ASIC_TEMP_RE = re.compile(
+    r'Ambient ASIC Temp:\s*\+?(-?\d+\.?\d*)[°C]'
+    r'|^(?:HW_MGMT_ASIC|THERMAL_ZONE_ASIC|HWMON_ASIC):\s*(-?\d+\.?\d*)'
+    r'|^\s*Asic-Temp-Sensor\s+(-?\d+\.?\d*)(?=\s)',
+    re.MULTILINE | re.IGNORECASE,
+)
+# Deliberately do not use generic "temp1": it may be a disk or PSU.
+_CPU_TEMP_RE = re.compile(
+    r'CPU ACPI temp:\s*\+?(-?\d+\.?\d*)[°C]'
+    r'|Core \d+:\s*\+?(-?\d+\.?\d*)[°C]'
+    r'|Package id \d+:\s*\+?(-?\d+\.?\d*)[°C]'
+    r'|^HW_MGMT_CPU:\s*(-?\d+\.?\d*)'
+    r'|^\s*CPU-Core-Sensor-\d+\s+(-?\d+\.?\d*)(?=\s)'
+    r'|^\s*CPU-Package-Sensor\s+(-?\d+\.?\d*)(?=\s)',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+def _max_temperature(pattern, content):
+    values = [
+        float(match.group(match.lastindex))
+        for match in pattern.finditer(content)
+    ]
+    return max(values) if values else None
+
+
+def _temperatures_from_content(content, device_name):
     cpu_temp = None
     asic_temp = None
-    
-    hardware_file = f"monitor-results/hardware-data/{device_name}_hardware.txt"
-    
-    if not os.path.exists(hardware_file):
-        return cpu_temp, asic_temp
-    
     try:
-        with open(hardware_file, 'r') as f:
-            content = f.read()
-        
-        asic_temperatures = []
-        for pattern in (
-            r'Ambient ASIC Temp:\s*\+?(-?\d+\.?\d*)[°C]',
-            r'^(?:HW_MGMT_ASIC|THERMAL_ZONE_ASIC|HWMON_ASIC):\s*(-?\d+\.?\d*)',
-            r'^\s*Asic-Temp-Sensor\s+(-?\d+\.?\d*)\s+',
-        ):
-            asic_temperatures.extend(
-                float(value) for value in re.findall(
-                    pattern, content, re.MULTILINE | re.IGNORECASE
-                )
-            )
-        if asic_temperatures:
-            asic_temp = max(asic_temperatures)
-
-        # Deliberately do not use generic "temp1": it may be a disk or PSU.
-        cpu_temperatures = []
-        for pattern in (
-            r'CPU ACPI temp:\s*\+?(-?\d+\.?\d*)[°C]',
-            r'Core \d+:\s*\+?(-?\d+\.?\d*)[°C]',
-            r'Package id \d+:\s*\+?(-?\d+\.?\d*)[°C]',
-            r'^HW_MGMT_CPU:\s*(-?\d+\.?\d*)',
-            r'^\s*CPU-Core-Sensor-\d+\s+(-?\d+\.?\d*)\s+',
-            r'^\s*CPU-Package-Sensor\s+(-?\d+\.?\d*)\s+',
-        ):
-            cpu_temperatures.extend(
-                float(value) for value in re.findall(
-                    pattern, content, re.MULTILINE | re.IGNORECASE
-                )
-            )
-        if cpu_temperatures:
-            cpu_temp = max(cpu_temperatures)
-        
+        asic_temp = _max_temperature(_ASIC_TEMP_RE, content)
+        cpu_temp = _max_temperature(_CPU_TEMP_RE, content)
     except Exception as e:
         print(f"Warning: Could not parse temperatures for {device_name}: {e}")
-    
     return cpu_temp, asic_temp
 
+def parse_temperature_from_hardware_file(device_name):
+    """Parse the hottest CPU and ASIC sensor from the raw hardware file.
+
+    Alerts use the maximum observed temperature because one hot core/package
+    is operationally significant. The report uses the same max metric rather
+    than averaging cores and disagreeing with the alert state.
+    """
+    parsed = parse_all_from_hardware_file(device_name)
+    return parsed["cpu_temp"], parsed["asic_temp"]
+
+def _psu_power_totals(content):
+    """Return (input_watts, output_watts, from_rails) summed from a sample.
+
+    PSU AC-in/DC-out rails are preferred; PMIC/VR and generic PSU readings
+    are only aggregated when the rails are unavailable.  Efficiency and the
+    IN/OUT column share this single scan of the file.
+    """
+    # 1) Preferred: use PSU AC-in and DC-out rails only (avoids double counting) - supports kW/W
+    psu_ac_in_w = re.findall(r'^PSU-[^\n]*220V\s+Rail\s+Pwr\s*\(in\):\s*(\d+\.?\d*)\s*([km]?W)', content, re.MULTILINE)
+    # Support both 54V (most switches) and 12V (some platforms)
+    psu_dc_out_w = re.findall(r'^PSU-[^\n]*(?:54V|12V)\s+Rail\s+Pwr\s*\(out\):\s*(\d+\.?\d*)\s*([km]?W)', content, re.MULTILINE)
+
+    # Normalize W/kW/mW before aggregating.
+    total_psu_in = 0.0
+    for value, unit in psu_ac_in_w:
+        total_psu_in += _power_to_watts(value, unit)
+
+    total_psu_out = 0.0  
+    for value, unit in psu_dc_out_w:
+        total_psu_out += _power_to_watts(value, unit)
+
+    if total_psu_in > 0 and total_psu_out > 0:
+        return total_psu_in, total_psu_out, True
+
+    # 2) Fallback (legacy): aggregate PMIC/VR in/out if PSU rails are unavailable
+    total_input_power = 0.0
+    total_output_power = 0.0
+
+    # PMIC/VR input formats (include (in) and (pin))
+    input_matches_w = re.findall(r'PMIC-\d+.*\(in\):\s*(\d+\.?\d*)\s*W', content)
+    input_matches_mw = re.findall(r'PMIC-\d+.*\(in\):\s*(\d+\.?\d*)\s*mW', content)
+    input_matches_pin_w = re.findall(r'PMIC-\d+.*Pwr\s*\(pin\):\s*(\d+\.?\d*)\s*W', content)
+    vr_input_matches_w = re.findall(r'VR IC.*pwr\s*\(in\):\s*(\d+\.?\d*)\s*W', content)
+    # PMIC/VR output formats (include Rail Pwr (out) and Pwr (poutX))
+    output_matches_w = re.findall(r'PMIC-\d+.*Pwr \(out\d*\):\s*(\d+\.?\d*)\s*W', content)
+    output_matches_mw = re.findall(r'PMIC-\d+.*Pwr \(out\d*\):\s*(\d+\.?\d*)\s*mW', content)
+    output_matches_pout_w = re.findall(r'PMIC-\d+.*Pwr\s*\(pout\d*\):\s*(\d+\.?\d*)\s*W', content)
+    vr_output_matches_w = re.findall(r'^(?!PMIC-).*(?:VR|VCORE).*Rail Pwr\s*\(out\):\s*(\d+\.?\d*)\s*W', content, re.MULTILINE)
+    # As a last resort include generic PSU Pwr(in/out) (non-rail) if present
+    psu_input_general_w = re.findall(r'^PSU-[^\n]*Pwr\s*\(in\):\s*(\d+\.?\d*)\s*W', content, re.MULTILINE)
+    psu_output_general_w = re.findall(r'^PSU-[^\n]*Pwr\s*\(out\):\s*(\d+\.?\d*)\s*W', content, re.MULTILINE)
+
+    for power_str in input_matches_w:
+        total_input_power += float(power_str)
+    for power_str in input_matches_mw:
+        total_input_power += float(power_str) / 1000.0
+    for power_str in input_matches_pin_w:
+        total_input_power += float(power_str)
+    for power_str in vr_input_matches_w:
+        total_input_power += float(power_str)
+    for power_str in psu_input_general_w:
+        total_input_power += float(power_str)
+
+    for power_str in output_matches_w:
+        total_output_power += float(power_str)
+    for power_str in output_matches_mw:
+        total_output_power += float(power_str) / 1000.0
+    for power_str in output_matches_pout_w:
+        total_output_power += float(power_str)
+    for power_str in vr_output_matches_w:
+        total_output_power += float(power_str)
+    for power_str in psu_output_general_w:
+        total_output_power += float(power_str)
+
+    return total_input_power, total_output_power, False
+
+
+def _psu_efficiency_from_totals(totals):
+    total_in, total_out, _from_rails = totals
+    if total_in > 0 and total_out > 0:
+        efficiency = (total_out / total_in) * 100.0
+        # A value above 100% is invalid telemetry, not an excellent PSU.
+        return efficiency if efficiency <= 100.0 else None
+    return None
+
+
 def parse_psu_efficiency_from_hardware_file(device_name):
     """Parse PSU efficiency from raw hardware file"""
-    
-    hardware_file = f"monitor-results/hardware-data/{device_name}_hardware.txt"
-    
-    if not os.path.exists(hardware_file):
-        return None
-    
-    try:
-        with open(hardware_file, 'r') as f:
-            content = f.read()
-        # 1) Preferred: use PSU AC-in and DC-out rails only (avoids double counting) - supports kW/W
-        psu_ac_in_w = re.findall(r'^PSU-[^\n]*220V\s+Rail\s+Pwr\s*\(in\):\s*(\d+\.?\d*)\s*([km]?W)', content, re.MULTILINE)
-        # Support both 54V (most switches) and 12V (some platforms)
-        psu_dc_out_w = re.findall(r'^PSU-[^\n]*(?:54V|12V)\s+Rail\s+Pwr\s*\(out\):\s*(\d+\.?\d*)\s*([km]?W)', content, re.MULTILINE)
-
-        # Normalize W/kW/mW before aggregating.
-        total_psu_in = 0.0
-        for value, unit in psu_ac_in_w:
-            total_psu_in += _power_to_watts(value, unit)
-            
-        total_psu_out = 0.0  
-        for value, unit in psu_dc_out_w:
-            total_psu_out += _power_to_watts(value, unit)
-
-        if total_psu_in > 0 and total_psu_out > 0:
-            efficiency = (total_psu_out / total_psu_in) * 100.0
-            # A value above 100% is invalid telemetry, not an excellent PSU.
-            return efficiency if efficiency <= 100.0 else None
-
-        # 2) Fallback (legacy): aggregate PMIC/VR in/out if PSU rails are unavailable
-        total_input_power = 0.0
-        total_output_power = 0.0
-
-        # PMIC/VR input formats (include (in) and (pin))
-        input_matches_w = re.findall(r'PMIC-\d+.*\(in\):\s*(\d+\.?\d*)\s*W', content)
-        input_matches_mw = re.findall(r'PMIC-\d+.*\(in\):\s*(\d+\.?\d*)\s*mW', content)
-        input_matches_pin_w = re.findall(r'PMIC-\d+.*Pwr\s*\(pin\):\s*(\d+\.?\d*)\s*W', content)
-        vr_input_matches_w = re.findall(r'VR IC.*pwr\s*\(in\):\s*(\d+\.?\d*)\s*W', content)
-        # PMIC/VR output formats (include Rail Pwr (out) and Pwr (poutX))
-        output_matches_w = re.findall(r'PMIC-\d+.*Pwr \(out\d*\):\s*(\d+\.?\d*)\s*W', content)
-        output_matches_mw = re.findall(r'PMIC-\d+.*Pwr \(out\d*\):\s*(\d+\.?\d*)\s*mW', content)
-        output_matches_pout_w = re.findall(r'PMIC-\d+.*Pwr\s*\(pout\d*\):\s*(\d+\.?\d*)\s*W', content)
-        vr_output_matches_w = re.findall(r'^(?!PMIC-).*(?:VR|VCORE).*Rail Pwr\s*\(out\):\s*(\d+\.?\d*)\s*W', content, re.MULTILINE)
-        # As a last resort include generic PSU Pwr(in/out) (non-rail) if present
-        psu_input_general_w = re.findall(r'^PSU-[^\n]*Pwr\s*\(in\):\s*(\d+\.?\d*)\s*W', content, re.MULTILINE)
-        psu_output_general_w = re.findall(r'^PSU-[^\n]*Pwr\s*\(out\):\s*(\d+\.?\d*)\s*W', content, re.MULTILINE)
-
-        for power_str in input_matches_w:
-            total_input_power += float(power_str)
-        for power_str in input_matches_mw:
-            total_input_power += float(power_str) / 1000.0
-        for power_str in input_matches_pin_w:
-            total_input_power += float(power_str)
-        for power_str in vr_input_matches_w:
-            total_input_power += float(power_str)
-        for power_str in psu_input_general_w:
-            total_input_power += float(power_str)
-
-        for power_str in output_matches_w:
-            total_output_power += float(power_str)
-        for power_str in output_matches_mw:
-            total_output_power += float(power_str) / 1000.0
-        for power_str in output_matches_pout_w:
-            total_output_power += float(power_str)
-        for power_str in vr_output_matches_w:
-            total_output_power += float(power_str)
-        for power_str in psu_output_general_w:
-            total_output_power += float(power_str)
-
-        if total_input_power > 0 and total_output_power > 0:
-            efficiency = (total_output_power / total_input_power) * 100.0
-            return efficiency if efficiency <= 100.0 else None
-        
-    except Exception as e:
-        print(f"Warning: Could not parse PSU efficiency for {device_name}: {e}")
-    
-    return None
+    return parse_all_from_hardware_file(device_name)["psu_efficiency"]
+
+def _psu_power_in_out_from_totals(totals, device_name):
+    total_in, total_out, from_rails = totals
+    if total_in > 0 and total_out > 0:
+        # Sanity check: Output should never be higher than input (physics!)
+        if total_out > total_in:
+            if from_rails:
+                print(f"⚠️  {device_name}: PSU output ({total_out}W) > input ({total_in}W) - IMPOSSIBLE!")
+            return None, None
+        return total_in, total_out
+    return None, None
+
 
 def parse_psu_power_in_out_from_hardware_file(device_name):
     """Return (total_input_watts, total_output_watts) for a device.
@@ -474,78 +516,8 @@ def parse_psu_power_in_out_from_hardware_file(device_name):
       - PMIC/VR pin/pout and in/out aggregates
       - Generic PSU Pwr(in/out)
     """
-    hardware_file = f"monitor-results/hardware-data/{device_name}_hardware.txt"
-    if not os.path.exists(hardware_file):
-        return None, None
-    try:
-        with open(hardware_file, 'r') as f:
-            content = f.read()
-
-        # Enhanced PSU rails - support both W and kW units
-        psu_ac_in_w = re.findall(r'^PSU-[^\n]*220V\s+Rail\s+Pwr\s*\(in\):\s*(\d+\.?\d*)\s*([km]?W)', content, re.MULTILINE)
-        psu_dc_out_w = re.findall(r'^PSU-[^\n]*(?:54V|12V)\s+Rail\s+Pwr\s*\(out\):\s*(\d+\.?\d*)\s*([km]?W)', content, re.MULTILINE)
-
-        # Normalize W/kW/mW before aggregating.
-        total_psu_in = 0.0
-        for value, unit in psu_ac_in_w:
-            total_psu_in += _power_to_watts(value, unit)
-            
-        total_psu_out = 0.0  
-        for value, unit in psu_dc_out_w:
-            total_psu_out += _power_to_watts(value, unit)
-
-
-        if total_psu_in > 0 and total_psu_out > 0:
-            # Sanity check: Output should never be higher than input (physics!)
-            if total_psu_out > total_psu_in:
-                print(f"⚠️  {device_name}: PSU output ({total_psu_out}W) > input ({total_psu_in}W) - IMPOSSIBLE!")
-                return None, None
-            return total_psu_in, total_psu_out
-
-        # Fallback: PMIC/VR and generic PSU Pwr(in/out)
-        total_input_power = 0.0
-        total_output_power = 0.0
-
-        input_matches_w = re.findall(r'PMIC-\d+.*\(in\):\s*(\d+\.?\d*)\s*W', content)
-        input_matches_mw = re.findall(r'PMIC-\d+.*\(in\):\s*(\d+\.?\d*)\s*mW', content)
-        input_matches_pin_w = re.findall(r'PMIC-\d+.*Pwr\s*\(pin\):\s*(\d+\.?\d*)\s*W', content)
-        vr_input_matches_w = re.findall(r'VR IC.*pwr\s*\(in\):\s*(\d+\.?\d*)\s*W', content)
-        output_matches_w = re.findall(r'PMIC-\d+.*Pwr \(out\d*\):\s*(\d+\.?\d*)\s*W', content)
-        output_matches_mw = re.findall(r'PMIC-\d+.*Pwr \(out\d*\):\s*(\d+\.?\d*)\s*mW', content)
-        output_matches_pout_w = re.findall(r'PMIC-\d+.*Pwr\s*\(pout\d*\):\s*(\d+\.?\d*)\s*W', content)
-        vr_output_matches_w = re.findall(r'^(?!PMIC-).*(?:VR|VCORE).*Rail Pwr\s*\(out\):\s*(\d+\.?\d*)\s*W', content, re.MULTILINE)
-        psu_input_general_w = re.findall(r'^PSU-[^\n]*Pwr\s*\(in\):\s*(\d+\.?\d*)\s*W', content, re.MULTILINE)
-        psu_output_general_w = re.findall(r'^PSU-[^\n]*Pwr\s*\(out\):\s*(\d+\.?\d*)\s*W', content, re.MULTILINE)
-
-        for s in input_matches_w:
-            total_input_power += float(s)
-        for s in input_matches_mw:
-            total_input_power += float(s) / 1000.0
-        for s in input_matches_pin_w:
-            total_input_power += float(s)
-        for s in vr_input_matches_w:
-            total_input_power += float(s)
-        for s in psu_input_general_w:
-            total_input_power += float(s)
-
-        for s in output_matches_w:
-            total_output_power += float(s)
-        for s in output_matches_mw:
-            total_output_power += float(s) / 1000.0
-        for s in output_matches_pout_w:
-            total_output_power += float(s)
-        for s in vr_output_matches_w:
-            total_output_power += float(s)
-        for s in psu_output_general_w:
-            total_output_power += float(s)
-
-        if total_input_power > 0 and total_output_power > 0:
-            if total_output_power > total_input_power:
-                return None, None
-            return total_input_power, total_output_power
-        return None, None
-    except Exception:
-        return None, None
+    parsed = parse_all_from_hardware_file(device_name)
+    return parsed["psu_in_w"], parsed["psu_out_w"]
 
 def _parse_size_to_gib(size_str: str) -> float:
     """Convert a size token like '15Gi', '286Mi' into GiB float."""
@@ -567,20 +539,8 @@ def _parse_size_to_gib(size_str: str) -> float:
         return 0.0
     return 0.0
 
-def parse_fans_from_hardware_file(device_name):
-    """Parse fan RPMs from the raw hardware file and return a dict {name: rpm}.
-
-    Supports chassis fan tach lines and PSU fan lines, e.g.:
-      "Chassis Fan Drawer-1 Tach 1: 9266 RPM"
-      "PSU-1(L) Fan 1: 9632 RPM"
-    """
-    hardware_file = f"monitor-results/hardware-data/{device_name}_hardware.txt"
-    if not os.path.exists(hardware_file):
-        return {}
+def _fans_from_content(content, device_name):
     try:
-        with open(hardware_file, 'r') as f:
-            content = f.read()
-
         fans = {}
         # Generic matcher: any line that has "Fan" and ends with an RPM value
         # Match lines with 'fan' or 'Fan' keywords (case-insensitive)
@@ -595,19 +555,18 @@ def parse_fans_from_hardware_file(device_name):
         print(f"Warning: Could not parse fans for {device_name}: {e}")
         return {}
 
-def parse_resources_from_hardware_file(device_name):
-    """Parse memory usage percent, 5‑minute CPU load, and uptime string from raw file.
+def parse_fans_from_hardware_file(device_name):
+    """Parse fan RPMs from the raw hardware file and return a dict {name: rpm}.
 
-    Returns dict keys possibly including: memory_usage (float), cpu_load (float), uptime (str)
+    Supports chassis fan tach lines and PSU fan lines, e.g.:
+      "Chassis Fan Drawer-1 Tach 1: 9266 RPM"
+      "PSU-1(L) Fan 1: 9632 RPM"
     """
-    hardware_file = f"monitor-results/hardware-data/{device_name}_hardware.txt"
+    return dict(parse_all_from_hardware_file(device_name)["fans"])
+
+def _resources_from_content(content, device_name):
     results = {}
-    if not os.path.exists(hardware_file):
-        return results
     try:
-        with open(hardware_file, 'r') as f:
-            content = f.read()
-
         # Memory usage from the "Mem:" row
         # Example: Mem: 15Gi 3.9Gi 9.9Gi 286Mi 2.1Gi 11Gi
         mem_line = re.search(r'^Mem:\s+(\S+)\s+(\S+)\s+\S+\s+\S+\s+\S+\s+(\S+)', content, re.MULTILINE)
@@ -646,22 +605,16 @@ def parse_resources_from_hardware_file(device_name):
         print(f"Warning: Could not parse resources for {device_name}: {e}")
     return results
 
+def parse_resources_from_hardware_file(device_name):
+    """Parse memory usage percent, 5‑minute CPU load, and uptime string from raw file.
 
-def hardware_missing_telemetry_markers(device_name):
-    """Return collector-declared telemetry gaps from the current raw sample.
-
-    The collector deliberately writes these messages when a command cannot
-    provide data.  Treating them as ordinary text can otherwise allow a fresh
-    history entry or a partial fallback to make an incomplete sample look
-    healthy.
+    Returns dict keys possibly including: memory_usage (float), cpu_load (float), uptime (str)
     """
-    hardware_file = f"monitor-results/hardware-data/{device_name}_hardware.txt"
-    try:
-        with open(hardware_file, "r", encoding="utf-8", errors="ignore") as source:
-            content = source.read().lower()
-    except OSError:
-        return {"hardware_file"}
+    return dict(parse_all_from_hardware_file(device_name)["resources"])
 
+
+def _missing_markers_from_content(content):
+    content = content.lower()
     markers = set()
     for source, status in re.findall(
         r'^__LLDPQ_HARDWARE_SOURCE_STATUS__:([A-Za-z0-9_.-]+):(OK|ERROR|UNAVAILABLE)\s*$',
@@ -679,6 +632,98 @@ def hardware_missing_telemetry_markers(device_name):
     return markers
 
 
+def hardware_missing_telemetry_markers(device_name):
+    """Return collector-declared telemetry gaps from the current raw sample.
+
+    The collector deliberately writes these messages when a command cannot
+    provide data.  Treating them as ordinary text can otherwise allow a fresh
+    history entry or a partial fallback to make an incomplete sample look
+    healthy.
+    """
+    return set(parse_all_from_hardware_file(device_name)["missing_markers"])
+
+
+def _parse_all_from_content(content, device_name):
+    cpu_temp, asic_temp = _temperatures_from_content(content, device_name)
+    try:
+        psu_totals = _psu_power_totals(content)
+    except Exception as e:
+        print(f"Warning: Could not parse PSU power for {device_name}: {e}")
+        psu_totals = (0.0, 0.0, False)
+    psu_in_w, psu_out_w = _psu_power_in_out_from_totals(psu_totals, device_name)
+    return {
+        "cpu_temp": cpu_temp,
+        "asic_temp": asic_temp,
+        "resources": _resources_from_content(content, device_name),
+        "psu_efficiency": _psu_efficiency_from_totals(psu_totals),
+        "psu_in_w": psu_in_w,
+        "psu_out_w": psu_out_w,
+        "fans": _fans_from_content(content, device_name),
+        "missing_markers": _missing_markers_from_content(content),
+    }
+
+
+def _missing_hardware_file_result():
+    return {
+        "cpu_temp": None,
+        "asic_temp": None,
+        "resources": {},
+        "psu_efficiency": None,
+        "psu_in_w": None,
+        "psu_out_w": None,
+        "fans": {},
+        "missing_markers": {"hardware_file"},
+    }
+
+
+@lru_cache(maxsize=4096)
+def _parse_all_cached(path, device_name, st_ino, st_size, st_mtime_ns):
+    # The stat fields are part of the key only, so a rewritten file is parsed
+    # again while an unchanged one is served from memory.
+    content = _read_hardware_file(path)
+    if content is None:
+        return _missing_hardware_file_result()
+    return _parse_all_from_content(content, device_name)
+
+
+def parse_all_from_hardware_file(device_name):
+    """Read the raw hardware file once and run every parser over it.
+
+    The report needs temperatures, resources, PSU and fan values for each
+    device; reading the same file once per metric multiplied disk I/O by the
+    number of parsers.  Returns a dict with cpu_temp, asic_temp, resources,
+    psu_efficiency, psu_in_w, psu_out_w, fans and missing_markers.
+
+    Results are memoized on the file's path, inode, size and mtime, and are
+    shared between callers: treat them as read-only.
+    """
+    path = os.path.abspath(_hardware_file_path(device_name))
+    try:
+        info = os.stat(path)
+    except OSError:
+        return _missing_hardware_file_result()
+    return _parse_all_cached(
+        path, device_name, info.st_ino, info.st_size, info.st_mtime_ns
+    )
+
+
+# Parsing is dominated by file reads, so threads overlap I/O across devices.
+HARDWARE_PARSE_WORKERS = 16
+
+
+def parse_all_hardware_files(device_names):
+    """Return {device: parse_all_from_hardware_file(device)} for every device."""
+    device_names = list(device_names)
+    workers = min(HARDWARE_PARSE_WORKERS, len(device_names))
+    if workers <= 1:
+        return {name: parse_all_from_hardware_file(name) for name in device_names}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(
+            device_names,
+            executor.map(parse_all_from_hardware_file, device_names),
+        ))
+
+
 def normalize_load_per_core(cpu_load, cpu_cores):
     """Return the 5-minute load average divided by logical CPU cores."""
     if (isinstance(cpu_load, bool) or
@@ -749,7 +794,8 @@ def grade_fans_relative(fans):
 
     critical_ratio, warning_ratio, good_ratio = FAN_COHORT_RATIO_THRESHOLDS
     details = []
-    grades = []
+    overall = None
+    worst_priority = 0
     for name, rpm in numeric_fans:
         cohort = _classify_fan(name)
         baseline = baselines.get(cohort)
@@ -781,12 +827,10 @@ def grade_fans_relative(fans):
             ),
             "ratio": round(ratio, 2) if ratio is not None else None,
         })
-        if grade:
-            grades.append(grade)
+        if grade and GRADE_PRIORITY[grade] > worst_priority:
+            worst_priority = GRADE_PRIORITY[grade]
+            overall = grade
 
-    overall = (
-        max(grades, key=lambda g: GRADE_PRIORITY.get(g, 0)) if grades else None
-    )
     return overall, details
 
 
@@ -794,7 +838,8 @@ def _atomic_write(path, content):
     """Write ``content`` to ``path`` atomically (tempfile + fsync + replace).
 
     A concurrent web reader or a mid-write crash then never observes a
-    truncated or empty analysis page.
+    truncated or empty analysis page.  ``content`` is either a string or an
+    iterable of string chunks, which are streamed without being joined.
     """
     directory = os.path.dirname(path) or "."
     os.makedirs(directory, exist_ok=True)
@@ -803,7 +848,10 @@ def _atomic_write(path, content):
     )
     try:
         with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
-            handle.write(content)
+            if isinstance(content, str):
+                handle.write(content)
+            else:
+                handle.writelines(content)
             handle.flush()
             os.fsync(handle.fileno())
         os.chmod(temporary_name, 0o664)
@@ -821,19 +869,80 @@ def _atomic_write(path, content):
         raise
 
 
-def calculate_device_health_grade(device_name, device_data):
-    """Calculate overall health grade for a device based on our thresholds"""
+def _natural_sort_key(name):
+    """Sort key that orders embedded numbers numerically, case-insensitively."""
+    return [
+        int(part) if part.isdigit() else part.lower()
+        for part in re.split(r'(\d+)', name)
+    ]
+
+
+# Status dots only mark WARNING/CRITICAL metrics; other grades render nothing.
+STATUS_DOTS = {
+    "CRITICAL": '<span class="status-dot critical" title="Critical"></span>',
+    "WARNING": '<span class="status-dot warning" title="Warning"></span>',
+}
+
+
+def status_dot(grade, title=None):
+    """Return the dot marking ``grade``, optionally with a custom tooltip."""
+    if not title or grade not in STATUS_DOTS:
+        return STATUS_DOTS.get(grade, '')
+    title_attr = html.escape(title, quote=True)
+    return f'<span class="status-dot {grade.lower()}" title="{title_attr}"></span>'
+
+
+# Sort order of the Health and Fan columns (problems first); any other value,
+# such as a fan status of N/A, sorts last.
+STATUS_SORT_PRIORITY = {
+    "CRITICAL": 0, "WARNING": 1, "GOOD": 2, "EXCELLENT": 3, "UNKNOWN": 4,
+}
+
+
+# Bound formatters for the numeric table cells, resolved once per process.
+FORMAT_TEMP = "{:.1f}°C".format
+FORMAT_PERCENT = "{:.1f}%".format
+FORMAT_LOAD = "{:.2f}".format
+FORMAT_LOAD_PER_CORE = "{:.2f} ({:.2f}/core)".format
+FORMAT_POWER_IN_OUT = "{:.1f}W / {:.1f}W".format
+
+
+# One device row of the hardware table; every value is already HTML-safe.
+HARDWARE_ROW_TEMPLATE = """
+                <tr class="hw-row" data-device-key="%s" data-status="%s" onclick="toggleHwDetails(this)">
+                    <td>%s</td>
+                    <td data-sort-priority="%d"><span class="%s">%s</span></td>
+                    <td>%s%s</td>
+                    <td>%s%s</td>
+                    <td>%s%s</td>
+                    <td title="%s">%s%s</td>
+                    <td data-sort-priority="%d"><span class="%s">%s</span>%s</td>
+                    <td>%s%s</td>
+                    <td>%s</td>
+                    <td>%s</td>
+                </tr>
+"""
+
+
+def calculate_device_health_grade(device_name, device_data, parsed=None):
+    """Calculate overall health grade for a device based on our thresholds
+
+    ``parsed`` is the parse_all_from_hardware_file() result when the caller
+    has already read the raw file.
+    """
     health_grades = []
     # Source markers describe the primary collector command, not necessarily the
     # metric itself. Platforms commonly report SENSORS=UNAVAILABLE while the
     # hw-management/thermal-zone fallback still supplies valid CPU/ASIC values.
     # Keep every other explicit collector failure fail-closed; fresh history can
     # otherwise mask a current MEMORY/CPU_LOAD error with an older value.
-    missing_markers = hardware_missing_telemetry_markers(device_name)
+    if parsed is None:
+        parsed = parse_all_from_hardware_file(device_name)
+    missing_markers = parsed["missing_markers"]
     required_telemetry_missing = bool(missing_markers - {"sensors"})
     
     # CPU Temperature grade
-    cpu_temp, asic_temp = parse_temperature_from_hardware_file(device_name)
+    cpu_temp, asic_temp = parsed["cpu_temp"], parsed["asic_temp"]
     cpu_grade = grade_high_is_bad(cpu_temp, "cpu_temp_c")
     if cpu_grade:
         health_grades.append(cpu_grade)
@@ -847,12 +956,11 @@ def calculate_device_health_grade(device_name, device_data):
     else:
         required_telemetry_missing = True
     
-    parsed_resources = {}
+    parsed_resources = parsed["resources"]
 
     # Memory usage grade
     memory_usage = device_data.get("resources", {}).get("memory", {}).get("usage_percent", None)
     if memory_usage is None:
-        parsed_resources = parse_resources_from_hardware_file(device_name)
         memory_usage = parsed_resources.get('memory_usage')
     if not isinstance(memory_usage, (int, float)):
         required_telemetry_missing = True
@@ -862,14 +970,10 @@ def calculate_device_health_grade(device_name, device_data):
     # CPU Load grade
     cpu_load = device_data.get("resources", {}).get("cpu", {}).get("load_5min", None)
     if cpu_load is None:
-        if not parsed_resources:
-            parsed_resources = parse_resources_from_hardware_file(device_name)
         cpu_load = parsed_resources.get('cpu_load')
     # Normalize the load average by CPU core count (see grade_load_per_core).
     cpu_cores = device_data.get("resources", {}).get("cpu", {}).get("cores", None)
     if not cpu_cores:
-        if not parsed_resources:
-            parsed_resources = parse_resources_from_hardware_file(device_name)
         cpu_cores = parsed_resources.get('cpu_cores')
     if not isinstance(cpu_cores, (int, float)) or cpu_cores <= 0:
         required_telemetry_missing = True
@@ -880,7 +984,7 @@ def calculate_device_health_grade(device_name, device_data):
         required_telemetry_missing = True
     
     # PSU Efficiency grade
-    psu_efficiency = parse_psu_efficiency_from_hardware_file(device_name)
+    psu_efficiency = parsed["psu_efficiency"]
     psu_grade = grade_low_is_bad(psu_efficiency, "psu_efficiency_percent")
     if psu_grade:
         health_grades.append(psu_grade)
@@ -890,7 +994,7 @@ def calculate_device_health_grade(device_name, device_data):
     # Fan status grade (relative to each fan's own cohort baseline)
     fans = device_data.get("fans", {})
     if not fans:
-        fans = parse_fans_from_hardware_file(device_name)
+        fans = parsed["fans"]
     fan_status, _fan_details = grade_fans_relative(fans)
     if fan_status:
         health_grades.append(fan_status)
@@ -965,6 +1069,7 @@ def generate_hardware_html():
                 'uptime': 'N/A'
             }
     print(f"Analyzing {len(latest_devices)} devices from the current collection")
+    parsed_hardware = parse_all_hardware_files(latest_devices)
     
     # Calculate summary
     summary = {
@@ -980,7 +1085,9 @@ def generate_hardware_html():
     
     for device_name, device_data in latest_devices.items():
         # Use our own health calculation instead of JSON's overall_grade
-        overall_grade = calculate_device_health_grade(device_name, device_data)
+        overall_grade = calculate_device_health_grade(
+            device_name, device_data, parsed_hardware[device_name]
+        )
         device_info = {
             'device': device_name,
             'health_grade': overall_grade,
@@ -1068,8 +1175,12 @@ def generate_hardware_html():
             '<div class="coverage-banner">' + " ".join(parts) + "</div>"
         )
 
-    # Generate dark theme HTML
-    html_content = f"""<!DOCTYPE html>
+    # Generate dark theme HTML.  The page is assembled as a list of parts and
+    # streamed to disk as-is, so neither per-device rows nor a final join
+    # copy the whole document.
+    html_parts = []
+    append = html_parts.append
+    append(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1135,6 +1246,11 @@ def generate_hardware_html():
         .empty-row td {{ text-align: center; color: #888; padding: 30px; }}
         .empty-row.stale td {{ color: #ffb74d; }}
         .hardware-table tbody tr.hw-row {{ cursor: pointer; }}
+        .hardware-table[data-filter="excellent"] tr.hw-row:not([data-status="excellent"]),
+        .hardware-table[data-filter="good"] tr.hw-row:not([data-status="good"]),
+        .hardware-table[data-filter="warning"] tr.hw-row:not([data-status="warning"]),
+        .hardware-table[data-filter="critical"] tr.hw-row:not([data-status="critical"]),
+        .hardware-table[data-filter="unknown"] tr.hw-row:not([data-status="unknown"]) {{ display: none; }}
         .detail-row td {{ padding: 0; border: 1px solid #404040; }}
         .detail-panel {{ padding: 14px 18px 18px; background: #202020; border-left: 3px solid #76b900; }}
         .detail-title {{ color: #76b900; font-weight: 700; margin-bottom: 12px; font-size: 14px; }}
@@ -1269,12 +1385,14 @@ def generate_hardware_html():
                     </tr>
                 </thead>
                 <tbody id="hardware-data">
-"""
+""")
     
     # Add all devices to table (sorted by health - problems first)
-    all_devices = (summary['critical_devices'] + summary['warning_devices'] +
-                  summary['good_devices'] + summary['excellent_devices'] +
-                  summary['unknown_devices'])
+    all_devices = list(chain(
+        summary['critical_devices'], summary['warning_devices'],
+        summary['good_devices'], summary['excellent_devices'],
+        summary['unknown_devices'],
+    ))
 
     # Per-device evidence for the expandable detail panel (already computed
     # below); surfaced client-side instead of collecting anything new.
@@ -1286,9 +1404,10 @@ def generate_hardware_html():
         health_grade = device_info['health_grade']  # Already calculated in summary
         
         # Extract key metrics for display
-        cpu_temp, asic_temp = parse_temperature_from_hardware_file(device_name)
-        cpu_temp_str = f"{cpu_temp:.1f}°C" if cpu_temp is not None else "N/A"
-        asic_temp_str = f"{asic_temp:.1f}°C" if asic_temp is not None else "N/A"
+        parsed_hw = parsed_hardware[device_name]
+        cpu_temp, asic_temp = parsed_hw["cpu_temp"], parsed_hw["asic_temp"]
+        cpu_temp_str = FORMAT_TEMP(cpu_temp) if cpu_temp is not None else "N/A"
+        asic_temp_str = FORMAT_TEMP(asic_temp) if asic_temp is not None else "N/A"
         
         # Prefer values from JSON resources; otherwise parse from raw hardware file
         memory_usage = device_data.get("resources", {}).get("memory", {}).get("usage_percent", None)
@@ -1298,7 +1417,7 @@ def generate_hardware_html():
         uptime = None
 
         if memory_usage is None or cpu_load is None or cpu_cores is None or not uptime:
-            parsed = parse_resources_from_hardware_file(device_name)
+            parsed = parsed_hw["resources"]
             if memory_usage is None:
                 memory_usage = parsed.get('memory_usage')
             if cpu_load is None:
@@ -1306,16 +1425,25 @@ def generate_hardware_html():
             if cpu_cores is None:
                 cpu_cores = parsed.get('cpu_cores')
             # do not set uptime anymore
+
+        # Coerce once so grading, formatting and the detail export below see
+        # either a number or None.
+        if not isinstance(memory_usage, (int, float)):
+            memory_usage = None
+        if not isinstance(cpu_load, (int, float)):
+            cpu_load = None
+        if not isinstance(cpu_cores, (int, float)):
+            cpu_cores = None
         
         # PSU Efficiency 
-        psu_efficiency_parsed = parse_psu_efficiency_from_hardware_file(device_name)
+        psu_efficiency_parsed = parsed_hw["psu_efficiency"]
         psu_efficiency = psu_efficiency_parsed if psu_efficiency_parsed is not None else 0.0
         
         # Calculate fan status for display (use JSON fans or parse from file if
         # missing). Fans are graded relative to their own cohort baseline.
         fans = device_data.get("fans", {})
         if not fans:
-            fans = parse_fans_from_hardware_file(device_name)
+            fans = parsed_hw["fans"]
         fan_status, fan_details = grade_fans_relative(fans)
         if fan_status is None:
             fan_status = "N/A"
@@ -1344,49 +1472,13 @@ def generate_hardware_html():
         else:
             fan_badge_class = ""
         
-        # Compute per-metric grades for dot indicators
-        def grade_cpu(t):
-            return grade_high_is_bad(t, "cpu_temp_c")
-
-        def grade_asic(t):
-            return grade_high_is_bad(t, "asic_temp_c")
-
-        def grade_memory(p):
-            return grade_high_is_bad(p, "memory_percent")
-
-        def grade_psu(eff, raw):
-            # Only grade when we have parsed value
-            if raw is None:
-                return None
-            return grade_low_is_bad(eff, "psu_efficiency_percent")
-
-        cpu_g = grade_cpu(cpu_temp)
-        asic_g = grade_asic(asic_temp)
-        mem_g = grade_memory(memory_usage if isinstance(memory_usage, (int, float)) else None)
-        load_g = grade_load_per_core(cpu_load if isinstance(cpu_load, (int, float)) else None, cpu_cores)
-        fan_g = fan_status if fan_status in ("EXCELLENT", "GOOD", "WARNING", "CRITICAL") else None
-        psu_g = grade_psu(psu_efficiency, psu_efficiency_parsed)
-
-        def dot_for(g, title=None):
-            title_attr = html.escape(title or str(g).title(), quote=True)
-            if g == "CRITICAL":
-                return f'<span class="status-dot critical" title="{title_attr}"></span>'
-            if g == "WARNING":
-                return f'<span class="status-dot warning" title="{title_attr}"></span>'
-            return ''
-
-        show_dots = health_grade in ("WARNING", "CRITICAL")
-
-        cpu_cell_suffix = dot_for(cpu_g) if show_dots else ''
-        asic_cell_suffix = dot_for(asic_g) if show_dots else ''
-        mem_cell_suffix = dot_for(mem_g) if show_dots else ''
         normalized_load = normalize_load_per_core(cpu_load, cpu_cores)
         if normalized_load is not None:
             load_explanation = (
                 f"Raw 5-minute load {cpu_load:.2f}; health: {cpu_load:.2f} / "
                 f"{cpu_cores:g} cores = {normalized_load:.2f}/core"
             )
-        elif isinstance(cpu_load, (int, float)):
+        elif cpu_load is not None:
             load_explanation = (
                 f"Raw 5-minute load {cpu_load:.2f}; health cannot be evaluated "
                 "without a valid logical CPU core count"
@@ -1394,17 +1486,31 @@ def generate_hardware_html():
         else:
             load_explanation = "Raw 5-minute load is unavailable"
         load_title = html.escape(load_explanation, quote=True)
-        load_cell_suffix = (
-            dot_for(load_g, load_explanation) if show_dots else ''
-        )
-        fan_cell_suffix = dot_for(fan_g) if show_dots else ''
-        psu_cell_suffix = dot_for(psu_g) if show_dots else ''
+
+        # Per-metric dot indicators are only shown on WARNING/CRITICAL rows,
+        # so healthy rows skip the per-metric grading entirely.
+        if health_grade in ("WARNING", "CRITICAL"):
+            cpu_g = grade_cpu(cpu_temp)
+            asic_g = grade_asic(asic_temp)
+            mem_g = grade_memory(memory_usage)
+            load_g = grade_load_per_core(cpu_load, cpu_cores)
+            fan_g = fan_status if fan_status in ("EXCELLENT", "GOOD", "WARNING", "CRITICAL") else None
+            psu_g = grade_psu(psu_efficiency, psu_efficiency_parsed)
+            cpu_cell_suffix = status_dot(cpu_g)
+            asic_cell_suffix = status_dot(asic_g)
+            mem_cell_suffix = status_dot(mem_g)
+            load_cell_suffix = status_dot(load_g, load_explanation)
+            fan_cell_suffix = status_dot(fan_g)
+            psu_cell_suffix = status_dot(psu_g)
+        else:
+            cpu_cell_suffix = asic_cell_suffix = mem_cell_suffix = ''
+            load_cell_suffix = fan_cell_suffix = psu_cell_suffix = ''
 
         # Compute PSU IN/OUT numbers for display
-        psu_in_w, psu_out_w = parse_psu_power_in_out_from_hardware_file(device_name)
+        psu_in_w, psu_out_w = parsed_hw["psu_in_w"], parsed_hw["psu_out_w"]
         psu_in_out_str = "N/A"
         if psu_in_w is not None and psu_out_w is not None:
-            psu_in_out_str = f"{psu_in_w:.1f}W / {psu_out_w:.1f}W"
+            psu_in_out_str = FORMAT_POWER_IN_OUT(psu_in_w, psu_out_w)
 
         # Get model information from assets
         device_label = html.escape(str(canonical(device_name)))
@@ -1412,20 +1518,20 @@ def generate_hardware_html():
         device_model = html.escape(
             str(assets_data.get(device_name, {}).get("model", "N/A"))
         )
-        memory_usage_str = (f"{memory_usage:.1f}%"
-                            if isinstance(memory_usage, (int, float)) else "N/A")
+        memory_usage_str = (FORMAT_PERCENT(memory_usage)
+                            if memory_usage is not None else "N/A")
         # Display the raw 5-minute load alongside the per-core value that health
         # is actually graded against, so the figure can be read directly against
         # the per-core threshold reference instead of appearing falsely CRITICAL.
-        if isinstance(cpu_load, (int, float)):
+        if cpu_load is not None:
             if normalized_load is not None:
-                cpu_load_str = f"{cpu_load:.2f} ({normalized_load:.2f}/core)"
+                cpu_load_str = FORMAT_LOAD_PER_CORE(cpu_load, normalized_load)
             else:
-                cpu_load_str = f"{cpu_load:.2f}"
+                cpu_load_str = FORMAT_LOAD(cpu_load)
         else:
             cpu_load_str = "N/A"
         psu_efficiency_str = (
-            f"{psu_efficiency:.1f}%"
+            FORMAT_PERCENT(psu_efficiency)
             if psu_efficiency_parsed is not None else "N/A"
         )
 
@@ -1434,10 +1540,10 @@ def generate_hardware_html():
             "health": health_grade,
             "cpu_temp": cpu_temp,
             "asic_temp": asic_temp,
-            "memory": memory_usage if isinstance(memory_usage, (int, float)) else None,
-            "load_raw": cpu_load if isinstance(cpu_load, (int, float)) else None,
+            "memory": memory_usage,
+            "load_raw": cpu_load,
             "load_per_core": round(normalized_load, 2) if normalized_load is not None else None,
-            "cores": cpu_cores if isinstance(cpu_cores, (int, float)) else None,
+            "cores": cpu_cores,
             "psu_efficiency": (
                 round(psu_efficiency, 1) if psu_efficiency_parsed is not None else None
             ),
@@ -1446,20 +1552,20 @@ def generate_hardware_html():
             "fans": fan_details,
         }
 
-        html_content += f"""
-                <tr class="hw-row" data-device-key="{device_key}" data-status="{health_grade.lower()}" onclick="toggleHwDetails(this)">
-                    <td>{device_label}</td>
-                    <td><span class="{health_badge_class}">{health_grade.upper()}</span></td>
-                    <td>{cpu_temp_str}{cpu_cell_suffix}</td>
-                    <td>{asic_temp_str}{asic_cell_suffix}</td>
-                    <td>{memory_usage_str}{mem_cell_suffix}</td>
-                    <td title="{load_title}">{cpu_load_str}{load_cell_suffix}</td>
-                    <td><span class="{fan_badge_class}">{fan_status}</span>{fan_cell_suffix}</td>
-                    <td>{psu_efficiency_str}{psu_cell_suffix}</td>
-                    <td>{psu_in_out_str}</td>
-                    <td>{device_model}</td>
-                </tr>
-"""
+        append(HARDWARE_ROW_TEMPLATE % (
+            device_key, health_grade.lower(), device_label,
+            STATUS_SORT_PRIORITY.get(health_grade.upper(), 5),
+            health_badge_class, health_grade.upper(),
+            cpu_temp_str, cpu_cell_suffix,
+            asic_temp_str, asic_cell_suffix,
+            memory_usage_str, mem_cell_suffix,
+            load_title, cpu_load_str, load_cell_suffix,
+            STATUS_SORT_PRIORITY.get(fan_status, 5),
+            fan_badge_class, fan_status, fan_cell_suffix,
+            psu_efficiency_str, psu_cell_suffix,
+            psu_in_out_str,
+            device_model,
+        ))
 
     if not all_devices:
         if coverage_status != "current" or current_device_count == 0:
@@ -1471,7 +1577,7 @@ def generate_hardware_html():
         else:
             empty_message = "All monitored devices are healthy - nothing to flag."
             empty_class = "empty-row"
-        html_content += (
+        append(
             f'                <tr class="{empty_class}"><td colspan="10">'
             f'{empty_message}</td></tr>\n'
         )
@@ -1480,7 +1586,16 @@ def generate_hardware_html():
     hw_details_json = json.dumps(
         device_details, separators=(",", ":"), ensure_ascii=True
     ).replace("</", "<\\/")
-    html_content += f"""
+    # The device search list is sorted once here instead of being scraped
+    # from the table and sorted in the browser on every page load.
+    hw_devices_json = json.dumps(
+        sorted(
+            {detail["device"] for detail in device_details.values()},
+            key=_natural_sort_key,
+        ),
+        separators=(",", ":"), ensure_ascii=True,
+    ).replace("</", "<\\/")
+    append(f"""
                 </tbody>
             </table>
         </div>
@@ -1503,13 +1618,14 @@ def generate_hardware_html():
         </div>
     </div>
 
-"""
+""")
     
-    html_content += f"""
+    append(f"""
     <script>window.HW_DETAILS = {hw_details_json};</script>
-"""
+    <script>window.HW_DEVICES = {hw_devices_json};</script>
+""")
 
-    html_content += """
+    append("""
     <!-- jQuery and Select2 for device search -->
     <script src="/css/jquery-3.5.1.min.js"></script>
     <script src="/css/select2.min.js"></script>
@@ -1520,8 +1636,29 @@ def generate_hardware_html():
         let allRows = [];
         let deviceSearchActive = false;
         let selectedDevice = '';
+        // Elements touched by every filter/search/sort, looked up once.
+        let EL = {};
         
         document.addEventListener('DOMContentLoaded', function() {
+            EL = {
+                filterInfo: document.getElementById('filter-info'),
+                filterText: document.getElementById('filter-text'),
+                clearSearchBtn: document.getElementById('clearSearchBtn'),
+                hardwareTable: document.getElementById('hardware-table'),
+                totalDevicesCard: document.getElementById('total-devices-card'),
+                excellentCard: document.getElementById('excellent-card'),
+                goodCard: document.getElementById('good-card'),
+                warningCard: document.getElementById('warning-card'),
+                criticalCard: document.getElementById('critical-card'),
+                unknownCard: document.getElementById('unknown-card'),
+                totalDevices: document.getElementById('total-devices'),
+                excellentDevices: document.getElementById('excellent-devices'),
+                goodDevices: document.getElementById('good-devices'),
+                warningDevices: document.getElementById('warning-devices'),
+                criticalDevices: document.getElementById('critical-devices'),
+                unknownDevices: document.getElementById('unknown-devices')
+            };
+
             // Store device rows for filtering (excludes dynamic detail rows and
             // the empty-state placeholder).
             allRows = Array.from(document.querySelectorAll('#hardware-data tr.hw-row'));
@@ -1629,41 +1766,40 @@ def generate_hardware_html():
         function setupCardEvents() {
             console.log('Hardware: Setting up card events...');
             
-            const totalDevicesCard = document.getElementById('total-devices-card');
-            if (totalDevicesCard) {
-                totalDevicesCard.addEventListener('click', function() {
-                    if (parseInt(document.getElementById('total-devices').textContent) > 0) {
+            if (EL.totalDevicesCard) {
+                EL.totalDevicesCard.addEventListener('click', function() {
+                    if (parseInt(EL.totalDevices.textContent) > 0) {
                         filterDevices('TOTAL');
                     }
                 });
             }
             
-            document.getElementById('excellent-card').addEventListener('click', function() {
-                if (parseInt(document.getElementById('excellent-devices').textContent) > 0) {
+            EL.excellentCard.addEventListener('click', function() {
+                if (parseInt(EL.excellentDevices.textContent) > 0) {
                     filterDevices('EXCELLENT');
                 }
             });
             
-            document.getElementById('good-card').addEventListener('click', function() {
-                if (parseInt(document.getElementById('good-devices').textContent) > 0) {
+            EL.goodCard.addEventListener('click', function() {
+                if (parseInt(EL.goodDevices.textContent) > 0) {
                     filterDevices('GOOD');
                 }
             });
             
-            document.getElementById('warning-card').addEventListener('click', function() {
-                if (parseInt(document.getElementById('warning-devices').textContent) > 0) {
+            EL.warningCard.addEventListener('click', function() {
+                if (parseInt(EL.warningDevices.textContent) > 0) {
                     filterDevices('WARNING');
                 }
             });
             
-            document.getElementById('critical-card').addEventListener('click', function() {
-                if (parseInt(document.getElementById('critical-devices').textContent) > 0) {
+            EL.criticalCard.addEventListener('click', function() {
+                if (parseInt(EL.criticalDevices.textContent) > 0) {
                     filterDevices('CRITICAL');
                 }
             });
 
-            document.getElementById('unknown-card').addEventListener('click', function() {
-                if (parseInt(document.getElementById('unknown-devices').textContent) > 0) {
+            EL.unknownCard.addEventListener('click', function() {
+                if (parseInt(EL.unknownDevices.textContent) > 0) {
                     filterDevices('UNKNOWN');
                 }
             });
@@ -1678,7 +1814,8 @@ def generate_hardware_html():
                 selectedDevice = '';
                 deviceSearchActive = false;
                 $('#deviceSearch').val('').trigger('change');
-                document.getElementById('clearSearchBtn').style.display = 'none';
+                EL.clearSearchBtn.style.display = 'none';
+                allRows.forEach(row => row.hidden = false);
             }
             
             // Clear active state from all cards
@@ -1686,47 +1823,65 @@ def generate_hardware_html():
                 card.classList.remove('active');
             });
             
-            let filteredRows = allRows;
+            let status = '';
             let filterText = '';
             
             if (filterType === 'EXCELLENT') {
-                filteredRows = allRows.filter(row => row.dataset.status === 'excellent');
-                filterText = 'Showing ' + filteredRows.length + ' Excellent Devices';
-                document.getElementById('excellent-card').classList.add('active');
+                status = 'excellent';
+                filterText = 'Showing ' + countRowsWithStatus(status) + ' Excellent Devices';
+                EL.excellentCard.classList.add('active');
             } else if (filterType === 'GOOD') {
-                filteredRows = allRows.filter(row => row.dataset.status === 'good');
-                filterText = 'Showing ' + filteredRows.length + ' Good Devices';
-                document.getElementById('good-card').classList.add('active');
+                status = 'good';
+                filterText = 'Showing ' + countRowsWithStatus(status) + ' Good Devices';
+                EL.goodCard.classList.add('active');
             } else if (filterType === 'WARNING') {
-                filteredRows = allRows.filter(row => row.dataset.status === 'warning');
-                filterText = 'Showing ' + filteredRows.length + ' Warning Devices';
-                document.getElementById('warning-card').classList.add('active');
+                status = 'warning';
+                filterText = 'Showing ' + countRowsWithStatus(status) + ' Warning Devices';
+                EL.warningCard.classList.add('active');
             } else if (filterType === 'CRITICAL') {
-                filteredRows = allRows.filter(row => row.dataset.status === 'critical');
-                filterText = 'Showing ' + filteredRows.length + ' Critical Devices';
-                document.getElementById('critical-card').classList.add('active');
+                status = 'critical';
+                filterText = 'Showing ' + countRowsWithStatus(status) + ' Critical Devices';
+                EL.criticalCard.classList.add('active');
             } else if (filterType === 'UNKNOWN') {
-                filteredRows = allRows.filter(row => row.dataset.status === 'unknown');
-                filterText = 'Showing ' + filteredRows.length + ' Unknown Devices';
-                document.getElementById('unknown-card').classList.add('active');
+                status = 'unknown';
+                filterText = 'Showing ' + countRowsWithStatus(status) + ' Unknown Devices';
+                EL.unknownCard.classList.add('active');
             } else if (filterType === 'TOTAL') {
-                filteredRows = allRows;
-                document.getElementById('total-devices-card').classList.add('active');
+                EL.totalDevicesCard.classList.add('active');
             }
             
             // Show filter info for all filters except TOTAL
             if (filterType !== 'ALL' && filterType !== 'TOTAL') {
-                document.getElementById('filter-info').style.display = 'block';
-                document.getElementById('filter-text').textContent = filterText;
+                EL.filterInfo.style.display = 'block';
+                EL.filterText.textContent = filterText;
             } else {
-                document.getElementById('filter-info').style.display = 'none';
+                EL.filterInfo.style.display = 'none';
             }
             
-            // Hide all rows first
-            allRows.forEach(row => row.style.display = 'none');
-            
-            // Show filtered rows
-            filteredRows.forEach(row => row.style.display = '');
+            // The stylesheet hides non-matching rows; no per-row writes.
+            setStatusFilter(status);
+        }
+
+        function setStatusFilter(status) {
+            const table = EL.hardwareTable;
+            if (status) {
+                table.dataset.filter = status;
+            } else {
+                delete table.dataset.filter;
+            }
+        }
+
+        function countRowsWithStatus(status) {
+            return document.querySelectorAll(
+                '#hardware-data tr.hw-row[data-status="' + status + '"]'
+            ).length;
+        }
+
+        // Rows can be hidden by the status filter (CSS) or the device search
+        // (hidden attribute); one selector matches only the rows on screen.
+        function shownRowsSelector() {
+            const status = EL.hardwareTable.dataset.filter;
+            return 'tr.hw-row:not([hidden])' + (status ? '[data-status="' + status + '"]' : '');
         }
         
         function clearFilter() {
@@ -1735,18 +1890,18 @@ def generate_hardware_html():
             document.querySelectorAll('.summary-card').forEach(card => {
                 card.classList.remove('active');
             });
-            document.getElementById('filter-info').style.display = 'none';
+            EL.filterInfo.style.display = 'none';
+            
+            setStatusFilter('');
             
             // Also clear device search
             if (deviceSearchActive) {
                 selectedDevice = '';
                 deviceSearchActive = false;
                 $('#deviceSearch').val('').trigger('change');
-                document.getElementById('clearSearchBtn').style.display = 'none';
+                EL.clearSearchBtn.style.display = 'none';
+                allRows.forEach(row => row.hidden = false);
             }
-            
-            // Show all rows
-            allRows.forEach(row => row.style.display = '');
         }
         
         // ===== Device Search Functions =====
@@ -1775,24 +1930,18 @@ def generate_hardware_html():
         }
         
         function populateDeviceList() {
-            const deviceSet = new Set();
-            allRows.forEach(row => {
-                const deviceName = row.cells[0]?.textContent?.trim();
-                if (deviceName) deviceSet.add(deviceName);
-            });
-            
-            const sortedDevices = Array.from(deviceSet).sort((a, b) => 
-                a.localeCompare(b, undefined, { numeric: true, sensitivity: 'base' })
-            );
+            // Deduplicated and naturally sorted at generation time.
+            const sortedDevices = window.HW_DEVICES || [];
             
-            const select = document.getElementById('deviceSearch');
-            select.innerHTML = '<option value="">Search Device...</option>';
+            // Build the options off-document and attach them in one append.
+            const fragment = document.createDocumentFragment();
+            fragment.appendChild(new Option('Search Device...', ''));
             sortedDevices.forEach(device => {
-                const option = document.createElement('option');
-                option.value = device;
-                option.textContent = device;
-                select.appendChild(option);
+                fragment.appendChild(new Option(device, device));
             });
+            const select = document.getElementById('deviceSearch');
+            select.textContent = '';
+            select.appendChild(fragment);
         }
         
         function filterByDevice(deviceName) {
@@ -1804,24 +1953,21 @@ def generate_hardware_html():
             
             // Clear card-based filter
             currentFilter = 'ALL';
+            setStatusFilter('');
             document.querySelectorAll('.summary-card').forEach(card => card.classList.remove('active'));
             
             // Filter table rows
             let matchCount = 0;
             allRows.forEach(row => {
                 const rowDeviceName = row.cells[0]?.textContent?.trim();
-                if (rowDeviceName === deviceName) {
-                    row.style.display = '';
-                    matchCount++;
-                } else {
-                    row.style.display = 'none';
-                }
+                row.hidden = rowDeviceName !== deviceName;
+                if (!row.hidden) matchCount++;
             });
             
             // Show filter info
-            document.getElementById('filter-info').style.display = 'block';
-            document.getElementById('filter-text').textContent = 'Showing device: ' + deviceName;
-            document.getElementById('clearSearchBtn').style.display = 'inline-block';
+            EL.filterInfo.style.display = 'block';
+            EL.filterText.textContent = 'Showing device: ' + deviceName;
+            EL.clearSearchBtn.style.display = 'inline-block';
         }
         
         function clearDeviceSearch() {
@@ -1829,9 +1975,9 @@ def generate_hardware_html():
             deviceSearchActive = false;
             removeDetailRows();
             $('#deviceSearch').val('').trigger('change');
-            document.getElementById('clearSearchBtn').style.display = 'none';
-            document.getElementById('filter-info').style.display = 'none';
-            allRows.forEach(row => row.style.display = '');
+            EL.clearSearchBtn.style.display = 'none';
+            EL.filterInfo.style.display = 'none';
+            allRows.forEach(row => row.hidden = false);
         }
         
         // Generic table sorting functionality
@@ -1863,43 +2009,42 @@ def generate_hardware_html():
         }
         
         function sortHardwareTable(columnIndex, direction, type) {
-            const table = document.getElementById('hardware-table');
+            const table = EL.hardwareTable;
             const tbody = table.querySelector('tbody');
             // Collapse any open detail rows so they never sort as data.
             removeDetailRows();
             const rows = Array.from(tbody.querySelectorAll('tr.hw-row'));
 
-            rows.sort((a, b) => {
-                let aVal = a.cells[columnIndex].textContent.trim();
-                let bVal = b.cells[columnIndex].textContent.trim();
-                
-                // Extract actual text for status columns (remove HTML)
+            // Read each row's sort key once instead of in every comparison.
+            const keys = rows.map(row => {
+                const cell = row.cells[columnIndex];
+                let value = cell.textContent.trim();
+                // Status cells carry their numeric priority from generation.
                 if (type === 'hardware-status') {
-                    aVal = a.cells[columnIndex].querySelector('span')?.textContent || aVal;
-                    bVal = b.cells[columnIndex].querySelector('span')?.textContent || bVal;
+                    value = Number(cell.dataset.sortPriority);
+                } else if (type === 'number') {
+                    value = parseFloat(value.replace(/[%,]/g, ''));
+                } else if (type === 'power') {
+                    value = parseFloat(value);
                 }
-                
+                return value;
+            });
+
+            const order = keys.map((_, i) => i).sort((i, j) => {
+                const aVal = keys[i];
+                const bVal = keys[j];
                 let result = 0;
                 
                 switch(type) {
                     case 'hardware-status':
-                        result = compareHardwareStatus(aVal, bVal);
+                        result = aVal - bVal;
                         break;
                     case 'number':
-                        const numA = parseFloat(aVal.replace(/[%,]/g, ''));
-                        const numB = parseFloat(bVal.replace(/[%,]/g, ''));
-                        if (isNaN(numA) && isNaN(numB)) result = 0;
-                        else if (isNaN(numA)) result = 1;
-                        else if (isNaN(numB)) result = -1;
-                        else result = numA - numB;
-                        break;
                     case 'power':
-                        const powerA = parseFloat(aVal);
-                        const powerB = parseFloat(bVal);
-                        if (isNaN(powerA) && isNaN(powerB)) result = 0;
-                        else if (isNaN(powerA)) result = 1;
-                        else if (isNaN(powerB)) result = -1;
-                        else result = powerA - powerB;
+                        if (isNaN(aVal) && isNaN(bVal)) result = 0;
+                        else if (isNaN(aVal)) result = 1;
+                        else if (isNaN(bVal)) result = -1;
+                        else result = aVal - bVal;
                         break;
                     case 'string':
                     default:
@@ -1910,25 +2055,14 @@ def generate_hardware_html():
                 return direction === 'desc' ? -result : result;
             });
 
-            // Re-append sorted rows (keeps any empty-state placeholder intact).
+            // Re-append sorted rows in one batch (keeps any empty-state
+            // placeholder intact).
             if (!rows.length) return;
-            rows.forEach(row => tbody.appendChild(row));
+            const fragment = document.createDocumentFragment();
+            order.forEach(i => fragment.appendChild(rows[i]));
+            tbody.appendChild(fragment);
         }
         
-        function compareHardwareStatus(a, b) {
-            const priority = {
-                'CRITICAL': 0,
-                'WARNING': 1,
-                'GOOD': 2,
-                'EXCELLENT': 3,
-                'UNKNOWN': 4
-            };
-            
-            const aPriority = Object.prototype.hasOwnProperty.call(priority, a) ? priority[a] : 5;
-            const bPriority = Object.prototype.hasOwnProperty.call(priority, b) ? priority[b] : 5;
-            return aPriority - bPriority;
-        }
-
         // Run Analysis Function
         async function runAnalysis() {
             const button = document.getElementById('run-analysis');
@@ -2013,86 +2147,94 @@ def generate_hardware_html():
             }
         }
 
+        // The CSV column header never changes, so it is built once.
+        const HW_CSV_HEADER = [
+            'Device',
+            'Health',
+            'CPU Temp (°C)',
+            'ASIC Temp (°C)',
+            'Memory (%)',
+            'CPU Load',
+            'Fan Status',
+            'PSU Efficiency (%)',
+            'PSU Power (IN/OUT)',
+            'Model'
+        ].join(',') + '\\n';
+
+        // Trimmed cell text, quoted only when one regex test finds a comma,
+        // quote or newline; fields that need no quoting are scanned once.
+        const HW_CSV_NEEDS_QUOTE = /[,"\\n]/;
+        function csvField(node) {
+            const value = node.textContent.trim();
+            return HW_CSV_NEEDS_QUOTE.test(value) ? '"' + value.replace(/"/g, '""') + '"' : value;
+        }
+
         // CSV Download Function
         function downloadCSV() {
             try {
                 // Get current date for filename
                 const now = new Date();
-                const dateStr = now.toISOString().slice(0, 10); // YYYY-MM-DD
-                const timeStr = now.toTimeString().slice(0, 5).replace(':', '-'); // HH-MM
+                // One formatter call; date and time are then both UTC, where the
+                // old toTimeString() paired a UTC date with a local time.
+                const iso = now.toISOString();
+                const dateStr = iso.slice(0, 10); // YYYY-MM-DD
+                const timeStr = iso.slice(11, 16).replace(':', '-'); // HH-MM
                 const filename = `Hardware_Analysis_Report_${dateStr}_${timeStr}.csv`;
                 
-                // Create CSV header
-                const headers = [
-                    'Device',
-                    'Health',
-                    'CPU Temp (°C)',
-                    'ASIC Temp (°C)',
-                    'Memory (%)',
-                    'CPU Load',
-                    'Fan Status',
-                    'PSU Efficiency (%)',
-                    'PSU Power (IN/OUT)',
-                    'Model'
-                ];
-                
+                // Read the summary counters in one burst before the row queries.
+                const totalDevices = EL.totalDevices.textContent;
+                const excellentDevices = EL.excellentDevices.textContent;
+                const goodDevices = EL.goodDevices.textContent;
+                const warningDevices = EL.warningDevices.textContent;
+                const criticalDevices = EL.criticalDevices.textContent;
+                const unknownDevices = EL.unknownDevices.textContent;
+
                 // Get table data (data rows only; detail/empty rows are skipped)
-                const table = document.getElementById('hardware-table');
-                const tbody = table.querySelector('tbody');
-                const rows = tbody.querySelectorAll('tr.hw-row');
-                const visibleCount = Array.from(rows).filter(r => r.style.display !== 'none').length;
-                const filtered = visibleCount !== rows.length;
+                const tbody = document.getElementById('hardware-data');
+                const totalCount = tbody.querySelectorAll('tr.hw-row').length;
+                const rows = tbody.querySelectorAll(shownRowsSelector());
+                const visibleCount = rows.length;
+                const filtered = visibleCount !== totalCount;
 
                 // Comment header first so parsers that honor a leading '#' never
                 // mistake a summary line for the column header row.
-                let csvContent = '';
-                csvContent += `# Hardware Health Summary Report\\n`;
-                csvContent += `# Generated: ${now.toLocaleString()}\\n`;
-                csvContent += `# Total Devices: ${document.getElementById('total-devices').textContent}\\n`;
-                csvContent += `# Excellent: ${document.getElementById('excellent-devices').textContent}\\n`;
-                csvContent += `# Good: ${document.getElementById('good-devices').textContent}\\n`;
-                csvContent += `# Warning: ${document.getElementById('warning-devices').textContent}\\n`;
-                csvContent += `# Critical: ${document.getElementById('critical-devices').textContent}\\n`;
-                csvContent += `# Unknown: ${document.getElementById('unknown-devices').textContent}\\n`;
-                csvContent += `# Rows exported: ${visibleCount} of ${rows.length}${filtered ? ' (a filter is active)' : ''}\\n`;
-                csvContent += `#\\n`;
+                // Lines are collected newline-terminated instead of growing one
+                // string per row.
+                const parts = [];
+                parts.push(`# Hardware Health Summary Report\\n`);
+                parts.push(`# Generated: ${now.toLocaleString()}\\n`);
+                parts.push(`# Total Devices: ${totalDevices}\\n`);
+                parts.push(`# Excellent: ${excellentDevices}\\n`);
+                parts.push(`# Good: ${goodDevices}\\n`);
+                parts.push(`# Warning: ${warningDevices}\\n`);
+                parts.push(`# Critical: ${criticalDevices}\\n`);
+                parts.push(`# Unknown: ${unknownDevices}\\n`);
+                parts.push(`# Rows exported: ${visibleCount} of ${totalCount}${filtered ? ' (a filter is active)' : ''}\\n`);
+                parts.push(`#\\n`);
 
                 // Column header follows the comment block.
-                csvContent += headers.join(',') + '\\n';
+                parts.push(HW_CSV_HEADER);
 
-                // Process each visible row
+                // Process each visible row (already narrowed by the selector),
+                // building the CSV line directly from the cells.
                 rows.forEach(row => {
-                    if (row.style.display !== 'none') {
-                        const cells = row.querySelectorAll('td');
-                        if (cells.length >= 10) {
-                            const rowData = [
-                                cells[0].textContent.trim(), // Device
-                                cells[1].querySelector('span') ? cells[1].querySelector('span').textContent.trim() : cells[1].textContent.trim(), // Health
-                                cells[2].textContent.trim(), // CPU Temp
-                                cells[3].textContent.trim(), // ASIC Temp
-                                cells[4].textContent.trim(), // Memory
-                                cells[5].textContent.trim(), // CPU Load
-                                cells[6].querySelector('span') ? cells[6].querySelector('span').textContent.trim() : cells[6].textContent.trim(), // Fan Status
-                                cells[7].textContent.trim(), // PSU Efficiency
-                                cells[8].textContent.trim(), // PSU Power
-                                cells[9].textContent.trim()  // Model
-                            ];
-                            
-                            // Escape commas and quotes in data
-                            const escapedData = rowData.map(field => {
-                                if (field.includes(',') || field.includes('"') || field.includes('\\n')) {
-                                    return '"' + field.replace(/"/g, '""') + '"';
-                                }
-                                return field;
-                            });
-                            
-                            csvContent += escapedData.join(',') + '\\n';
-                        }
+                    const cells = row.querySelectorAll('td');
+                    if (cells.length >= 10) {
+                        // The badge span is the first child of the status cells.
+                        const health = cells[1].firstElementChild || cells[1];
+                        const fan = cells[6].firstElementChild || cells[6];
+                        parts.push(
+                            `${csvField(cells[0])},${csvField(health)},${csvField(cells[2])},` +
+                            `${csvField(cells[3])},${csvField(cells[4])},${csvField(cells[5])},` +
+                            `${csvField(fan)},${csvField(cells[7])},${csvField(cells[8])},` +
+                            `${csvField(cells[9])}\\n`
+                        );
                     }
                 });
                 
-                // Create and trigger download
-                const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
+                // Create and trigger download; Blob concatenates the
+                // newline-terminated parts natively, so no joined copy is made.
+                const blob = new Blob(parts, { type: 'text/csv;charset=utf-8;' });
                 const link = document.createElement('a');
                 link.href = URL.createObjectURL(blob);
                 link.download = filename;
@@ -2157,11 +2299,11 @@ def generate_hardware_html():
     <script src="/css/table-filter.js?v=20260716-tf-3"></script>
     <script src="/css/analysis-guard.js?v=20260707-scoped-runner-2"></script>
 </body>
-</html>"""
+</html>""")
     
     # Write HTML file atomically so a concurrent web reader or a crash mid-write
     # never observes a truncated or empty analysis page.
-    _atomic_write("monitor-results/hardware-analysis.html", html_content)
+    _atomic_write("monitor-results/hardware-analysis.html", html_parts)
 
     # Machine-readable dashboard summary. Additive to the HTML report and
     # carrying the same headline numbers/collection status the report embeds.
@@ -18,7 +18,9 @@ import stat
 import sys
 import tempfile
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 try:
     from topology_edges import (
@@ -39,6 +41,13 @@ except ImportError:  # Source-tree imports used by unit tests.
         port_key,
     )
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics.
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+
 def get_web_root():
     """Read WEB_ROOT from /etc/lldpq.conf with fallback to default"""
     web_root = "/var/www/html"  # default fallback
@@ -56,12 +65,12 @@ def load_topology_config(config_path="topology_config.yaml"):
     """Load device categorization configuration from YAML file"""
     try:
         with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
-            return config
+            config = yaml.load(f, Loader=YamlSafeLoader)
+            return _compile_rule_patterns(config)
     except FileNotFoundError:
         print(f"Warning: {config_path} not found, using default device categorization")
         # Return default config if file not found
-        return {
+        return _compile_rule_patterns({
             "device_categories": [
                 {"pattern": "inband-fw", "layer": 1, "icon": "firewall"},
                 {"pattern": "border", "layer": 2, "icon": "switch"},
@@ -72,11 +81,33 @@ def load_topology_config(config_path="topology_config.yaml"):
                 {"pattern": "switch", "layer": 7, "icon": "switch"}
             ],
             "default": {"layer": 9, "icon": "server"}
-        }
+        })
     except Exception as e:
         print(f"Error loading {config_path}: {e}")
         return {"device_categories": [], "default": {"layer": 9, "icon": "server"}}
 
+def _compile_or_none(pattern, flags=0):
+    try:
+        return re.compile(pattern, flags)
+    except re.error:
+        return None
+
+def _compile_rule_patterns(config):
+    """Compile every rule pattern once so per-device matching never recompiles.
+
+    The compiled pattern is stored next to the raw one ("_regex"); an invalid
+    regex is stored as None and matched the way the raw string always was.
+    """
+    if not isinstance(config, dict):
+        return config
+    for category in config.get("device_categories") or []:
+        category["_regex"] = _compile_or_none(category["pattern"])
+    for rule in config.get("special_rules") or []:
+        rule["_regex"] = _compile_or_none(rule["pattern"], re.IGNORECASE)
+        if rule.get("number_regex"):
+            rule["_number_regex"] = _compile_or_none(rule["number_regex"], re.IGNORECASE)
+    return config
+
 def categorize_device(device_name, config):
     """Categorize device based on configuration.
     Patterns support regex - use anchors like ^ and $ for exact matching.
@@ -87,49 +118,48 @@ def categorize_device(device_name, config):
     """
     lower = device_name.lower()
 
-    # Check special rules first
+    # Check special rules first (patterns precompiled by load_topology_config)
     for rule in config.get("special_rules", []):
-        try:
-            if re.search(rule["pattern"], device_name, re.IGNORECASE):
-                if rule.get("type") == "stagger":
-                    # Single band; the brick/zigzag (even -> lower sub-row) is drawn
-                    # client-side by cyto-app.js using the staggerRow tag (see
-                    # stagger_row_for). Honor the rule's layer/icon here.
-                    default_layer = config.get("default", {}).get("layer", 9)
-                    return rule.get("layer", default_layer), rule.get("icon", "server")
-                if rule.get("type") == "even_odd_suffix":
-                    try:
-                        number_regex = rule.get("number_regex")
-                        if number_regex:
-                            # Pull the even/odd number from a capture group anywhere in the
-                            # name (e.g. the rack field) — not just the trailing "-" segment.
-                            m = re.search(number_regex, device_name, re.IGNORECASE)
-                            if not m:
-                                break  # no match -> fall through to regular patterns
-                            device_number = int(m.group(1))
-                        else:
-                            device_number = int(device_name.split("-")[-1])
-                        if device_number % 2 == 0:
-                            return rule["even_layer"], rule["icon"]
-                        else:
-                            return rule["odd_layer"], rule["icon"]
-                    except (ValueError, IndexError, re.error):
-                        # If parsing fails, continue to regular patterns
-                        break
-        except re.error:
-            # Invalid regex, fall back to substring match
-            if rule["pattern"] in device_name:
-                pass
+        regex = rule["_regex"]
+        if regex is None:
+            # Invalid regex: special rules have no substring fallback
+            continue
+        if regex.search(device_name):
+            if rule.get("type") == "stagger":
+                # Single band; the brick/zigzag (even -> lower sub-row) is drawn
+                # client-side by cyto-app.js using the staggerRow tag (see
+                # stagger_row_for). Honor the rule's layer/icon here.
+                default_layer = config.get("default", {}).get("layer", 9)
+                return rule.get("layer", default_layer), rule.get("icon", "server")
+            if rule.get("type") == "even_odd_suffix":
+                try:
+                    if rule.get("number_regex"):
+                        # Pull the even/odd number from a capture group anywhere in the
+                        # name (e.g. the rack field) — not just the trailing "-" segment.
+                        number_regex = rule["_number_regex"]
+                        m = number_regex.search(device_name) if number_regex else None
+                        if not m:
+                            break  # no match -> fall through to regular patterns
+                        device_number = int(m.group(1))
+                    else:
+                        device_number = int(device_name.split("-")[-1])
+                    if device_number % 2 == 0:
+                        return rule["even_layer"], rule["icon"]
+                    else:
+                        return rule["odd_layer"], rule["icon"]
+                except (ValueError, IndexError):
+                    # If parsing fails, continue to regular patterns
+                    break
 
     # Check each regular pattern in order (supports regex)
     for category in config.get("device_categories", []):
-        try:
-            if re.search(category["pattern"], lower):
+        regex = category["_regex"]
+        if regex is not None:
+            if regex.search(lower):
                 return category["layer"], category["icon"]
-        except re.error:
+        elif category["pattern"] in lower:
             # Invalid regex, fall back to substring match
-            if category["pattern"] in lower:
-                return category["layer"], category["icon"]
+            return category["layer"], category["icon"]
 
     # Return default if no pattern matches
     default = config.get("default", {"layer": 9, "icon": "server"})
@@ -147,34 +177,38 @@ def stagger_row_for(device_name, config):
         if rule.get("type") != "stagger":
             continue
         try:
-            if not re.search(rule["pattern"], device_name, re.IGNORECASE):
+            regex = rule["_regex"]
+            if regex is None or not regex.search(device_name):
                 continue
-            number_regex = rule.get("number_regex")
-            if number_regex:
-                m = re.search(number_regex, device_name, re.IGNORECASE)
+            if rule.get("number_regex"):
+                number_regex = rule["_number_regex"]
+                m = number_regex.search(device_name) if number_regex else None
                 if not m:
                     continue
                 num = int(m.group(1))
             else:
                 num = int(device_name.split("-")[-1])
             return 1 if num % 2 == 0 else 0
-        except (ValueError, IndexError, re.error):
+        except (ValueError, IndexError):
             continue
     return None
 
+_CREATED_BUTTON_RE = re.compile(
+    r'\s*<button[^>]*>Created on \d{4}-\d{2}-\d{2} \d{2}-\d{2}</button>'
+)
+# Greedy prefix backtracks from the end, so this finds the last </body>
+# in any case without building a lower-cased copy of the page
+_LAST_BODY_CLOSE_RE = re.compile(r'.*(</body>)', re.IGNORECASE | re.DOTALL)
+
 def append_creation_time_to_html(html_file_path):
     timestamp = datetime.now().strftime("Created on %Y-%m-%d %H-%M")
     try:
         with open(html_file_path, "r") as f:
             content = f.read()
-        content_before = content
-        content = re.sub(
-            r'\s*<button[^>]*>Created on \d{4}-\d{2}-\d{2} \d{2}-\d{2}</button>',
-            '',
-            content
-        )
-        insert_point = content.lower().rfind('</body>')
-        if insert_point != -1:
+        content = _CREATED_BUTTON_RE.sub('', content)
+        body_close = _LAST_BODY_CLOSE_RE.match(content)
+        if body_close:
+            insert_point = body_close.start(1)
             new_div = f'        <button onclick="time()">{timestamp}</button>\n'
             new_content = content[:insert_point] + new_div + content[insert_point:]
             with open(html_file_path, "w") as f:
@@ -186,12 +220,10 @@ def parse_assets_file(assets_file_path):
     device_info = {}
     try:
         with open(assets_file_path, 'r') as file:
-            lines = file.readlines()
-            for line in lines[1:]:  # Skip timestamp
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
-                parts = line.split()
+            next(file, None)  # Skip timestamp
+            for line in file:
+                # Only the first six columns are used; leave any tail unsplit
+                parts = line.split(None, 6)
                 if len(parts) >= 6:
                     device_name = parts[0]
                     # Skip header line
@@ -224,7 +256,7 @@ def parse_endpoint_hosts(devices_yaml_path):
     patterns = []
     try:
         with open(devices_yaml_path, 'r') as file:
-            config = yaml.safe_load(file)
+            config = yaml.load(file, Loader=YamlSafeLoader)
             
         endpoint_hosts = config.get('endpoint_hosts', [])
         if not endpoint_hosts:
@@ -245,17 +277,35 @@ def parse_endpoint_hosts(devices_yaml_path):
         pass
     return host_names, patterns
 
+def _combine_host_patterns(patterns):
+    """
+    Fold compiled host patterns into one alternation so each hostname is
+    matched once instead of once per pattern. Returns None when the patterns
+    do not share flags or the combined expression does not compile.
+    """
+    flags = {pattern.flags for pattern in patterns}
+    if len(flags) != 1:
+        return None
+    try:
+        return re.compile(
+            "|".join(f"(?:{pattern.pattern})" for pattern in patterns),
+            flags.pop(),
+        )
+    except re.error:
+        return None
+
 def apply_host_patterns(patterns, all_hostnames):
     """
     Apply patterns to a list of hostnames and return matches.
     """
-    matched = set()
-    for hostname in all_hostnames:
-        for pattern in patterns:
-            if pattern.match(hostname):
-                matched.add(hostname)
-                break
-    return matched
+    combined = _combine_host_patterns(patterns) if patterns else None
+    if combined is not None:
+        return {hostname for hostname in all_hostnames if combined.match(hostname)}
+
+    return {
+        hostname for hostname in all_hostnames
+        if any(pattern.match(hostname) for pattern in patterns)
+    }
 
 def scan_lldp_neighbors(directory):
     """
@@ -274,9 +324,10 @@ def scan_lldp_neighbors(directory):
                 for line in f:
                     line = line.strip()
                     # Skip headers, separators, and empty lines
-                    if not line or line.startswith('-') or line.startswith('Port') or line.startswith('=') or line.startswith('Created'):
+                    if not line or line[0] in '-=' or line.startswith(('Port', 'Created')):
                         continue
-                    parts = line.split()
+                    # Only the first five columns are read; stop splitting there
+                    parts = line.split(None, 5)
                     # Format: Port Status Exp-Nbr Exp-Nbr-Port Act-Nbr Act-Nbr-Port Port-Status
                     # Index:  0    1      2       3            4       5            6
                     if len(parts) >= 5:
@@ -311,57 +362,94 @@ def normalize_interface_name(iface_name, known_device_names):
     return normalize_advertised_port(iface_name, None, known_device_names) or ""
 
 
-def parse_port_status(filepath):
-    """Parse port status from LLDP result file"""
+_PORT_STATUS_RE = re.compile(r'===PORT_STATUS_START===\s*(.*?)\s*===PORT_STATUS_END===', re.DOTALL)
+_PORT_SPEED_RE = re.compile(r'===PORT_SPEED_START===\s*(.*?)\s*===PORT_SPEED_END===', re.DOTALL)
+LLDP_UNAVAILABLE_MARKER = "__LLDPQ_LLDP_UNAVAILABLE__"
+
+def _port_status_from_content(data):
     port_status = {}
-    try:
-        with open(filepath, 'r') as file:
-            data = file.read()
-        
-        # Find PORT_STATUS section
-        match = re.search(r'===PORT_STATUS_START===\s*(.*?)\s*===PORT_STATUS_END===', data, re.DOTALL)
-        if match:
-            status_lines = match.group(1).strip().split('\n')
-            for line in status_lines:
-                parts = line.strip().split()
-                if len(parts) == 2:
-                    port_name, status = parts
-                    port_status[port_name] = status  # UP, DOWN, or UNKNOWN
-    except Exception:
-        pass
+    # Find PORT_STATUS section
+    match = _PORT_STATUS_RE.search(data)
+    if match:
+        status_lines = match.group(1).strip().split('\n')
+        for line in status_lines:
+            parts = line.strip().split()
+            if len(parts) == 2:
+                port_name, status = parts
+                port_status[port_name] = status  # UP, DOWN, or UNKNOWN
     return port_status
 
-def parse_port_speed(filepath):
-    """Parse port speed from LLDP result file (in Mbps)"""
+def _port_speed_from_content(data):
     port_speed = {}
-    try:
-        with open(filepath, 'r') as file:
-            data = file.read()
-        
-        # Find PORT_SPEED section
-        match = re.search(r'===PORT_SPEED_START===\s*(.*?)\s*===PORT_SPEED_END===', data, re.DOTALL)
-        if match:
-            speed_lines = match.group(1).strip().split('\n')
-            for line in speed_lines:
-                parts = line.strip().split()
-                if len(parts) == 2:
-                    port_name, speed = parts
-                    try:
-                        port_speed[port_name] = int(speed)  # Speed in Mbps
-                    except ValueError:
-                        pass
-    except Exception:
-        pass
+    # Find PORT_SPEED section
+    match = _PORT_SPEED_RE.search(data)
+    if match:
+        speed_lines = match.group(1).strip().split('\n')
+        for line in speed_lines:
+            parts = line.strip().split()
+            if len(parts) == 2:
+                port_name, speed = parts
+                try:
+                    port_speed[port_name] = int(speed)  # Speed in Mbps
+                except ValueError:
+                    pass
     return port_speed
 
-def lldp_collection_is_available(filepath):
-    """Placeholder files keep expected links but must not mark a node reachable."""
+def _read_lldp_file(filepath):
     try:
         with open(filepath, "r", encoding="utf-8", errors="replace") as file:
-            return "__LLDPQ_LLDP_UNAVAILABLE__" not in file.read()
+            return file.read()
     except OSError:
-        return False
+        return None
+
+def parse_lldp_file(filepath):
+    """Read one LLDP result file once and parse everything the passes need.
+
+    Returns (content, port_status, port_speed, available); content is None
+    when the file cannot be read.  Placeholder files keep expected links but
+    are not available, so they must not mark a node reachable.
+    """
+    data = _read_lldp_file(filepath)
+    if data is None:
+        return None, {}, {}, False
+    return (
+        data,
+        _port_status_from_content(data),
+        _port_speed_from_content(data),
+        LLDP_UNAVAILABLE_MARKER not in data,
+    )
+
+LLDP_PARSE_WORKERS = 16
+
+def parse_lldp_files(filepaths):
+    """parse_lldp_file() for every path, in input order.
+
+    The per-file work is mostly the read, which releases the GIL, so a thread
+    pool overlaps the I/O of large fleets without shipping every capture's
+    content back from worker processes.
+    """
+    workers = min(LLDP_PARSE_WORKERS, len(filepaths))
+    if workers <= 1:
+        return [parse_lldp_file(filepath) for filepath in filepaths]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_lldp_file, filepaths))
+
+LLDP_RESULT_SUFFIX = "_lldp_result.ini"
+
+def list_lldp_result_files(directory):
+    """Return (raw device name, path) for each per-device LLDP capture.
 
+    One os.scandir pass; every later pass over the captures reuses the list
+    instead of listing the directory and joining paths again.
+    """
+    with os.scandir(directory) as entries:
+        return [
+            (entry.name[:-len(LLDP_RESULT_SUFFIX)], entry.path)
+            for entry in entries
+            if entry.name.endswith(LLDP_RESULT_SUFFIX)
+        ]
+
+@lru_cache(maxsize=64)
 def format_speed(speed_mbps):
     """Format speed in Mbps to human readable (e.g., 400Gbps)"""
     if not speed_mbps or speed_mbps == 0:
@@ -386,7 +474,7 @@ def parse_lldp_results(
     all_port_status = {}
     all_port_speed = {}
 
-    known_device_names_for_normalization = set(device_info.keys())
+    known_device_names_for_normalization = set(device_info)
     known_device_names_for_normalization.update(hosts_only_devices)
     known_device_names_for_normalization.update(known_device_names)
 
@@ -449,37 +537,30 @@ def parse_lldp_results(
     link_id = 0
     reachable_devices = set()
 
-    # First pass: collect ALL port status and speed from all devices
-    for filename in os.listdir(directory):
-        if not filename.endswith("_lldp_result.ini"):
-            continue
-        filepath = os.path.join(directory, filename)
-        raw_device_name = filename.split("_lldp_result.ini")[0]
+    lldp_files = list_lldp_result_files(directory)
+
+    # First pass: collect ALL port status and speed from all devices.  Each
+    # file is read once here and its content reused by the later passes.
+    lldp_contents = []
+    parsed_files = parse_lldp_files([filepath for _, filepath in lldp_files])
+    for (raw_device_name, _), parsed in zip(lldp_files, parsed_files):
+        data, port_status, port_speed, available = parsed
+        lldp_contents.append((raw_device_name, data))
         device_name = device_node_names.get(
             resolver.key(raw_device_name), resolver.canonical(raw_device_name)
         )
-        all_port_status[device_name] = parse_port_status(filepath)
-        all_port_speed[device_name] = parse_port_speed(filepath)
-        if lldp_collection_is_available(filepath):
+        all_port_status[device_name] = port_status
+        all_port_speed[device_name] = port_speed
+        if available:
             reachable_devices.add(device_name)
 
     # Second pass: process LLDP data and create links
-    for filename in os.listdir(directory):
-        filepath = os.path.join(directory, filename)
-
-        if not filename.endswith("_lldp_result.ini"):
+    for raw_device_name, data in lldp_contents:
+        if data is None:
             continue
-
-        raw_device_name = filename.split("_lldp_result.ini")[0]
         device_name_from_lldp = device_node_names.get(
             resolver.key(raw_device_name), resolver.canonical(raw_device_name)
         )
-        
-        try:
-            with open(filepath, 'r') as file:
-                data = file.read()
-        except FileNotFoundError:
-            continue
 
         for neighbor in iter_lldp_neighbors(
                 data,
@@ -492,6 +573,10 @@ def parse_lldp_results(
                 continue
             if is_eth0(interface_name) or is_eth0(tgt_ifname):
                 continue
+            # Port names repeat across links, keys and status lookups; share one
+            # object per name (device names already come from device_node_names)
+            interface_name = sys.intern(interface_name)
+            tgt_ifname = sys.intern(tgt_ifname)
             source_node_name = device_node_names.get(resolver.key(device_name_from_lldp))
             target_node_name = device_node_names.get(resolver.key(neighbor_device))
             if source_node_name and target_node_name:
@@ -519,10 +604,9 @@ def parse_lldp_results(
                 topology_data["links"].append(link)
                 link_id += 1
 
-                # Add to all_lldp_links_found for matching with topology.dot
+                # Add to all_lldp_links_found for matching with topology.dot; one
+                # direction is enough as matching uses direction-independent keys
                 all_lldp_links_found.add((source_node_name, interface_name, target_node_name, tgt_ifname))
-                # Also add reverse for bidirectional matching
-                all_lldp_links_found.add((target_node_name, tgt_ifname, source_node_name, interface_name))
 
 
     # Mark unreachable managed devices as "unknown" — but NOT hosts/servers/endpoints.
@@ -579,7 +663,7 @@ def generate_topology_file(output_filename, directory, assets_file_path, devices
 
     # hosts_only_devices = hosts in host_names but NOT in device_info (assets.ini)
     # These will get their icon/layer from topology_config.yaml via categorize_device()
-    hosts_only_devices = host_names - set(device_info.keys())
+    hosts_only_devices = host_names - device_info.keys()
 
     # Parse LLDP to discover all devices (now includes pattern-matched hosts)
     topology_data, device_nodes, current_link_id, all_lldp_links_found, all_port_status, all_port_speed = parse_lldp_results(
@@ -591,7 +675,10 @@ def generate_topology_file(output_filename, directory, assets_file_path, devices
         list(device_nodes) + list(topology_device_names)
     )
     def _link_key(s_dev, s_if, t_dev, t_if):
-        return (resolver.key(s_dev), port_key(s_if), resolver.key(t_dev), port_key(t_if))
+        # Endpoints in sorted order, so A->B and B->A share one key
+        source = (resolver.key(s_dev), port_key(s_if))
+        target = (resolver.key(t_dev), port_key(t_if))
+        return (source, target) if source <= target else (target, source)
     defined_links_lc = {_link_key(*dl) for dl in defined_links}
     all_lldp_links_found_lc = {_link_key(*ll) for ll in all_lldp_links_found}
     device_nodes_lc = {resolver.key(name): nid for name, nid in device_nodes.items()}
@@ -603,20 +690,14 @@ def generate_topology_file(output_filename, directory, assets_file_path, devices
         src_ifname = link["srcIfName"]
         tgt_ifname = link["tgtIfName"]
 
-        forward_link_tuple = (src_device, src_ifname, tgt_device, tgt_ifname)
-        reverse_link_tuple = (tgt_device, tgt_ifname, src_device, src_ifname)
-
-        if _link_key(*forward_link_tuple) not in defined_links_lc and _link_key(*reverse_link_tuple) not in defined_links_lc:
+        if _link_key(src_device, src_ifname, tgt_device, tgt_ifname) not in defined_links_lc:
             link["is_missing"] = "fail"
 
     final_links_to_add = []
 
     for defined_link in defined_links:
         src_device, src_ifname, tgt_device, tgt_ifname = defined_link
-        forward_link_tuple = (src_device, src_ifname, tgt_device, tgt_ifname)
-        reverse_link_tuple = (tgt_device, tgt_ifname, src_device, src_ifname)
-
-        if _link_key(*forward_link_tuple) not in all_lldp_links_found_lc and _link_key(*reverse_link_tuple) not in all_lldp_links_found_lc:
+        if _link_key(src_device, src_ifname, tgt_device, tgt_ifname) not in all_lldp_links_found_lc:
 
             src_key = resolver.key(src_device)
             tgt_key = resolver.key(tgt_device)
@@ -660,22 +741,22 @@ def generate_topology_file(output_filename, directory, assets_file_path, devices
         src_ifname = link["srcIfName"]
         tgt_ifname = link["tgtIfName"]
 
-        current_link_tuple = _link_key(src_device, src_ifname, tgt_device, tgt_ifname)
-        reverse_link_tuple = _link_key(tgt_device, tgt_ifname, src_device, src_ifname)
+        link_key = _link_key(src_device, src_ifname, tgt_device, tgt_ifname)
 
-        if current_link_tuple not in seen_links_for_dedup and reverse_link_tuple not in seen_links_for_dedup:
+        if link_key not in seen_links_for_dedup:
             unique_links_filtered.append(link)
-            seen_links_for_dedup.add(current_link_tuple)
+            seen_links_for_dedup.add(link_key)
         else:
             pass
 
     topology_data["links"] = unique_links_filtered
 
     final_nodes_set = {resolver.key(name) for name in device_info}
-
-    for link in topology_data["links"]:
-        final_nodes_set.add(resolver.key(link["srcDevice"]))
-        final_nodes_set.add(resolver.key(link["tgtDevice"]))
+    final_nodes_set.update(
+        resolver.key(name)
+        for link in topology_data["links"]
+        for name in (link["srcDevice"], link["tgtDevice"])
+    )
 
     topology_data["nodes"] = [
         node for node in topology_data["nodes"]
@@ -685,10 +766,11 @@ def generate_topology_file(output_filename, directory, assets_file_path, devices
     # Natural sort so "...-1-2" comes before "...-1-10" (numeric-aware ordering)
     topology_data["nodes"].sort(key=lambda x: [int(t) if t.isdigit() else t.lower() for t in re.split(r'(\d+)', x["name"])])
 
-    id_map = {node["id"]: new_id for new_id, node in enumerate(topology_data["nodes"])}
-
-    for node in topology_data["nodes"]:
-        node["id"] = id_map[node["id"]]
+    # Renumber nodes in sorted order, recording old -> new ids as we go
+    id_map = {}
+    for new_id, node in enumerate(topology_data["nodes"]):
+        id_map[node["id"]] = new_id
+        node["id"] = new_id
 
     for link in topology_data["links"]:
         link["source"] = id_map[link["source"]]
@@ -722,7 +804,10 @@ def generate_topology_file(output_filename, directory, assets_file_path, devices
                 except PermissionError:
                     pass
             file.write("var topologyData = ")
-            json.dump(topology_data, file, indent=4)
+            # Compact, one-shot dumps: the file is only evaluated by the
+            # topology page, and json.dump (streamed, indented) cannot use the
+            # C encoder and roughly doubles the file size.
+            file.write(json.dumps(topology_data, separators=(",", ":")))
             file.write(";")
             file.flush()
             os.fsync(file.fileno())
@@ -15,8 +15,10 @@ import time
 import collections
 import stat
 import tempfile
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, NamedTuple
 from dataclasses import dataclass, asdict
 
@@ -43,6 +45,186 @@ def _short_window_cell(value: int) -> str:
     return str(value) if value else "&mdash;"
 
 
+@lru_cache(maxsize=65536)
+def _split_port_name(port_name: str):
+    """Split a "device:interface" port key; bare names belong to "unknown"."""
+    if ':' in port_name:
+        device, interface = port_name.split(':', 1)
+        return device, interface
+    return "unknown", port_name
+
+
+# One flap table row, filled with a single % format per port.
+_FLAP_ROW_TEMPLATE = """
+        <tr class="flap-row" data-device-key="%s" data-status="%s" data-flap-status="%s" data-port-key="%s" onclick="toggleFlapDetails(this)">
+            <td>%s</td>
+            <td>%s</td>
+            <td><span class="%s">%s</span></td>
+            <td data-value="%s">%s</td>
+            <td data-value="%s">%s</td>
+            <td data-value="%s">%s</td>
+            <td data-value="%s">%s</td>
+            <td data-value="%s">%s</td>
+            <td data-value="%s">%s</td>
+            <td data-value="%s"><span class="%s">%s</span></td>
+        </tr>"""
+
+# Status badge per grade (anything else renders as a warning badge).
+_FLAP_BADGE_CLASSES = {
+    "ok": "badge badge-green",
+    "critical": "badge badge-red",
+}
+
+# The cumulative counter can be large on a healthy old device; its colour
+# follows the current threshold grade, not the lifetime total, using the
+# .flap-* palette from the page stylesheet.
+_FLAP_TRANSITION_CLASSES = {
+    "critical": "flap-critical",
+    "warning": "flap-warning",
+}
+
+
+# Static page head and stylesheet for the flap report, shared by every export.
+_FLAP_PAGE_HEAD = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Link Flap Detection Results</title>
+    <link rel="shortcut icon" href="/png/favicon.ico">
+    <link rel="stylesheet" type="text/css" href="/css/select2.min.css">
+    <link rel="stylesheet" type="text/css" href="/css/table-filter.css?v=20260716-tf-3">
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; background: #1e1e1e; color: #d4d4d4; padding: 20px; min-height: 100vh; }
+        .page-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 20px; padding-bottom: 15px; border-bottom: 1px solid #404040; }
+        .page-title { font-size: 24px; font-weight: 600; color: #76b900; }
+        .last-updated { font-size: 13px; color: #888; }
+        .dashboard-section { background: #2d2d2d; border-radius: 8px; margin-bottom: 20px; overflow: hidden; }
+        .section-header { padding: 12px 16px; background: #333; font-weight: 600; font-size: 14px; color: #76b900; display: flex; align-items: center; gap: 10px; border-bottom: 1px solid #404040; }
+        .section-content { padding: 16px; }
+        .section-content-table { padding: 0; }
+        .collapsible > .section-header { cursor: pointer; user-select: none; }
+        .collapsible > .section-header:hover { background: #3a3a3a; }
+        .collapsible .collapse-chevron { margin-left: auto; flex-shrink: 0; color: #888; transition: transform 0.2s ease; }
+        .collapsible:not(.collapsed) .collapse-chevron { transform: rotate(90deg); }
+        .collapsible.collapsed > .section-content { display: none; }
+        .summary-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(140px, 1fr)); gap: 12px; }
+        .summary-card { background: #252526; padding: 15px; border-radius: 6px; border-left: 3px solid #76b900; cursor: pointer; transition: all 0.2s ease; }
+        .summary-card:hover { background: #2d2d2d; transform: translateY(-1px); }
+        .summary-card.active { background: #333; border-left-width: 5px; }
+        .card-excellent { border-left-color: #76b900; }
+        .card-warning { border-left-color: #ff9800; }
+        .card-critical { border-left-color: #f44336; }
+        .card-info { border-left-color: #4fc3f7; }
+        .metric { font-size: 22px; font-weight: bold; color: #d4d4d4; }
+        .metric-label { font-size: 12px; color: #888; margin-top: 4px; }
+        .flap-excellent { color: #76b900; font-weight: bold; }
+        .flap-good { color: #8bc34a; font-weight: bold; }
+        .flap-warning { color: #ff9800; font-weight: bold; }
+        .flap-critical { color: #f44336; font-weight: bold; }
+        .badge { display: inline-block; padding: 3px 10px; border-radius: 4px; font-size: 11px; font-weight: 600; text-transform: uppercase; }
+        .badge-green { background: rgba(118, 185, 0, 0.2); color: #76b900; }
+        .badge-red { background: rgba(244, 67, 54, 0.2); color: #ff6b6b; }
+        .badge-orange { background: rgba(255, 152, 0, 0.2); color: #ffb74d; }
+        .status-ok { color: #76b900; font-weight: bold; }
+        .status-flapping { color: #f44336; font-weight: bold; }
+        .status-flapped { color: #ff9800; font-weight: bold; }
+        .flap-table { width: 100%; border-collapse: collapse; font-size: 13px; }
+        .flap-table th, .flap-table td { border: 1px solid #404040; padding: 10px 12px; text-align: left; }
+        .flap-table th { background: #333; color: #76b900; font-weight: 600; font-size: 12px; }
+        .flap-table tbody tr { background: #252526; }
+        .flap-table tbody tr:hover { background: #2d2d2d; }
+        .sortable { cursor: pointer; user-select: none; padding-right: 20px; }
+        .sortable:hover { background: #3c3c3c; }
+        .sort-arrow { font-size: 10px; color: #666; margin-left: 5px; opacity: 0.5; }
+        .sort-arrow::before { content: '▲▼'; }
+        .sortable.asc .sort-arrow::before { content: '▲'; color: #76b900; opacity: 1; }
+        .sortable.desc .sort-arrow::before { content: '▼'; color: #76b900; opacity: 1; }
+        .sortable.asc .sort-arrow, .sortable.desc .sort-arrow { opacity: 1; }
+        .filter-info { text-align: center; padding: 10px 15px; margin: 15px 16px; background: rgba(118, 185, 0, 0.1); border: 1px solid rgba(118, 185, 0, 0.3); border-radius: 6px; color: #76b900; display: none; font-size: 13px; }
+        .filter-info button { margin-left: 10px; padding: 4px 10px; background: #76b900; color: #000; border: none; border-radius: 4px; cursor: pointer; font-size: 12px; }
+        .anomaly-card { margin: 10px 0; padding: 12px 15px; background: #252526; border-radius: 6px; border-left: 3px solid #f44336; cursor: pointer; transition: background 0.15s ease; }
+        .anomaly-card:hover { background: #2f2f30; }
+        .anomaly-card.warning { border-left-color: #ff9800; }
+        .anomaly-card h4 { color: #d4d4d4; margin-bottom: 8px; font-size: 14px; }
+        .anomaly-card p { font-size: 13px; color: #888; margin: 4px 0; }
+        .anomaly-card .anomaly-meta { font-size: 12px; color: #9e9e9e; margin: 2px 0 6px; }
+        .anomaly-card .anomaly-recent { font-size: 12px; color: #9e9e9e; margin-top: 6px; }
+        .sev-badge { font-size: 11px; font-weight: 600; padding: 2px 8px; border-radius: 10px; }
+        .sev-badge.sev-crit { background: rgba(244,67,54,0.15); color: #ff8a80; border: 1px solid #7a2a24; }
+        .sev-badge.sev-warn { background: rgba(255,152,0,0.15); color: #ffb74d; border: 1px solid #6d511d; }
+        .btn { padding: 8px 14px; border: none; border-radius: 4px; font-size: 13px; font-weight: 500; cursor: pointer; transition: all 0.2s; display: flex; align-items: center; gap: 6px; }
+        .btn-primary { background: linear-gradient(0deg, #76b900 0%, #5a8c00 100%); color: white; }
+        .btn-primary:hover { background: linear-gradient(0deg, #8bd400 0%, #6ba000 100%); }
+        .btn-secondary { background: linear-gradient(0deg, #4fc3f7 0%, #0288d1 100%); color: white; }
+        .btn-secondary:hover { background: linear-gradient(0deg, #81d4fa 0%, #039be5 100%); }
+        .action-buttons { display: flex; gap: 10px; align-items: center; }
+        .device-search-container { display: flex; align-items: center; gap: 8px; }
+        .device-search-container .select2-container { min-width: 200px; }
+        .device-search-container .select2-container--default .select2-selection--single { height: 34px; border: 1px solid #555; border-radius: 4px; background: #3c3c3c; display: flex; align-items: center; }
+        .device-search-container .select2-container--default .select2-selection--single .select2-selection__rendered { line-height: 34px; color: #d4d4d4; padding-left: 10px; font-size: 13px; }
+        .device-search-container .select2-container--default .select2-selection--single .select2-selection__arrow { height: 34px; }
+        .device-search-container .select2-container--default .select2-selection--single .select2-selection__placeholder { color: #888; }
+        .select2-dropdown { background: #2d2d2d; border: 1px solid #555; }
+        .select2-container--default .select2-search--dropdown .select2-search__field { background: #3c3c3c; border: 1px solid #555; color: #d4d4d4; }
+        .select2-container--default .select2-results__option { color: #d4d4d4; padding: 8px 12px; }
+        .select2-container--default .select2-results__option--highlighted[aria-selected] { background: #76b900; color: #000; }
+        .select2-container--default .select2-results__option[aria-selected=true] { background: #3c3c3c; }
+        .clear-search-btn { background: #f44336; color: white; border: none; padding: 6px 10px; border-radius: 4px; cursor: pointer; font-size: 12px; display: none; }
+        .clear-search-btn:hover { background: #d32f2f; }
+        ::-webkit-scrollbar { width: 8px; height: 8px; }
+        ::-webkit-scrollbar-track { background: #1e1e1e; }
+        ::-webkit-scrollbar-thumb { background: #404040; border-radius: 4px; }
+        ::-webkit-scrollbar-thumb:hover { background: #555; }
+        @keyframes spin { from { transform: rotate(0deg); } to { transform: rotate(360deg); } }
+        
+        /* Custom fast tooltip */
+        .info-tooltip {
+            position: relative;
+            cursor: help;
+        }
+        .info-tooltip::after {
+            content: attr(data-tooltip);
+            position: absolute;
+            bottom: 100%;
+            left: 50%;
+            transform: translateX(-50%);
+            background: #333;
+            color: #fff;
+            padding: 6px 10px;
+            border-radius: 4px;
+            font-size: 11px;
+            font-weight: normal;
+            white-space: nowrap;
+            opacity: 0;
+            visibility: hidden;
+            transition: opacity 0.1s, visibility 0.1s;
+            z-index: 1000;
+            pointer-events: none;
+        }
+        .info-tooltip:hover::after {
+            opacity: 1;
+            visibility: visible;
+        }
+        .coverage-banner { margin: 0 0 16px; padding: 10px 14px; background: #35270f; color: #ffb74d; border: 1px solid #6d511d; border-radius: 6px; font-size: 13px; }
+        .empty-row td { text-align: center; color: #888; padding: 30px; }
+        .flap-table tbody tr.flap-row { cursor: pointer; }
+        .detail-row td { padding: 0; border: 1px solid #404040; }
+        .detail-panel { padding: 14px 20px 18px; background: #202020; border-left: 3px solid #ff9800; }
+        .detail-title { color: #ffb300; font-weight: 700; margin-bottom: 10px; font-size: 13px; }
+        .detail-note { margin: 0 0 10px; padding: 10px 12px; background: #362b10; border: 1px solid #8b6700; color: #ffc107; border-radius: 4px; font-size: 12px; }
+        .event-table { width: 100%; border-collapse: collapse; font-size: 12px; margin-top: 4px; }
+        .event-table th, .event-table td { border: 1px solid #3a3a3a; padding: 6px 8px; text-align: left; }
+        .event-table th { background: #2a2a2a; color: #9ccc65; font-weight: 600; }
+        .event-empty { color: #888; font-size: 12px; padding: 4px 0; }
+    </style>
+    <style id="flap-row-filter"></style>
+</head>
+<body>"""
+
+
 class FlapStatus(Enum):
     """flap status"""
     OK = "ok"
@@ -58,6 +240,56 @@ class FlapPeriod(Enum):
     FLAP_12_HRS = 12 * 60 * 60
     FLAP_24_HRS = 24 * 60 * 60
 
+# Window lengths in ascending order, for bisecting an event's age into them,
+# and the matching counter keys ("flap_30_sec", ...)
+_FLAP_PERIODS_ASCENDING = tuple(sorted(FlapPeriod, key=lambda period: period.value))
+_FLAP_PERIOD_SECONDS = tuple(period.value for period in _FLAP_PERIODS_ASCENDING)
+_FLAP_PERIOD_NAMES = tuple(period.name.lower() for period in _FLAP_PERIODS_ASCENDING)
+# Legacy events carry no poll interval and only ever count from 1h upwards
+_LEGACY_MIN_PERIOD_SECONDS = FlapPeriod.FLAP_1_HR.value
+
+def _flap_counters(flaps, curr_time: float) -> Dict[str, int]:
+    """Per-window flap totals for one port's history as of curr_time."""
+    # History is appended in time order, so a quiet port whose newest event is
+    # already outside the widest window has nothing to count.
+    if not flaps or (
+        len(flaps[-1]) >= 3
+        and curr_time - float(flaps[-1][0]) > _FLAP_PERIOD_SECONDS[-1]
+    ):
+        return dict.fromkeys(_FLAP_PERIOD_NAMES, 0)
+    # Windows are nested, so each event is filed once under the narrowest
+    # window it fits and the per-window totals are a running sum of those.
+    narrowest = [0] * (len(_FLAP_PERIOD_SECONDS) + 1)
+    for event in flaps:
+        if len(event) < 3:
+            continue
+        flap_time, _, flap_count = event[:3]
+        sample_age = max(0.0, curr_time - float(flap_time))
+        if len(event) >= 5:
+            # Count only when the entire observation interval fits
+            # inside the requested lookback. A ten-minute poll can
+            # therefore populate 1h/12h/24h, never 30s/1m/5m.
+            needed = sample_age + max(0.0, float(event[4]))
+        else:
+            # Legacy entries lack observation-window metadata. Keep
+            # them out of short buckets where they could be false.
+            needed = max(sample_age, _LEGACY_MIN_PERIOD_SECONDS)
+        index = bisect_left(_FLAP_PERIOD_SECONDS, needed)
+        if index < len(_FLAP_PERIOD_SECONDS):
+            narrowest[index] += int(flap_count)
+
+    flap_counters = {}
+    running = 0
+    for name, count in zip(_FLAP_PERIOD_NAMES, narrowest):
+        running += count
+        flap_counters[name] = running
+    return flap_counters
+
+
+# Problems-first position of each grade in the flap table and export rows
+_FLAP_STATUS_SORT_ORDER = {FlapStatus.CRITICAL: 0, FlapStatus.WARNING: 1}
+
+
 @dataclass
 class CarrierTransitionData:
     """Carrier transition data for a port"""
@@ -361,51 +593,33 @@ class LinkFlapAnalyzer:
     def check_flapping(self) -> bool:
         """Return True when any port crosses the configured hourly warning rate."""
         warning = self.thresholds["warning_flaps_per_hour"]
+        if warning <= 0:
+            # A disabled warning threshold can never be crossed.
+            return False
+        curr_time = time.time()
         for port_name in self.carrier_transitions_stats:
-            count = self.calculate_flapping_rate(port_name)["flap_1_hr"]
-            if warning > 0 and count >= warning:
+            count = _flap_counters(self.flapping_hist.get(port_name, ()), curr_time)["flap_1_hr"]
+            if count >= warning:
                 print(f"Flap threshold exceeded on {port_name}: {count} flaps in last hour")
                 return True
         return False
     
     def calculate_flapping_rate(self, port_name: str) -> Dict[str, int]:
         """Calculate flapping rates for different time periods"""
-        flap_counters = {period.name.lower(): 0 for period in FlapPeriod}
-        
-        curr_time = time.time()
-        flaps = self.flapping_hist.get(port_name, [])
-        
-        if flaps:
-            for event in flaps:
-                if len(event) < 3:
-                    continue
-                flap_time, _, flap_count = event[:3]
-                sample_age = max(0.0, curr_time - float(flap_time))
-                is_interval_aware = len(event) >= 5
-                interval_seconds = max(0.0, float(event[4])) if is_interval_aware else None
-
-                for period in FlapPeriod:
-                    if is_interval_aware:
-                        # Count only when the entire observation interval fits
-                        # inside the requested lookback. A ten-minute poll can
-                        # therefore populate 1h/12h/24h, never 30s/1m/5m.
-                        fits = sample_age + interval_seconds <= period.value
-                    else:
-                        # Legacy entries lack observation-window metadata. Keep
-                        # them out of short buckets where they could be false.
-                        fits = period.value >= FlapPeriod.FLAP_1_HR.value and sample_age <= period.value
-                    if fits:
-                        flap_counters[period.name.lower()] += int(flap_count)
-        
-        return flap_counters
+        return _flap_counters(self.flapping_hist.get(port_name, ()), time.time())
     
     def _build_port_cache(self):
         """Build cache of all port statuses and counters - call once before bulk operations"""
         self._port_cache = {}
         self._export_rows = None
+        # One clock reading for the whole fleet, so every port is graded at
+        # the same instant.
+        curr_time = time.time()
+        flapping_hist = self.flapping_hist
+        status_for_counters = self._status_for_counters
         for port_name in self.carrier_transitions_stats.keys():
-            counters = self.calculate_flapping_rate(port_name)
-            status = self._status_for_counters(counters)
+            counters = _flap_counters(flapping_hist.get(port_name, ()), curr_time)
+            status = status_for_counters(counters)
             self._port_cache[port_name] = {'status': status, 'counters': counters}
 
     def _status_for_counters(self, counters: Dict[str, int]) -> FlapStatus:
@@ -425,16 +639,20 @@ class LinkFlapAnalyzer:
         
         return self._status_for_counters(counters)
     
-    def get_flap_summary(self) -> Dict[str, Any]:
-        """Get summary of all flapping ports - uses cache for performance"""
+    def get_flap_report(self, now: Optional[datetime] = None):
+        """Return (summary, anomalies) from a single pass over the port cache,
+        timestamped with now (default: the current time)."""
+        if now is None:
+            now = datetime.now()
         summary = {
             "total_ports": len(self.carrier_transitions_stats),
             "critical_ports": [],
             "warning_ports": [],
             "ok_ports": [],
             "collection_coverage": dict(self.collection_coverage),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat()
         }
+        anomalies = []
         
         # Build cache if empty
         if not self._port_cache:
@@ -451,35 +669,16 @@ class LinkFlapAnalyzer:
                 "last_transitions": self.carrier_transitions_stats.get(port_name, 0)
             }
             
-            if status == FlapStatus.CRITICAL:
-                summary["critical_ports"].append(port_info)
-            elif status == FlapStatus.WARNING:
-                summary["warning_ports"].append(port_info)
-            else:
+            if status == FlapStatus.OK:
                 summary["ok_ports"].append(port_info)
+                continue
 
-        # Compatibility aliases for consumers upgraded independently.
-        summary["flapping_ports"] = summary["critical_ports"]
-        summary["flapped_ports"] = summary["warning_ports"]
-        
-        return summary
-    
-    def detect_flap_anomalies(self) -> List[Dict[str, Any]]:
-        """Detect interface flapping anomalies - uses cache for performance"""
-        anomalies = []
-        
-        # Build cache if empty
-        if not self._port_cache:
-            self._build_port_cache()
-        
-        for port_name, cached in self._port_cache.items():
-            status = cached['status']
-            counters = cached['counters']
-            
+            device, interface = _split_port_name(port_name)
             if status == FlapStatus.CRITICAL:
+                summary["critical_ports"].append(port_info)
                 anomalies.append({
-                    "device": port_name.split(':', 1)[0] if ':' in port_name else "unknown",
-                    "interface": port_name.split(':', 1)[1] if ':' in port_name else port_name,
+                    "device": device,
+                    "interface": interface,
                     "type": "CRITICAL_FLAPPING",
                     "severity": "critical",
                     "message": f"Port {port_name} crossed the critical threshold ({counters['flap_1_hr']} flaps in last hour)",
@@ -492,9 +691,10 @@ class LinkFlapAnalyzer:
                 })
             
             elif status == FlapStatus.WARNING:
+                summary["warning_ports"].append(port_info)
                 anomalies.append({
-                    "device": port_name.split(':', 1)[0] if ':' in port_name else "unknown",
-                    "interface": port_name.split(':', 1)[1] if ':' in port_name else port_name,
+                    "device": device,
+                    "interface": interface,
                     "type": "WARNING_FLAPPING",
                     "severity": "warning",
                     "message": f"Port {port_name} crossed the warning threshold ({counters['flap_1_hr']} flaps in last hour)",
@@ -505,8 +705,20 @@ class LinkFlapAnalyzer:
                     },
                     "action": f"Monitor {port_name} closely and investigate if pattern continues"
                 })
+
+        # Compatibility aliases for consumers upgraded independently.
+        summary["flapping_ports"] = summary["critical_ports"]
+        summary["flapped_ports"] = summary["warning_ports"]
         
-        return anomalies
+        return summary, anomalies
+
+    def get_flap_summary(self) -> Dict[str, Any]:
+        """Get summary of all flapping ports - uses cache for performance"""
+        return self.get_flap_report()[0]
+    
+    def detect_flap_anomalies(self) -> List[Dict[str, Any]]:
+        """Detect interface flapping anomalies - uses cache for performance"""
+        return self.get_flap_report()[1]
 
     def set_collection_coverage(self, expected_devices, current_devices):
         expected = set(expected_devices)
@@ -527,13 +739,18 @@ class LinkFlapAnalyzer:
             return self._export_rows
         if not self._port_cache:
             self._build_port_cache()
-        rows = []
+        # Sort by severity (problems first, like BGP): rows are dealt into
+        # critical / warning / ok buckets in cache order and concatenated,
+        # which is the stable sort without a per-row key call.
+        buckets = ([], [], [])
         for port_name, cached in self._port_cache.items():
             counters = cached['counters']
-            rows.append({
-                'device': port_name.split(':', 1)[0] if ':' in port_name else "unknown",
-                'interface': port_name.split(':', 1)[1] if ':' in port_name else port_name,
-                'status': cached['status'].value,
+            status = cached['status']
+            device, interface = _split_port_name(port_name)
+            buckets[_FLAP_STATUS_SORT_ORDER.get(status, 2)].append({
+                'device': device,
+                'interface': interface,
+                'status': status.value,
                 'flaps_30s': counters['flap_30_sec'],
                 'flaps_1m': counters['flap_1_min'],
                 'flaps_5m': counters['flap_5_min'],
@@ -542,11 +759,7 @@ class LinkFlapAnalyzer:
                 'flaps_24h': counters['flap_24_hrs'],
                 'total_transitions': self.carrier_transitions_stats.get(port_name, 0),
             })
-        # Sort by severity (problems first, like BGP)
-        rows.sort(key=lambda row: (
-            0 if row['status'] == FlapStatus.CRITICAL.value else
-            1 if row['status'] == FlapStatus.WARNING.value else 2
-        ))
+        rows = buckets[0] + buckets[1] + buckets[2]
         self._export_rows = rows
         return rows
 
@@ -555,10 +768,14 @@ class LinkFlapAnalyzer:
         # Build cache once at the start
         self._build_port_cache()
         
-        summary = self.get_flap_summary()
-        anomalies = self.detect_flap_anomalies()
+        now = datetime.now()
+        summary, anomalies = self.get_flap_report(now)
         
         # Determine overall health status
+        total_devices = len({
+            port_name.partition(':')[0]
+            for port_name in self.carrier_transitions_stats
+        })
         total_problematic = len(summary['critical_ports']) + len(summary['warning_ports'])
         stability_ratio = ((summary['total_ports'] - total_problematic) / summary['total_ports'] * 100) if summary['total_ports'] > 0 else 0
         if summary['critical_ports']:
@@ -606,143 +823,7 @@ class LinkFlapAnalyzer:
                     banner_msg += f" Missing: {shown}."
             coverage_banner = f'<div class="coverage-banner">{banner_msg}</div>'
 
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Link Flap Detection Results</title>
-    <link rel="shortcut icon" href="/png/favicon.ico">
-    <link rel="stylesheet" type="text/css" href="/css/select2.min.css">
-    <link rel="stylesheet" type="text/css" href="/css/table-filter.css?v=20260716-tf-3">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; background: #1e1e1e; color: #d4d4d4; padding: 20px; min-height: 100vh; }}
-        .page-header {{ display: flex; justify-content: space-between; align-items: center; margin-bottom: 20px; padding-bottom: 15px; border-bottom: 1px solid #404040; }}
-        .page-title {{ font-size: 24px; font-weight: 600; color: #76b900; }}
-        .last-updated {{ font-size: 13px; color: #888; }}
-        .dashboard-section {{ background: #2d2d2d; border-radius: 8px; margin-bottom: 20px; overflow: hidden; }}
-        .section-header {{ padding: 12px 16px; background: #333; font-weight: 600; font-size: 14px; color: #76b900; display: flex; align-items: center; gap: 10px; border-bottom: 1px solid #404040; }}
-        .section-content {{ padding: 16px; }}
-        .section-content-table {{ padding: 0; }}
-        .collapsible > .section-header {{ cursor: pointer; user-select: none; }}
-        .collapsible > .section-header:hover {{ background: #3a3a3a; }}
-        .collapsible .collapse-chevron {{ margin-left: auto; flex-shrink: 0; color: #888; transition: transform 0.2s ease; }}
-        .collapsible:not(.collapsed) .collapse-chevron {{ transform: rotate(90deg); }}
-        .collapsible.collapsed > .section-content {{ display: none; }}
-        .summary-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(140px, 1fr)); gap: 12px; }}
-        .summary-card {{ background: #252526; padding: 15px; border-radius: 6px; border-left: 3px solid #76b900; cursor: pointer; transition: all 0.2s ease; }}
-        .summary-card:hover {{ background: #2d2d2d; transform: translateY(-1px); }}
-        .summary-card.active {{ background: #333; border-left-width: 5px; }}
-        .card-excellent {{ border-left-color: #76b900; }}
-        .card-warning {{ border-left-color: #ff9800; }}
-        .card-critical {{ border-left-color: #f44336; }}
-        .card-info {{ border-left-color: #4fc3f7; }}
-        .metric {{ font-size: 22px; font-weight: bold; color: #d4d4d4; }}
-        .metric-label {{ font-size: 12px; color: #888; margin-top: 4px; }}
-        .flap-excellent {{ color: #76b900; font-weight: bold; }}
-        .flap-good {{ color: #8bc34a; font-weight: bold; }}
-        .flap-warning {{ color: #ff9800; font-weight: bold; }}
-        .flap-critical {{ color: #f44336; font-weight: bold; }}
-        .badge {{ display: inline-block; padding: 3px 10px; border-radius: 4px; font-size: 11px; font-weight: 600; text-transform: uppercase; }}
-        .badge-green {{ background: rgba(118, 185, 0, 0.2); color: #76b900; }}
-        .badge-red {{ background: rgba(244, 67, 54, 0.2); color: #ff6b6b; }}
-        .badge-orange {{ background: rgba(255, 152, 0, 0.2); color: #ffb74d; }}
-        .status-ok {{ color: #76b900; font-weight: bold; }}
-        .status-flapping {{ color: #f44336; font-weight: bold; }}
-        .status-flapped {{ color: #ff9800; font-weight: bold; }}
-        .flap-table {{ width: 100%; border-collapse: collapse; font-size: 13px; }}
-        .flap-table th, .flap-table td {{ border: 1px solid #404040; padding: 10px 12px; text-align: left; }}
-        .flap-table th {{ background: #333; color: #76b900; font-weight: 600; font-size: 12px; }}
-        .flap-table tbody tr {{ background: #252526; }}
-        .flap-table tbody tr:hover {{ background: #2d2d2d; }}
-        .sortable {{ cursor: pointer; user-select: none; padding-right: 20px; }}
-        .sortable:hover {{ background: #3c3c3c; }}
-        .sort-arrow {{ font-size: 10px; color: #666; margin-left: 5px; opacity: 0.5; }}
-        .sort-arrow::before {{ content: '▲▼'; }}
-        .sortable.asc .sort-arrow::before {{ content: '▲'; color: #76b900; opacity: 1; }}
-        .sortable.desc .sort-arrow::before {{ content: '▼'; color: #76b900; opacity: 1; }}
-        .sortable.asc .sort-arrow, .sortable.desc .sort-arrow {{ opacity: 1; }}
-        .filter-info {{ text-align: center; padding: 10px 15px; margin: 15px 16px; background: rgba(118, 185, 0, 0.1); border: 1px solid rgba(118, 185, 0, 0.3); border-radius: 6px; color: #76b900; display: none; font-size: 13px; }}
-        .filter-info button {{ margin-left: 10px; padding: 4px 10px; background: #76b900; color: #000; border: none; border-radius: 4px; cursor: pointer; font-size: 12px; }}
-        .anomaly-card {{ margin: 10px 0; padding: 12px 15px; background: #252526; border-radius: 6px; border-left: 3px solid #f44336; cursor: pointer; transition: background 0.15s ease; }}
-        .anomaly-card:hover {{ background: #2f2f30; }}
-        .anomaly-card.warning {{ border-left-color: #ff9800; }}
-        .anomaly-card h4 {{ color: #d4d4d4; margin-bottom: 8px; font-size: 14px; }}
-        .anomaly-card p {{ font-size: 13px; color: #888; margin: 4px 0; }}
-        .anomaly-card .anomaly-meta {{ font-size: 12px; color: #9e9e9e; margin: 2px 0 6px; }}
-        .anomaly-card .anomaly-recent {{ font-size: 12px; color: #9e9e9e; margin-top: 6px; }}
-        .sev-badge {{ font-size: 11px; font-weight: 600; padding: 2px 8px; border-radius: 10px; }}
-        .sev-badge.sev-crit {{ background: rgba(244,67,54,0.15); color: #ff8a80; border: 1px solid #7a2a24; }}
-        .sev-badge.sev-warn {{ background: rgba(255,152,0,0.15); color: #ffb74d; border: 1px solid #6d511d; }}
-        .btn {{ padding: 8px 14px; border: none; border-radius: 4px; font-size: 13px; font-weight: 500; cursor: pointer; transition: all 0.2s; display: flex; align-items: center; gap: 6px; }}
-        .btn-primary {{ background: linear-gradient(0deg, #76b900 0%, #5a8c00 100%); color: white; }}
-        .btn-primary:hover {{ background: linear-gradient(0deg, #8bd400 0%, #6ba000 100%); }}
-        .btn-secondary {{ background: linear-gradient(0deg, #4fc3f7 0%, #0288d1 100%); color: white; }}
-        .btn-secondary:hover {{ background: linear-gradient(0deg, #81d4fa 0%, #039be5 100%); }}
-        .action-buttons {{ display: flex; gap: 10px; align-items: center; }}
-        .device-search-container {{ display: flex; align-items: center; gap: 8px; }}
-        .device-search-container .select2-container {{ min-width: 200px; }}
-        .device-search-container .select2-container--default .select2-selection--single {{ height: 34px; border: 1px solid #555; border-radius: 4px; background: #3c3c3c; display: flex; align-items: center; }}
-        .device-search-container .select2-container--default .select2-selection--single .select2-selection__rendered {{ line-height: 34px; color: #d4d4d4; padding-left: 10px; font-size: 13px; }}
-        .device-search-container .select2-container--default .select2-selection--single .select2-selection__arrow {{ height: 34px; }}
-        .device-search-container .select2-container--default .select2-selection--single .select2-selection__placeholder {{ color: #888; }}
-        .select2-dropdown {{ background: #2d2d2d; border: 1px solid #555; }}
-        .select2-container--default .select2-search--dropdown .select2-search__field {{ background: #3c3c3c; border: 1px solid #555; color: #d4d4d4; }}
-        .select2-container--default .select2-results__option {{ color: #d4d4d4; padding: 8px 12px; }}
-        .select2-container--default .select2-results__option--highlighted[aria-selected] {{ background: #76b900; color: #000; }}
-        .select2-container--default .select2-results__option[aria-selected=true] {{ background: #3c3c3c; }}
-        .clear-search-btn {{ background: #f44336; color: white; border: none; padding: 6px 10px; border-radius: 4px; cursor: pointer; font-size: 12px; display: none; }}
-        .clear-search-btn:hover {{ background: #d32f2f; }}
-        ::-webkit-scrollbar {{ width: 8px; height: 8px; }}
-        ::-webkit-scrollbar-track {{ background: #1e1e1e; }}
-        ::-webkit-scrollbar-thumb {{ background: #404040; border-radius: 4px; }}
-        ::-webkit-scrollbar-thumb:hover {{ background: #555; }}
-        @keyframes spin {{ from {{ transform: rotate(0deg); }} to {{ transform: rotate(360deg); }} }}
-        
-        /* Custom fast tooltip */
-        .info-tooltip {{
-            position: relative;
-            cursor: help;
-        }}
-        .info-tooltip::after {{
-            content: attr(data-tooltip);
-            position: absolute;
-            bottom: 100%;
-            left: 50%;
-            transform: translateX(-50%);
-            background: #333;
-            color: #fff;
-            padding: 6px 10px;
-            border-radius: 4px;
-            font-size: 11px;
-            font-weight: normal;
-            white-space: nowrap;
-            opacity: 0;
-            visibility: hidden;
-            transition: opacity 0.1s, visibility 0.1s;
-            z-index: 1000;
-            pointer-events: none;
-        }}
-        .info-tooltip:hover::after {{
-            opacity: 1;
-            visibility: visible;
-        }}
-        .coverage-banner {{ margin: 0 0 16px; padding: 10px 14px; background: #35270f; color: #ffb74d; border: 1px solid #6d511d; border-radius: 6px; font-size: 13px; }}
-        .empty-row td {{ text-align: center; color: #888; padding: 30px; }}
-        .flap-table tbody tr.flap-row {{ cursor: pointer; }}
-        .detail-row td {{ padding: 0; border: 1px solid #404040; }}
-        .detail-panel {{ padding: 14px 20px 18px; background: #202020; border-left: 3px solid #ff9800; }}
-        .detail-title {{ color: #ffb300; font-weight: 700; margin-bottom: 10px; font-size: 13px; }}
-        .detail-note {{ margin: 0 0 10px; padding: 10px 12px; background: #362b10; border: 1px solid #8b6700; color: #ffc107; border-radius: 4px; font-size: 12px; }}
-        .event-table {{ width: 100%; border-collapse: collapse; font-size: 12px; margin-top: 4px; }}
-        .event-table th, .event-table td {{ border: 1px solid #3a3a3a; padding: 6px 8px; text-align: left; }}
-        .event-table th {{ background: #2a2a2a; color: #9ccc65; font-weight: 600; }}
-        .event-empty {{ color: #888; font-size: 12px; padding: 4px 0; }}
-    </style>
-</head>
-<body>
+        html_content = _FLAP_PAGE_HEAD + f"""
     <div data-analysis-summary="flap" data-collection-status="{coverage_status}"
          data-expected-devices="{expected_devices}"
          data-current-devices="{current_devices}"
@@ -751,7 +832,7 @@ class LinkFlapAnalyzer:
     <div class="page-header">
         <div>
             <div class="page-title">Link Flap Detection Results</div>
-            <div class="last-updated">Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</div>
+            <div class="last-updated">Last Updated: {now.strftime('%Y-%m-%d %H:%M:%S')}</div>
         </div>
         <div class="action-buttons">
             <div class="device-search-container">
@@ -780,8 +861,8 @@ class LinkFlapAnalyzer:
         </div>
         <div class="section-content">
             <div class="summary-grid">
-                <div class="summary-card card-info" id="total-devices-card" data-metric-key="flap_current_devices" data-metric-value="{len(set(port.split(':', 1)[0] for port in self.carrier_transitions_stats.keys()))}">
-                    <div class="metric" id="total-devices">{len(set(port.split(':', 1)[0] for port in self.carrier_transitions_stats.keys()))}</div>
+                <div class="summary-card card-info" id="total-devices-card" data-metric-key="flap_current_devices" data-metric-value="{total_devices}">
+                    <div class="metric" id="total-devices">{total_devices}</div>
                     <div class="metric-label">Total Devices</div>
                 </div>
                 <div class="summary-card card-info" id="total-ports-card" data-metric-key="flap_total_ports" data-metric-value="{summary['total_ports']}">
@@ -975,42 +1056,28 @@ class LinkFlapAnalyzer:
         # Build table rows using list for O(n) performance instead of O(n²) string concat
         table_rows = []
         for port in all_ports:
-            # Badge class based on status
             status_val = port['status']
-            if status_val == 'ok':
-                badge_class = 'badge badge-green'
-            elif status_val == 'critical':
-                badge_class = 'badge badge-red'
-            else:  # warning
-                badge_class = 'badge badge-orange'
-            
-            # The cumulative counter can be large on a healthy old device; its
-            # colour follows the current threshold grade, not lifetime total.
-            # Reuse the existing .flap-* palette (transition-* were never defined
-            # in the <style> block and rendered as inert grey text).
-            if status_val == "critical":
-                transition_class = "flap-critical"
-            elif status_val == "warning":
-                transition_class = "flap-warning"
-            else:
-                transition_class = "flap-excellent"
-
-            dashboard_status = "ok" if status_val == "ok" else "problematic"
-            device_key = html.escape(str(port['device']), quote=True)
-            port_key = html.escape(f"{port['device']}:{port['interface']}", quote=True)
-            table_rows.append(f"""
-        <tr class="flap-row" data-device-key="{device_key}" data-status="{dashboard_status}" data-flap-status="{status_val}" data-port-key="{port_key}" onclick="toggleFlapDetails(this)">
-            <td>{canonical(port['device'])}</td>
-            <td>{port['interface']}</td>
-            <td><span class="{badge_class}">{status_val.upper()}</span></td>
-            <td data-value="{port['flaps_30s']}">{_short_window_cell(port['flaps_30s'])}</td>
-            <td data-value="{port['flaps_1m']}">{_short_window_cell(port['flaps_1m'])}</td>
-            <td data-value="{port['flaps_5m']}">{_short_window_cell(port['flaps_5m'])}</td>
-            <td data-value="{port['flaps_1h']}">{port['flaps_1h']}</td>
-            <td data-value="{port['flaps_12h']}">{port['flaps_12h']}</td>
-            <td data-value="{port['flaps_24h']}">{port['flaps_24h']}</td>
-            <td data-value="{port['total_transitions']}"><span class="{transition_class}">{port['total_transitions']}</span></td>
-        </tr>""")
+            device = port['device']
+            interface = port['interface']
+            table_rows.append(_FLAP_ROW_TEMPLATE % (
+                html.escape(str(device), quote=True),
+                "ok" if status_val == "ok" else "problematic",
+                status_val,
+                html.escape(f"{device}:{interface}", quote=True),
+                canonical(device),
+                interface,
+                _FLAP_BADGE_CLASSES.get(status_val, 'badge badge-orange'),
+                status_val.upper(),
+                port['flaps_30s'], _short_window_cell(port['flaps_30s']),
+                port['flaps_1m'], _short_window_cell(port['flaps_1m']),
+                port['flaps_5m'], _short_window_cell(port['flaps_5m']),
+                port['flaps_1h'], port['flaps_1h'],
+                port['flaps_12h'], port['flaps_12h'],
+                port['flaps_24h'], port['flaps_24h'],
+                port['total_transitions'],
+                _FLAP_TRANSITION_CLASSES.get(status_val, 'flap-excellent'),
+                port['total_transitions'],
+            ))
         
         # Empty-state placeholder that distinguishes healthy-empty from a
         # broken/partial collection, instead of bare headers over a blank body.
@@ -1071,8 +1138,36 @@ class LinkFlapAnalyzer:
         const FLAP_DETAILS = __FLAP_DETAILS_JSON__;
         let currentFilter = 'ALL';
         let allRows = [];
+        // Per-row device name, device key and status, parallel to allRows and
+        // read once at load so filters never go back to the cells.
+        let rowDevices = [];
+        let rowDeviceKeys = [];
+        let rowStatuses = [];
         let deviceSearchActive = false;
         let selectedDevice = '';
+        // Active table filter as {attr, value}. It is rendered as one rule in
+        // #flap-row-filter, so switching filters is a single style write
+        // instead of a display write on every row.
+        let rowFilter = null;
+
+        function setRowFilter(attr, value) {
+            rowFilter = attr ? { attr: attr, value: value } : null;
+            document.getElementById('flap-row-filter').textContent = rowFilter
+                ? '#flap-data tr.flap-row:not([' + attr + '="' + CSS.escape(value) + '"]) { display: none; }'
+                : '';
+        }
+
+        function rowMatchesFilter(row) {
+            return !rowFilter || row.getAttribute(rowFilter.attr) === rowFilter.value;
+        }
+
+        function countMatches(values, value) {
+            let count = 0;
+            for (let i = 0; i < values.length; i++) {
+                if (values[i] === value) count++;
+            }
+            return count;
+        }
 
         function removeFlapDetailRows() {
             document.querySelectorAll('#flap-data tr.detail-row').forEach(function(r) {
@@ -1155,6 +1250,9 @@ class LinkFlapAnalyzer:
             // Store all data table rows for filtering (exclude the empty-state
             // placeholder and any dynamically-added detail rows).
             allRows = Array.from(document.querySelectorAll('#flap-data tr.flap-row'));
+            rowDevices = allRows.map(row => row.cells[0]?.textContent?.trim() || '');
+            rowDeviceKeys = allRows.map(row => row.dataset.deviceKey);
+            rowStatuses = allRows.map(row => row.dataset.status);
             
             // Add click events to summary cards
             setupCardEvents();
@@ -1221,20 +1319,21 @@ class LinkFlapAnalyzer:
                 card.classList.remove('active');
             });
             
-            let filteredRows = allRows;
             let filterText = '';
             
             if (filterType === 'STABLE') {
-                filteredRows = allRows.filter(row => row.dataset.status === 'ok');
-                filterText = 'Showing ' + filteredRows.length + ' Stable Ports';
+                setRowFilter('data-status', 'ok');
+                filterText = 'Showing ' + countMatches(rowStatuses, 'ok') + ' Stable Ports';
                 document.getElementById('stable-card').classList.add('active');
             } else if (filterType === 'PROBLEMATIC') {
-                filteredRows = allRows.filter(row => row.dataset.status === 'problematic');
-                filterText = 'Showing ' + filteredRows.length + ' Problematic Ports';
+                setRowFilter('data-status', 'problematic');
+                filterText = 'Showing ' + countMatches(rowStatuses, 'problematic') + ' Problematic Ports';
                 document.getElementById('problematic-card').classList.add('active');
-            } else if (filterType === 'TOTAL') {
-                filteredRows = allRows;
-                document.getElementById('total-ports-card').classList.add('active');
+            } else {
+                setRowFilter(null);
+                if (filterType === 'TOTAL') {
+                    document.getElementById('total-ports-card').classList.add('active');
+                }
             }
             
             // Show filter info for all filters except TOTAL
@@ -1244,12 +1343,6 @@ class LinkFlapAnalyzer:
             } else {
                 document.getElementById('filter-info').style.display = 'none';
             }
-            
-            // Hide all rows first
-            allRows.forEach(row => row.style.display = 'none');
-            
-            // Show filtered rows
-            filteredRows.forEach(row => row.style.display = '');
         }
         
         function clearFilter() {
@@ -1269,7 +1362,7 @@ class LinkFlapAnalyzer:
             }
             
             // Show all rows
-            allRows.forEach(row => row.style.display = '');
+            setRowFilter(null);
         }
         
         // ===== Device Search Functions =====
@@ -1306,12 +1399,10 @@ class LinkFlapAnalyzer:
         }
         
         function populateDeviceList() {
-            const deviceSet = new Set();
-            allRows.forEach(row => {
-                // First column is the device name
-                const deviceName = row.cells[0]?.textContent?.trim();
-                if (deviceName) deviceSet.add(deviceName);
-            });
+            // Stamp the device name on each row so the device filter can
+            // match it from CSS.
+            allRows.forEach((row, i) => { row.dataset.device = rowDevices[i]; });
+            const deviceSet = new Set(rowDevices.filter(Boolean));
             
             const sortedDevices = Array.from(deviceSet).sort((a, b) => 
                 a.localeCompare(b, undefined, { numeric: true, sensitivity: 'base' })
@@ -1339,16 +1430,8 @@ class LinkFlapAnalyzer:
             document.querySelectorAll('.summary-card').forEach(card => card.classList.remove('active'));
             
             // Filter table rows
-            let matchCount = 0;
-            allRows.forEach(row => {
-                const rowDeviceName = row.cells[0]?.textContent?.trim();
-                if (rowDeviceName === deviceName) {
-                    row.style.display = '';
-                    matchCount++;
-                } else {
-                    row.style.display = 'none';
-                }
-            });
+            setRowFilter('data-device', deviceName);
+            const matchCount = countMatches(rowDevices, deviceName);
             
             // Show filter info
             document.getElementById('filter-info').style.display = 'block';
@@ -1363,7 +1446,7 @@ class LinkFlapAnalyzer:
             $('#deviceSearch').val('').trigger('change');
             document.getElementById('clearSearchBtn').style.display = 'none';
             document.getElementById('filter-info').style.display = 'none';
-            allRows.forEach(row => row.style.display = '');
+            setRowFilter(null);
         }
 
         // Filter the table from an anomaly card. Matches on data-device-key so
@@ -1380,17 +1463,11 @@ class LinkFlapAnalyzer:
             currentFilter = 'ALL';
             document.querySelectorAll('.summary-card').forEach(c => c.classList.remove('active'));
 
-            let matchCount = 0;
-            let displayName = deviceKey;
-            allRows.forEach(row => {
-                if (row.dataset.deviceKey === deviceKey) {
-                    if (matchCount === 0) displayName = row.cells[0]?.textContent?.trim() || deviceKey;
-                    row.style.display = '';
-                    matchCount++;
-                } else {
-                    row.style.display = 'none';
-                }
-            });
+            setRowFilter('data-device-key', deviceKey);
+            const matchCount = countMatches(rowDeviceKeys, deviceKey);
+            // Shown name is read live from the first match so it reflects any alias.
+            const first = rowDeviceKeys.indexOf(deviceKey);
+            const displayName = first >= 0 ? allRows[first].cells[0]?.textContent?.trim() || deviceKey : deviceKey;
 
             document.getElementById('filter-info').style.display = 'block';
             document.getElementById('filter-text').textContent = 'Showing interfaces for device: ' + displayName + ' (' + matchCount + ' interfaces)';
@@ -1436,79 +1513,78 @@ class LinkFlapAnalyzer:
             removeFlapDetailRows();
             const rows = Array.from(tbody.querySelectorAll('tr.flap-row'));
 
-            rows.sort((a, b) => {
-                let aVal = a.cells[columnIndex].textContent.trim();
-                let bVal = b.cells[columnIndex].textContent.trim();
-
-                // Extract actual text for status columns (remove HTML)
-                if (type === 'flap-status') {
-                    aVal = a.cells[columnIndex].querySelector('span')?.textContent || aVal;
-                    bVal = b.cells[columnIndex].querySelector('span')?.textContent || bVal;
-                }
+            // Decorate each row with its key once, then sort on the keys only.
+            const keyed = rows.map(row => ({ row: row, key: flapSortKey(row, columnIndex, type) }));
+            let compareKeys;
+            if (type === 'number' || type === 'flap-status') {
+                compareKeys = (a, b) => a - b;
+            } else if (type === 'port') {
+                compareKeys = comparePortKeys;
+            } else {
+                compareKeys = flapTextCollator.compare;
+            }
+            const sign = direction === 'desc' ? -1 : 1;
+            keyed.sort((a, b) => sign * compareKeys(a.key, b.key));
+
+            // Re-append only the sorted data rows (detail rows already removed)
+            // through a fragment so the tbody is touched once.
+            const fragment = document.createDocumentFragment();
+            keyed.forEach(item => fragment.appendChild(item.row));
+            tbody.appendChild(fragment);
+        }
 
-                let result = 0;
-
-                switch(type) {
-                    case 'number':
-                        // Sort on the numeric data-value (em-dash cells expose 0)
-                        // instead of scraping the rendered "—" glyph.
-                        result = flapCellNumber(a, columnIndex) - flapCellNumber(b, columnIndex);
-                        break;
-                    case 'port':
-                        result = comparePort(aVal, bVal);
-                        break;
-                    case 'flap-status':
-                        result = compareFlapStatus(aVal, bVal);
-                        break;
-                    case 'string':
-                    default:
-                        result = aVal.localeCompare(bVal, undefined, { numeric: true, sensitivity: 'base' });
-                        break;
+        const flapTextCollator = new Intl.Collator(undefined, { numeric: true, sensitivity: 'base' });
+        const flapPortCollator = new Intl.Collator(undefined, { numeric: true });
+        const FLAP_STATUS_PRIORITY = { 'CRITICAL': 0, 'WARNING': 1, 'OK': 2 };
+
+        // Number and status keys come from the generated markup and are cached
+        // per row and column. Text keys are read on every sort because
+        // p2p-alias.js may rewrite device and port names after load.
+        function flapSortKey(row, columnIndex, type) {
+            if (type === 'number' || type === 'flap-status') {
+                const cache = row._flapSortKeys || (row._flapSortKeys = {});
+                if (!(columnIndex in cache)) {
+                    cache[columnIndex] = type === 'number'
+                        ? flapCellNumber(row, columnIndex)
+                        : flapStatusPriority(row.cells[columnIndex]);
                 }
-
-                return direction === 'desc' ? -result : result;
-            });
-
-            // Re-append only the sorted data rows (detail rows already removed).
-            rows.forEach(row => tbody.appendChild(row));
+                return cache[columnIndex];
+            }
+            const text = row.cells[columnIndex].textContent.trim();
+            return type === 'port' ? portSortKey(text) : text;
         }
 
         function flapCellNumber(row, columnIndex) {
             const cell = row.cells[columnIndex];
             if (!cell) return 0;
+            // Sort on the numeric data-value (em-dash cells expose 0) instead
+            // of scraping the rendered "—" glyph.
             const raw = cell.dataset.value != null ? cell.dataset.value : cell.textContent;
             const value = parseFloat(raw);
             return Number.isFinite(value) ? value : 0;
         }
-        
-        function comparePort(a, b) {
-            if (a === 'N/A') return 1;
-            if (b === 'N/A') return -1;
-            
-            // Handle port sorting (swp1, swp10, swp1s0, etc.)
-            const extractPortNumber = (port) => {
-                const match = port.match(/swp(\\d+)(?:s(\\d+))?/);
-                if (match) {
-                    const mainPort = parseInt(match[1]);
-                    const subPort = match[2] ? parseInt(match[2]) : 0;
-                    return mainPort * 1000 + subPort;
-                }
-                return port.localeCompare(b, undefined, { numeric: true });
-            };
-            
-            return extractPortNumber(a) - extractPortNumber(b);
+
+        function flapStatusPriority(cell) {
+            const status = cell.querySelector('span')?.textContent || cell.textContent.trim();
+            return Object.prototype.hasOwnProperty.call(FLAP_STATUS_PRIORITY, status) ? FLAP_STATUS_PRIORITY[status] : 99;
         }
-        
-        function compareFlapStatus(a, b) {
-            const priority = {
-                'CRITICAL': 0,
-                'WARNING': 1,
-                'OK': 2
-            };
-            
-            const aPriority = Object.prototype.hasOwnProperty.call(priority, a) ? priority[a] : 99;
-            const bPriority = Object.prototype.hasOwnProperty.call(priority, b) ? priority[b] : 99;
-            return aPriority - bPriority;
+
+        // Ports sort as [group, value]: other names first (numeric-aware text),
+        // then swpN/swpNsM by number, then N/A last.
+        function portSortKey(port) {
+            if (port === 'N/A') return [2, 0];
+            const match = port.match(/swp(\\d+)(?:s(\\d+))?/);
+            if (match) {
+                const mainPort = parseInt(match[1]);
+                const subPort = match[2] ? parseInt(match[2]) : 0;
+                return [1, mainPort * 1000 + subPort];
+            }
+            return [0, port];
+        }
+
+        function comparePortKeys(a, b) {
+            if (a[0] !== b[0]) return a[0] - b[0];
+            return a[0] === 0 ? flapPortCollator.compare(a[1], b[1]) : a[1] - b[1];
         }
 
         // Run Analysis Function
@@ -1615,7 +1691,8 @@ class LinkFlapAnalyzer:
                     'Total'
                 ];
                 
-                // Get table data (only visible data rows)
+                // Get table data (only visible data rows; the scope selector
+                // hides rows inline, the table filter through #flap-row-filter)
                 const table = document.getElementById('flap-table');
                 const tbody = table.querySelector('tbody');
                 const rows = tbody.querySelectorAll('tr.flap-row');
@@ -1624,7 +1701,7 @@ class LinkFlapAnalyzer:
                 // annotate exactly how many rows the export contains.
                 const dataLines = [];
                 rows.forEach(row => {
-                    if (row.style.display === 'none') return;
+                    if (row.style.display === 'none' || !rowMatchesFilter(row)) return;
                     const cells = row.querySelectorAll('td');
                     if (cells.length < 10) return;
                     const rowData = [
@@ -209,11 +209,15 @@ def parse_lldp_report(
     current_device: Optional[str] = None
     rows: list[LLDPRow] = []
     for line_number, line in lines[1:]:
-        device_match = _DEVICE_HEADER_RE.fullmatch(line)
-        if device_match:
-            current_device = device_match.group(1)
-            continue
-        if _SEPARATOR_RE.fullmatch(line):
+        # Device headers and separators are the only lines opening with '='
+        # or '-', so port rows never pay for either regex.
+        lead = line[0]
+        if lead == "=":
+            device_match = _DEVICE_HEADER_RE.fullmatch(line)
+            if device_match:
+                current_device = device_match.group(1)
+                continue
+        elif lead == "-" and _SEPARATOR_RE.fullmatch(line):
             continue
 
         parts = tuple(line.split())
@@ -204,8 +204,7 @@ def process_carrier_transition_files(data_dir="monitor-results/flap-data"):
     print(f"flap analysis report generated: {output_file}")
     
     # Generate summary for dashboard
-    summary = flap_analyzer.get_flap_summary()
-    anomalies = flap_analyzer.detect_flap_anomalies()
+    summary, anomalies = flap_analyzer.get_flap_report()
     
     print(f"\n Flap Detection Summary:")
     print(f"  Total ports monitored: {summary['total_ports']}")
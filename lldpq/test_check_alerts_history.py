@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Regression tests for the per-run history cache in check_alerts."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+
+@unittest.skipUnless(
+    importlib.util.find_spec("requests") is not None,
+    "check_alerts imports requests at module load",
+)
+class LoadHistoryCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        import check_alerts
+
+        self.checker = object.__new__(check_alerts.LLDPqAlerts)
+        self.checker._history_cache = {}
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        self.path = Path(temporary.name) / "ber_history.json"
+
+    def write(self, text: str, mtime_ns: int) -> None:
+        self.path.write_text(text, encoding="utf-8")
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_unchanged_file_is_served_from_cache(self):
+        self.write('{"current_ber_stats":{}}', 1_000_000_000)
+        first = self.checker._load_history(self.path)
+        self.assertIs(self.checker._load_history(self.path), first)
+
+    def test_rewritten_file_is_parsed_again(self):
+        self.write('{"a":1}', 1_000_000_000)
+        first = self.checker._load_history(self.path)
+        # Same size, newer mtime: the identity changes, so the file is re-read.
+        self.write('{"a":2}', 2_000_000_000)
+        second = self.checker._load_history(self.path)
+        self.assertIsNot(second, first)
+        self.assertEqual(second, {"a": 2})
+
+    def test_decode_errors_propagate_and_are_not_cached(self):
+        self.write('{"a":', 1_000_000_000)
+        with self.assertRaises(ValueError):
+            self.checker._load_history(self.path)
+        self.assertNotIn(self.path, self.checker._history_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
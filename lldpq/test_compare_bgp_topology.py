@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Regression tests for the BGP vs topology.dot comparison report parsers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import compare_bgp_topology as compare
+
+
+TOPOLOGY_DOT = """\
+/*
+ *   "lsw-1aa-9-9":"swp1" -- "ssw-1aa-9-9":"swp1"
+ */
+graph G {
+    # "lsw-1aa-1-9":"swp1" -- "ssw-1aa-1-9":"swp1"
+    "lsw-1aa-1-1":"swp1" -- "ssw-1aa-1-1":"swp2"
+    "dgx-01":"enp1s0" -- "lsw-1aa-1-1":"swp3"
+    "csw-1aa-1-1":"swp9" -- "ssw-1aa-1-1":"swp10" [color="red"]
+}
+"""
+
+
+BGP_REPORT_CSV = """\
+Device,VRF,Address Family,Neighbor,Interface,State
+lsw-1aa-1-1,default,ipv4,ssw-1aa-1-1(swp1),swp1,Established
+ssw-1aa-1-1,default,ipv4,lsw-1aa-1-1(swp1),swp1,Established
+lsw-1aa-1-1,default,ipv4,swp2,swp2,Idle
+lsw-1aa-1-1,default,ipv4,cfw-1aa-1-1,swp3,Idle
+lsw-1aa-1-2,default,ipv4,10.0.0.1,swp4,Active
+"""
+
+
+class ParseBgpReportTests(unittest.TestCase):
+    def test_header_columns_drive_state_classification(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root) / "bgp_report.csv"
+            path.write_text(BGP_REPORT_CSV, encoding="utf-8")
+            devices, links, idle, active, neighbors = compare.parse_bgp_report(
+                str(path)
+            )
+
+        self.assertEqual(devices, {"lsw-1aa-1-1", "ssw-1aa-1-1", "lsw-1aa-1-2"})
+        self.assertEqual(links, {("lsw-1aa-1-1", "ssw-1aa-1-1")})
+        self.assertEqual(idle, [("lsw-1aa-1-1", "swp2")])
+        self.assertEqual(active, [("lsw-1aa-1-2", "10.0.0.1")])
+        self.assertEqual(neighbors["lsw-1aa-1-1"], {"ssw-1aa-1-1"})
+        self.assertEqual(neighbors["ssw-1aa-1-1"], {"lsw-1aa-1-1"})
+
+
+class ParseTopologyDotTests(unittest.TestCase):
+    def parse(self, text: str):
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root) / "topology.dot"
+            path.write_text(text, encoding="utf-8")
+            return compare.parse_topology_dot(str(path))
+
+    def test_edges_are_parsed_and_server_links_skipped(self):
+        devices, links, device_ports = self.parse(TOPOLOGY_DOT)
+
+        self.assertEqual(devices, {"lsw-1aa-1-1", "ssw-1aa-1-1", "csw-1aa-1-1"})
+        self.assertEqual(links, {
+            ("lsw-1aa-1-1", "ssw-1aa-1-1"),
+            ("csw-1aa-1-1", "ssw-1aa-1-1"),
+        })
+        self.assertEqual(device_ports, {
+            "lsw-1aa-1-1:swp1",
+            "ssw-1aa-1-1:swp2",
+            "csw-1aa-1-1:swp9",
+            "ssw-1aa-1-1:swp10",
+        })
+
+    def test_lines_without_four_quoted_tokens_are_ignored(self):
+        devices, links, device_ports = self.parse('"lsw-1aa-1-1" -- "ssw-1aa-1-1"\n')
+
+        self.assertEqual((devices, links, device_ports), (set(), set(), set()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Regression tests for the topology generators."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import re
+import sys
+import tempfile
+import unittest
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import generate_topology as topology
+import generate_topology_full as topology_full
+
+
+LLDP_RESULT = """\
+=========================================leaf-01=========================================
+
+-------------------------------------------------------------------------------
+LLDP neighbors:
+-------------------------------------------------------------------------------
+Interface:    swp1, via: LLDP, RID: 1, Time: 0 day, 00:10:00
+  Chassis:
+    SysName:      spine-01
+  Port:
+    PortID:       ifname swp7
+-------------------------------------------------------------------------------
+
+===PORT_STATUS_START===
+swp1 UP
+swp2 DOWN
+not a status line
+===PORT_STATUS_END===
+
+===PORT_SPEED_START===
+swp1 400000
+swp2 fast
+===PORT_SPEED_END===
+"""
+
+UNAVAILABLE_RESULT = """\
+=========================================leaf-02=========================================
+
+__LLDPQ_LLDP_UNAVAILABLE__
+===PORT_STATUS_START===
+===PORT_STATUS_END===
+"""
+
+
+class ParseLldpFileTests(unittest.TestCase):
+    def setUp(self):
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        self.root = Path(temporary.name)
+        (self.root / "leaf-01_lldp_result.ini").write_text(LLDP_RESULT, encoding="utf-8")
+        (self.root / "leaf-02_lldp_result.ini").write_text(
+            UNAVAILABLE_RESULT, encoding="utf-8"
+        )
+        (self.root / "lldp_results.ini").write_text("aggregate\n", encoding="utf-8")
+
+    def test_one_read_yields_content_status_speed_and_availability(self):
+        for module in (topology, topology_full):
+            with self.subTest(module=module.__name__):
+                data, status, speed, available = module.parse_lldp_file(
+                    str(self.root / "leaf-01_lldp_result.ini")
+                )
+
+                self.assertEqual(data, LLDP_RESULT)
+                self.assertEqual(status, {"swp1": "UP", "swp2": "DOWN"})
+                self.assertEqual(speed, {"swp1": 400000})
+                self.assertTrue(available)
+
+    def test_placeholder_and_missing_files_are_not_available(self):
+        _, status, _, available = topology.parse_lldp_file(
+            str(self.root / "leaf-02_lldp_result.ini")
+        )
+        self.assertEqual(status, {})
+        self.assertFalse(available)
+
+        self.assertEqual(
+            topology.parse_lldp_file(str(self.root / "absent_lldp_result.ini")),
+            (None, {}, {}, False),
+        )
+
+    def test_fleet_parse_preserves_input_order(self):
+        paths = [
+            str(self.root / "leaf-02_lldp_result.ini"),
+            str(self.root / "leaf-01_lldp_result.ini"),
+        ] * 3
+
+        self.assertEqual(
+            topology.parse_lldp_files(paths),
+            [topology.parse_lldp_file(path) for path in paths],
+        )
+
+    def test_only_per_device_captures_are_listed(self):
+        listed = sorted(topology.list_lldp_result_files(str(self.root)))
+
+        self.assertEqual(
+            [name for name, _ in listed], ["leaf-01", "leaf-02"]
+        )
+        self.assertEqual(
+            listed[0][1], str(self.root / "leaf-01_lldp_result.ini")
+        )
+
+
+class CategorizeDeviceTests(unittest.TestCase):
+    def test_invalid_patterns_keep_their_fallbacks(self):
+        config = topology._compile_rule_patterns({
+            "device_categories": [
+                {"pattern": "le(af", "layer": 4, "icon": "switch"},
+                {"pattern": "^spine-", "layer": 3, "icon": "switch"},
+            ],
+            "special_rules": [
+                {"pattern": "[LF", "type": "even_odd_suffix",
+                 "even_layer": 8, "odd_layer": 7, "icon": "switch"},
+                {"pattern": "LF", "type": "even_odd_suffix",
+                 "even_layer": 8, "odd_layer": 7, "icon": "switch"},
+            ],
+            "default": {"layer": 9, "icon": "server"},
+        })
+
+        self.assertEqual(topology.categorize_device("le(af-1", config), (4, "switch"))
+        self.assertEqual(topology.categorize_device("Spine-01", config), (3, "switch"))
+        self.assertEqual(topology.categorize_device("lf-12", config), (8, "switch"))
+        self.assertEqual(topology.categorize_device("host-1", config), (9, "server"))
+
+
+class ApplyHostPatternsTests(unittest.TestCase):
+    def test_combined_match_agrees_with_per_pattern_match(self):
+        patterns = [
+            re.compile(f"^{entry.replace('*', '.*')}$", re.IGNORECASE)
+            for entry in ("*dgx*", "prod-cfw*", "a|b*")
+        ]
+        hosts = ["DGX-01", "prod-cfw-1", "abc", "bzz", "cfw-prod", "zzb"]
+
+        self.assertEqual(
+            topology.apply_host_patterns(patterns, hosts),
+            {host for host in hosts if any(p.match(host) for p in patterns)},
+        )
+        self.assertEqual(topology.apply_host_patterns([], hosts), set())
+
+    def test_mixed_flags_fall_back_to_per_pattern_match(self):
+        patterns = [re.compile("^dgx.*$", re.IGNORECASE), re.compile("^cfw.*$")]
+
+        self.assertEqual(
+            topology_full.apply_host_patterns(patterns, ["DGX-1", "CFW-1", "cfw-2"]),
+            {"DGX-1", "cfw-2"},
+        )
+
+
+class AppendCreationTimeTests(unittest.TestCase):
+    def test_button_replaced_before_last_body_close(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root) / "topology.html"
+            path.write_text(
+                "<html><body><pre></body></pre>\n"
+                '    <button onclick="time()">Created on 2024-01-02 03-04</button>\n'
+                "</BODY></html>\n",
+                encoding="utf-8",
+            )
+            topology.append_creation_time_to_html(str(path))
+            content = path.read_text(encoding="utf-8")
+
+        self.assertEqual(content.count("Created on"), 1)
+        self.assertNotIn("2024-01-02 03-04", content)
+        self.assertRegex(content, r"</pre>\n        <button[^>]*>Created on [^<]+</button>\n</BODY>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Regression tests for the raw hardware-file parsers."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import generate_hardware_html as hardware
+
+
+HARDWARE_SAMPLE = """\
+=== HARDWARE HEALTH ===
+CPU ACPI temp:   +45.0°C
+Core 0:          +51.0°C
+Ambient ASIC Temp: +60.5°C
+PSU-1(L) 220V Rail Pwr (in): 300.0 W
+PSU-1(L) 54V Rail Pwr (out): 270.0 W
+Chassis Fan Drawer-1 Tach 1: 9266 RPM
+PSU-1(L) Fan 1: 9632 RPM
+Mem:            16Gi       4Gi       9Gi     286Mi     2.1Gi      12Gi
+CPU_INFO:
+__LLDPQ_HARDWARE_SOURCE_STATUS__:CPU_LOAD:OK
+1.28 0.68 0.43 1/234 5678
+CPU_CORES: 4
+__LLDPQ_HARDWARE_SOURCE_STATUS__:SENSORS:UNAVAILABLE
+"""
+
+
+class ParseAllFromHardwareFileTests(unittest.TestCase):
+    def setUp(self):
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        previous_cwd = os.getcwd()
+        self.addCleanup(os.chdir, previous_cwd)
+        os.chdir(temporary.name)
+        data_dir = Path("monitor-results/hardware-data")
+        data_dir.mkdir(parents=True)
+        (data_dir / "leaf1_hardware.txt").write_text(
+            HARDWARE_SAMPLE, encoding="utf-8"
+        )
+
+    def test_combined_parse_matches_individual_parsers(self):
+        parsed = hardware.parse_all_from_hardware_file("leaf1")
+
+        self.assertEqual(
+            (parsed["cpu_temp"], parsed["asic_temp"]),
+            hardware.parse_temperature_from_hardware_file("leaf1"),
+        )
+        self.assertEqual(
+            parsed["resources"],
+            hardware.parse_resources_from_hardware_file("leaf1"),
+        )
+        self.assertEqual(
+            parsed["psu_efficiency"],
+            hardware.parse_psu_efficiency_from_hardware_file("leaf1"),
+        )
+        self.assertEqual(
+            (parsed["psu_in_w"], parsed["psu_out_w"]),
+            hardware.parse_psu_power_in_out_from_hardware_file("leaf1"),
+        )
+        self.assertEqual(
+            parsed["fans"], hardware.parse_fans_from_hardware_file("leaf1")
+        )
+        self.assertEqual(
+            parsed["missing_markers"],
+            hardware.hardware_missing_telemetry_markers("leaf1"),
+        )
+
+        self.assertEqual((parsed["cpu_temp"], parsed["asic_temp"]), (51.0, 60.5))
+        self.assertEqual(parsed["resources"]["cpu_load"], 0.68)
+        self.assertEqual(parsed["resources"]["cpu_cores"], 4)
+        self.assertAlmostEqual(parsed["psu_efficiency"], 90.0)
+        self.assertEqual(len(parsed["fans"]), 2)
+        self.assertEqual(parsed["missing_markers"], {"sensors"})
+
+    def test_fleet_parse_is_keyed_by_device(self):
+        parsed = hardware.parse_all_hardware_files(["leaf1", "absent"])
+
+        self.assertEqual(
+            parsed["leaf1"], hardware.parse_all_from_hardware_file("leaf1")
+        )
+        self.assertEqual(parsed["absent"]["missing_markers"], {"hardware_file"})
+
+    def test_unchanged_file_is_served_from_cache_until_rewritten(self):
+        path = Path("monitor-results/hardware-data/leaf1_hardware.txt")
+        first = hardware.parse_all_from_hardware_file("leaf1")
+        self.assertIs(hardware.parse_all_from_hardware_file("leaf1"), first)
+
+        path.write_text("HW_MGMT_CPU: 99\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(hardware.parse_all_from_hardware_file("leaf1")["cpu_temp"], 99.0)
+
+    def test_consecutive_indented_sensor_rows_are_all_read(self):
+        content = (
+            "  Asic-Temp-Sensor   71.0\n"
+            "  Asic-Temp-Sensor   72.0\n"
+            "  CPU-Core-Sensor-0  45.0\n"
+            "  CPU-Core-Sensor-1  47.5\n"
+        )
+
+        self.assertEqual(
+            hardware._temperatures_from_content(content, "leaf1"), (47.5, 72.0)
+        )
+
+    def test_missing_file_reports_defaults(self):
+        parsed = hardware.parse_all_from_hardware_file("absent")
+
+        self.assertIsNone(parsed["cpu_temp"])
+        self.assertEqual(parsed["resources"], {})
+        self.assertEqual(parsed["fans"], {})
+        self.assertEqual((parsed["psu_in_w"], parsed["psu_out_w"]), (None, None))
+        self.assertEqual(parsed["missing_markers"], {"hardware_file"})
+
+
+if __name__ == "__main__":
+    unittest.main()
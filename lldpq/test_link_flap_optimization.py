@@ -96,6 +96,71 @@ class LinkFlapOptimizationTests(unittest.TestCase):
                     )
             self.assertEqual(path.read_text(encoding="utf-8"), '{"old":true}\n')
 
+    def test_non_string_keys_and_wide_integers_are_written_exactly(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root) / "flap_history.json"
+            LinkFlapAnalyzer._atomic_json_write(str(path), {1: "swp1", "big": 2**70 + 1})
+
+            self.assertEqual(
+                path.read_text(encoding="utf-8"),
+                '{"1":"swp1","big":1180591620717411303425}\n',
+            )
+
+    def test_non_finite_floats_round_trip(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root) / "flap_history.json"
+            event = [1.0, 2, 1, float("inf"), float("nan")]
+            LinkFlapAnalyzer._atomic_json_write(str(path), {"leaf:swp1": [event]})
+
+            self.assertEqual(
+                path.read_text(encoding="utf-8"),
+                '{"leaf:swp1":[[1.0,2,1,Infinity,NaN]]}\n',
+            )
+            reloaded = json.loads(path.read_text(encoding="utf-8"))["leaf:swp1"][0]
+            self.assertEqual(float(reloaded[3]), float("inf"))
+
+    def test_flapping_rate_files_events_into_nested_windows(self):
+        now = 2_000_000.0
+        with tempfile.TemporaryDirectory() as root:
+            analyzer = self.analyzer(root)
+            analyzer.flapping_hist["leaf:swp1"] = collections.deque([
+                (now - 10, 20, 1, now - 30, 20.0),      # fits exactly in 30s
+                (now - 100, 30, 2, now - 700, 600.0),   # ten-minute poll: 1h+
+                (now - 3600, 40, 4, now - 3600, 0.0),   # exactly one hour old
+                (now - 60, 50, 8),                      # legacy: 1h+ only
+                (now - 50000, 60, 16),                  # legacy: 24h only
+                (now - 90000, 70, 32),                  # older than every window
+                (now - 5, 80),                          # malformed, ignored
+            ], maxlen=1000)
+            with mock.patch("link_flap_analyzer.time.time", return_value=now):
+                counters = analyzer.calculate_flapping_rate("leaf:swp1")
+
+        self.assertEqual(counters, {
+            "flap_30_sec": 1,
+            "flap_1_min": 1,
+            "flap_5_min": 1,
+            "flap_1_hr": 15,
+            "flap_12_hrs": 15,
+            "flap_24_hrs": 31,
+        })
+
+    def test_quiet_and_empty_ports_report_zero_counters(self):
+        now = 2_000_000.0
+        with tempfile.TemporaryDirectory() as root:
+            analyzer = self.analyzer(root)
+            analyzer.flapping_hist["leaf:swp1"] = collections.deque([
+                (now - 100000, 10, 3, now - 100600, 600.0),
+                (now - 90000, 12, 1),
+            ], maxlen=1000)
+            with mock.patch("link_flap_analyzer.time.time", return_value=now):
+                quiet = analyzer.calculate_flapping_rate("leaf:swp1")
+                empty = analyzer.calculate_flapping_rate("leaf:swp9")
+
+        self.assertEqual(quiet, empty)
+        self.assertEqual(set(quiet.values()), {0})
+        self.assertEqual(len(quiet), 6)
+        self.assertIsNot(quiet, empty)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import argparse
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 import re
 import sys
@@ -25,6 +26,12 @@ from typing import Iterable, Iterator, Optional, Sequence
 
 _KNOWN_HOST_SUFFIXES = (".cm.cluster", ".localdomain", ".local")
 _LLDP_SEPARATOR_RE = re.compile(r"(?m)^-{20,}\s*$")
+# Per-section lldpctl fields, compiled once for every section of every capture.
+_LLDP_INTERFACE_RE = re.compile(r"Interface:\s*([^\s,]+)", re.IGNORECASE)
+_LLDP_SYSNAME_RE = re.compile(r"SysName:\s*([^\r\n]+)", re.IGNORECASE)
+_LLDP_PORT_ID_RE = re.compile(r"PortID:\s+(?:ifname|ifalias)\s+(\S+)", re.IGNORECASE)
+_LLDP_PORT_DESCR_RE = re.compile(r"PortDescr:\s*([^\r\n]+)", re.IGNORECASE)
+_PORT_DESCR_AS_RE = re.compile(r"\bas\s+(\S+)", re.IGNORECASE)
 
 
 class TopologyError(ValueError):
@@ -73,6 +80,7 @@ class _Token:
     quoted: bool = False
 
 
+@lru_cache(maxsize=65536)
 def normalize_hostname(name: Optional[str]) -> str:
     """Normalize harmless LLDP hostname decoration while preserving spelling."""
     value = str(name or "").strip().rstrip(".")
@@ -153,8 +161,17 @@ class DeviceNameResolver:
         self._unique_aliases = {
             alias: next(iter(keys)) for alias, keys in aliases.items() if len(keys) == 1
         }
+        # The known names are fixed after construction, so every lookup can be
+        # memoized; generators key the same few names once per link endpoint.
+        self._key_cache: dict[Optional[str], str] = {}
 
     def key(self, name: Optional[str]) -> str:
+        cached = self._key_cache.get(name)
+        if cached is None:
+            cached = self._key_cache[name] = self._resolve_key(name)
+        return cached
+
+    def _resolve_key(self, name: Optional[str]) -> str:
         raw = str(name or "").strip().rstrip(".")
         if not raw:
             return ""
@@ -208,16 +225,28 @@ def is_eth0(port: Optional[str]) -> bool:
     return normalize_port_name(port).casefold() == "eth0"
 
 
-def _strip_device_prefix(port: str, known_device_names: Iterable[str]) -> str:
-    best = ""
-    folded_port = port.casefold()
+@lru_cache(maxsize=4096)
+def _device_prefixes(known_device_names: tuple) -> tuple[tuple[str, int], ...]:
+    """Return ``(folded "<device>-", length)`` pairs, longest prefix first."""
+    prefixes = set()
     for raw_name in known_device_names:
         name = str(raw_name or "").strip().rstrip(".")
         for candidate in (name, normalize_hostname(name)):
-            prefix = candidate + "-"
-            if candidate and folded_port.startswith(prefix.casefold()) and len(prefix) > len(best):
-                best = prefix
-    return port[len(best) :] if best else port
+            if candidate:
+                prefix = candidate + "-"
+                prefixes.add((prefix.casefold(), len(prefix)))
+    return tuple(sorted(prefixes, key=lambda item: item[1], reverse=True))
+
+
+def _strip_device_prefix(port: str, known_device_names: Iterable[str]) -> str:
+    # Every prefix ends in "-", so a port without one cannot carry a device name.
+    if "-" not in port:
+        return port
+    folded_port = port.casefold()
+    for folded_prefix, length in _device_prefixes(tuple(known_device_names)):
+        if folded_port.startswith(folded_prefix):
+            return port[length:]
+    return port
 
 
 def normalize_advertised_port(
@@ -229,7 +258,7 @@ def normalize_advertised_port(
     candidate = normalize_port_name(port_id)
     if not candidate:
         description = str(port_description or "").strip()
-        as_match = re.search(r"\bas\s+(\S+)", description, re.IGNORECASE)
+        as_match = _PORT_DESCR_AS_RE.search(description)
         if as_match:
             candidate = normalize_port_name(as_match.group(1))
         elif description and not any(char.isspace() for char in description):
@@ -254,16 +283,12 @@ def iter_lldp_neighbors(
     if resolver is None:
         resolver = DeviceNameResolver(known_names)
     for section in _LLDP_SEPARATOR_RE.split(content):
-        interface_match = re.search(r"Interface:\s*([^\s,]+)", section, re.IGNORECASE)
+        interface_match = _LLDP_INTERFACE_RE.search(section)
         if not interface_match:
             continue
-        sys_name_match = re.search(r"SysName:\s*([^\r\n]+)", section, re.IGNORECASE)
-        port_id_match = re.search(
-            r"PortID:\s+(?:ifname|ifalias)\s+(\S+)", section, re.IGNORECASE
-        )
-        port_description_match = re.search(
-            r"PortDescr:\s*([^\r\n]+)", section, re.IGNORECASE
-        )
+        sys_name_match = _LLDP_SYSNAME_RE.search(section)
+        port_id_match = _LLDP_PORT_ID_RE.search(section)
+        port_description_match = _LLDP_PORT_DESCR_RE.search(section)
         raw_device = sys_name_match.group(1).strip() if sys_name_match else ""
         # devices.yaml and the aggregate schema both require one hostname token.
         # Preserve the neighbor as Unknown in validation, but never serialize a